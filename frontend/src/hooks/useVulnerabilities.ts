@@ -1,6 +1,8 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { get, post } from '../lib/api';
 import type {
+  FetchNowResponse,
+  FetchStatusResponse,
   Vulnerability,
   VulnerabilityListResponse,
 } from '../types';
@@ -46,7 +48,20 @@ export function useFetchNow() {
   const queryClient = useQueryClient();
 
   return useMutation({
-    mutationFn: () => post<{ success: boolean; fetched: number; errors: number }>('/api/fetch-now'),
+    mutationFn: async () => {
+      // 取得はバックグラウンドで実行されるため、完了までステータスをポーリング
+      const job = await post<FetchNowResponse>('/api/fetch-now');
+      let status: FetchStatusResponse;
+      do {
+        await new Promise((resolve) => setTimeout(resolve, 2000));
+        status = await get<FetchStatusResponse>(job.status_url);
+      } while (status.status === 'running');
+
+      if (status.status === 'failed') {
+        throw new Error(status.message);
+      }
+      return status;
+    },
     onSuccess: () => {
       // キャッシュを無効化して再取得
       queryClient.invalidateQueries({ queryKey: ['vulnerabilities'] });
@@ -87,7 +87,7 @@ export function VulnerabilityListPage() {
           <div className="bg-green/20 border border-green/30 rounded-lg p-4">
             <p className="text-green text-sm">
               ✓ 取得完了: {fetchNowMutation.data?.fetched || 0}件の脆弱性を取得しました
-              {fetchNowMutation.data?.errors ? ` (エラー: ${fetchNowMutation.data.errors}件)` : ''}
+              {fetchNowMutation.data?.failed ? ` (エラー: ${fetchNowMutation.data.failed}件)` : ''}
             </p>
           </div>
         )}
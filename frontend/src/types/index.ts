@@ -26,6 +26,23 @@ export interface VulnerabilityListResponse {
   items: Vulnerability[];
 }
 
+export interface FetchNowResponse {
+  job_id: string;
+  status: string;
+  status_url: string;
+}
+
+export interface FetchStatusResponse {
+  job_id: string;
+  status: 'running' | 'completed' | 'failed';
+  message: string;
+  fetched: number;
+  inserted: number;
+  updated: number;
+  failed: number;
+  elapsed_seconds: number;
+}
+
 // ========================================
 // 資産関連の型定義
 // ========================================
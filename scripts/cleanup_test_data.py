@@ -19,6 +19,9 @@ load_dotenv(env_path, override=True)
 from sqlalchemy import create_engine, text
 import logging
 
+from src.models.dashboard_views import ASSET_VIEWS, VULNERABILITY_VIEWS, refresh_materialized_views
+from src.models.vulnerability import ADOPT_LEGACY_TITLE_TRGM_INDEX, Vulnerability
+
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +30,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def ensure_title_trgm_index(conn):
+    """タイトルの部分一致検索用に、モデル定義のpg_trgm GINインデックス（ix_vuln_title_trgm）を作成（作成済みなら何もしない）"""
+    logger.info("タイトル検索用インデックスを確認中...")
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    # 旧バージョンが作成した同一定義のインデックスはモデルの名前に統一する
+    conn.execute(ADOPT_LEGACY_TITLE_TRGM_INDEX)
+    title_trgm_index = next(index for index in Vulnerability.__table__.indexes if index.name == "ix_vuln_title_trgm")
+    title_trgm_index.create(conn, checkfirst=True)
+    conn.commit()
+
+
 def delete_test_data():
     """テストデータを削除"""
     # Neonの接続文字列
@@ -38,43 +52,58 @@ def delete_test_data():
 
     try:
         # Neonエンジン作成
-        engine = create_engine(neon_db_url)
+        # 接続は同時に1本しか使わないため、プールは1本に制限する
+        # Neonはアイドル接続を切断するため、pre_pingとrecycleで古い接続を再利用しない
+        engine = create_engine(
+            neon_db_url,
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=True,
+            pool_recycle=300,
+        )
 
         with engine.connect() as conn:
-            # テストレコード確認
-            logger.info("テストレコードを検索中...")
+            # ILIKE '%test%' をインデックススキャンにするためのトライグラムインデックス
+            ensure_title_trgm_index(conn)
 
-            # パターン1: タイトルに "Test" を含む
+            # テストレコード確認（表示用に最大11件だけ取得）
+            logger.info("テストレコードを検索中...")
             result = conn.execute(text("""
                 SELECT cve_id, title, published_date
                 FROM vulnerabilities
-                WHERE title LIKE '%Test%' OR title LIKE '%test%'
+                WHERE title ILIKE '%test%'
                 ORDER BY published_date DESC
+                LIMIT 11
             """))
-            test_records = result.fetchall()
+            preview_records = result.fetchall()
 
-            if len(test_records) == 0:
+            if len(preview_records) == 0:
                 logger.info("✅ テストレコードは見つかりませんでした")
                 return
 
-            logger.info(f"削除対象: {len(test_records)}件のテストレコード")
             logger.info("--- 削除対象レコード ---")
-            for record in test_records[:10]:  # 最初の10件を表示
+            for record in preview_records[:10]:  # 最初の10件を表示
                 logger.info(f"  - {record[0]}: {record[1]} (公開日: {record[2]})")
 
-            if len(test_records) > 10:
-                logger.info(f"  ... 他 {len(test_records) - 10}件")
+            if len(preview_records) > 10:
+                logger.info("  ... 他にも削除対象があります")
 
-            # 削除実行
+            # 削除実行（件数はrowcountから取得し、行データは転送しない）
             logger.info("テストレコードを削除中...")
             result = conn.execute(text("""
                 DELETE FROM vulnerabilities
-                WHERE title LIKE '%Test%' OR title LIKE '%test%'
+                WHERE title ILIKE '%test%'
             """))
             deleted_count = result.rowcount
             conn.commit()
             logger.info(f"✅ 削除完了: {deleted_count}件")
 
+            # 削除した脆弱性（CASCADEで消えたマッチング結果を含む）をダッシュボード用ビューから除く
+            # （リフレッシュ時刻も記録されるため、ダッシュボードのETagも更新される）
+            refresh_materialized_views(conn, tuple(dict.fromkeys(VULNERABILITY_VIEWS + ASSET_VIEWS)))
+            conn.commit()
+            logger.info("✅ ダッシュボード用ビューを更新しました")
+
         # 最終確認
         with engine.connect() as conn:
             result = conn.execute(text("SELECT COUNT(*) FROM vulnerabilities"))
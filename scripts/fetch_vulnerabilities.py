@@ -6,16 +6,16 @@ This script fetches vulnerability data from JVN iPedia API and stores it in the
 It supports both full fetch and differential fetch modes.
 
 Usage:
-    # Full fetch (fetch from last 3 years)
+    # Differential fetch (default: fetch only new/updated data since each source's last sync)
     python scripts/fetch_vulnerabilities.py
 
-    # Differential fetch (fetch only new/updated data)
-    python scripts/fetch_vulnerabilities.py --differential
+    # Full fetch (fetch from last 3 years)
+    python scripts/fetch_vulnerabilities.py --full
 
     # Fetch specific date range
     python scripts/fetch_vulnerabilities.py --start-date 2024-01-01 --end-date 2024-12-31
 
-    # Fetch all historical data
+    # Fetch all historical data (bulk-loaded with COPY)
     python scripts/fetch_vulnerabilities.py --all
 
 Exit codes:
@@ -29,22 +29,33 @@ import argparse
 import asyncio
 import logging
 import sys
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
 
 from sqlalchemy.exc import SQLAlchemyError
 
-# Add project root to Python path
-sys.path.insert(0, '/home/horii-kentaro/projects/zjs_project')
+# Add project root to Python path (skipped when already importable, e.g. PYTHONPATH in CI)
+project_root = str(Path(__file__).resolve().parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+from scripts.sync_cursors import Window, read_state, resolve_due_windows, write_state
 from src.config import settings
-from src.database import SessionLocal, check_db_connection
+from src.database import SessionLocal, check_db_connection, init_db
 from src.fetchers.jvn_fetcher import JVNAPIError, JVNFetcherService, JVNParseError
 from src.fetchers.nvd_fetcher import NVDAPIError, NVDFetcherService, NVDParseError
-from src.services.database_vulnerability_service import DatabaseVulnerabilityService
+from src.services.database_vulnerability_service import (
+    BULK_COPY_BATCH_SIZE,
+    UPSERT_BATCH_SIZE,
+    DatabaseVulnerabilityService,
+)
 
 logger = logging.getLogger(__name__)
 
+# Data source names used in log messages
+SOURCE_NAMES = {'jvn': 'JVN iPedia API', 'nvd': 'NVD API 2.0'}
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -61,7 +72,13 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         '--differential',
         action='store_true',
-        help='Fetch only new/updated data since last update (default: fetch last 3 years)',
+        help='Fetch only new/updated data since last sync (default behaviour, kept for compatibility)',
+    )
+
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help=f'Fetch the last {settings.FETCH_YEARS} years regardless of the sync state',
     )
 
     parser.add_argument(
@@ -111,13 +128,260 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def resolve_fetch_window(
+    start_date: Optional[str], end_date: Optional[str], differential: bool, run_now: datetime
+) -> Window:
+    """
+    Determine the date range of a fetch (one "now" per run, so every bound and cursor agrees).
+
+    Args:
+        start_date: Requested start date (ISO 8601: YYYY-MM-DD)
+        end_date: Requested end date (ISO 8601: YYYY-MM-DD)
+        differential: Whether this is a differential fetch (start dates come from the sync cursors)
+        run_now: Start time of the current run (UTC)
+
+    Returns:
+        Window: Start and end date (ISO 8601: YYYY-MM-DD)
+    """
+    today = run_now.strftime('%Y-%m-%d')
+
+    if differential:
+        # Fetch only new/updated data since each source's last sync
+        logger.info(f'Differential fetch mode: fetching data since last sync (as of {run_now.isoformat()})')
+        return start_date, today
+
+    if not start_date:
+        # Full fetch: last 3 years
+        logger.info(f'Full fetch mode: fetching last {settings.FETCH_YEARS} years')
+        return (run_now - timedelta(days=365 * settings.FETCH_YEARS)).strftime('%Y-%m-%d'), today
+
+    return start_date, end_date
+
+
+async def store_batch(
+    db_service: DatabaseVulnerabilityService,
+    db_lock: asyncio.Lock,
+    stats: dict,
+    source: str,
+    batch: list,
+    on_conflict: str,
+    write_mode: str,
+) -> None:
+    """Write one batch of vulnerabilities from a source and add the result to stats."""
+    async with db_lock:
+        db_stats = await asyncio.to_thread(
+            db_service.upsert_vulnerabilities_batch, batch, on_conflict=on_conflict, mode=write_mode
+        )
+    stats[f'{source}_fetched'] += len(batch)
+    stats['inserted'] += db_stats['inserted']
+    stats['updated'] += db_stats['updated']
+    stats['failed'] += db_stats['failed']
+    logger.info(
+        f'{source.upper()} batch stored: {len(batch)} total, inserted={db_stats["inserted"]}, '
+        f'updated={db_stats["updated"]}, failed={db_stats["failed"]}'
+    )
+
+
+async def store_pages(
+    db_service: DatabaseVulnerabilityService,
+    db_lock: asyncio.Lock,
+    stats: dict,
+    source: str,
+    pages: AsyncIterator[list],
+    on_conflict: str = 'update',
+    bulk: bool = False,
+) -> None:
+    """
+    Store pages from one API in batches while the download continues.
+
+    Pages from both APIs share one Session, so DB writes are serialized with db_lock.
+
+    Args:
+        db_service: Database vulnerability service
+        db_lock: Lock serializing writes to the shared Session
+        stats: Run statistics (updated in place)
+        source: Data source name ('jvn' or 'nvd')
+        pages: Pages of VulnerabilityCreate objects
+        on_conflict: 'update' (upsert) or 'do_nothing' (keep existing rows)
+        bulk: If True, load batches with COPY through a staging table (initial backfill)
+    """
+    # COPY-based bulk loading takes much larger batches than multi-row INSERT
+    write_mode = 'bulk' if bulk else 'upsert'
+    batch_size = BULK_COPY_BATCH_SIZE if bulk else UPSERT_BATCH_SIZE
+    buffer: list = []
+
+    async for page in pages:
+        buffer.extend(page)
+        if len(buffer) >= batch_size:
+            await store_batch(db_service, db_lock, stats, source, buffer, on_conflict, write_mode)
+            buffer = []
+
+    if buffer:
+        await store_batch(db_service, db_lock, stats, source, buffer, on_conflict, write_mode)
+
+
+def iter_nvd_pages(
+    nvd_fetcher: NVDFetcherService,
+    nvd_cursor: Optional[datetime],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    max_items: Optional[int],
+) -> AsyncIterator[list]:
+    """Pages of an NVD fetch: modified since nvd_cursor when set, otherwise the start_date..end_date window."""
+    if nvd_cursor is not None:
+        # lastModStartDate/lastModEndDate from the checkpoint to now (split into 120-day windows)
+        return nvd_fetcher.iter_since_last_update(nvd_cursor, max_items=max_items)
+
+    # Convert date format for NVD API (ISO 8601 with time)
+    return nvd_fetcher.iter_vulnerabilities(
+        start_date=f"{start_date}T00:00:00.000" if start_date else None,
+        end_date=f"{end_date}T23:59:59.999" if end_date else None,
+        max_items=max_items,
+    )
+
+
+async def run_fetchers(
+    db_service: DatabaseVulnerabilityService,
+    stats: dict,
+    jvn_window: Optional[Window],
+    nvd_window: Optional[Window],
+    nvd_cursor: Optional[datetime],
+    max_items: Optional[int],
+    bulk: bool,
+) -> Tuple[dict, Optional[datetime]]:
+    """
+    Fetch from JVN iPedia and NVD concurrently and store their pages.
+
+    JVN and NVD are independent hosts, so they run concurrently. Each fetcher keeps one
+    pooled HTTP client open for all of its requests.
+
+    Args:
+        db_service: Database vulnerability service
+        stats: Run statistics (updated in place)
+        jvn_window: JVN (start_date, end_date), or None to skip JVN iPedia
+        nvd_window: NVD (start_date, end_date), or None to skip NVD
+        nvd_cursor: NVD sync cursor for a differential fetch (replaces the nvd_window dates)
+        max_items: Maximum number of items to fetch per source (None = fetch all)
+        bulk: If True, load pages with COPY through a staging table
+
+    Returns:
+        Tuple[dict, Optional[datetime]]: Outcome per fetched source (None on success, otherwise
+        the exception) and the NVD server timestamp to use as the next NVD cursor
+    """
+    db_lock = asyncio.Lock()
+    tasks = {}
+
+    async with JVNFetcherService() as jvn_fetcher, NVDFetcherService() as nvd_fetcher:
+        if jvn_window is not None:
+            logger.info('Starting data fetch from JVN iPedia API...')
+            jvn_start_date, jvn_end_date = jvn_window
+            jvn_pages = jvn_fetcher.iter_vulnerabilities(
+                start_date=jvn_start_date, end_date=jvn_end_date, max_items=max_items
+            )
+            tasks['jvn'] = store_pages(db_service, db_lock, stats, 'jvn', jvn_pages, bulk=bulk)
+
+        if nvd_window is not None:
+            logger.info('Starting data fetch from NVD API 2.0...')
+            nvd_pages = iter_nvd_pages(nvd_fetcher, nvd_cursor, *nvd_window, max_items)
+            # CVE IDs already in the database are skipped by ON CONFLICT DO NOTHING
+            tasks['nvd'] = store_pages(
+                db_service, db_lock, stats, 'nvd', nvd_pages, on_conflict='do_nothing', bulk=bulk
+            )
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    return dict(zip(tasks, results)), nvd_fetcher.sync_cursor
+
+
+def record_source_result(
+    db_service: DatabaseVulnerabilityService,
+    state: dict,
+    stats: dict,
+    source: str,
+    result: Optional[BaseException],
+    synced_at: datetime,
+    advance_cursor: bool,
+    tolerated: tuple = (),
+) -> bool:
+    """
+    Log the outcome of one source's fetch and advance its sync cursor.
+
+    Args:
+        db_service: Database vulnerability service
+        state: Cached cursors (updated in place)
+        stats: Run statistics
+        source: Data source name ('jvn' or 'nvd')
+        result: None on success, otherwise the exception raised by the fetch
+        synced_at: New cursor value for the source
+        advance_cursor: Whether this run may advance the cursor
+        tolerated: Exception types logged instead of raised (the cursor is kept, so the next run retries)
+
+    Returns:
+        bool: True if the cursor was advanced (the state file needs writing)
+
+    Raises:
+        BaseException: The source's exception unless it is one of tolerated
+    """
+    if isinstance(result, tolerated):
+        # Pages stored before the error are kept
+        logger.error(f'{SOURCE_NAMES[source]} error (continuing with the other source): {result}')
+        return False
+    if isinstance(result, BaseException):
+        raise result
+
+    logger.info(f'Fetched {stats[f"{source}_fetched"]} vulnerabilities from {SOURCE_NAMES[source]}')
+    if not advance_cursor:
+        return False
+
+    db_service.set_sync_cursor(source, synced_at)
+    state[f'{source}_last_mod'] = synced_at.isoformat()
+    return True
+
+
+def record_results(
+    db_service: DatabaseVulnerabilityService,
+    state: dict,
+    stats: dict,
+    results: dict,
+    jvn_synced_at: datetime,
+    nvd_synced_at: datetime,
+    advance_cursor: bool,
+) -> bool:
+    """
+    Record the outcome of each fetched source (see record_source_result).
+
+    JVN errors are raised. NVD errors are logged and the run continues with the JVN data.
+
+    Returns:
+        bool: True if any cursor was advanced (the state file needs writing)
+    """
+    state_changed = False
+    if 'jvn' in results:
+        state_changed |= record_source_result(
+            db_service, state, stats, 'jvn', results['jvn'], jvn_synced_at, advance_cursor
+        )
+    if 'nvd' in results:
+        state_changed |= record_source_result(
+            db_service,
+            state,
+            stats,
+            'nvd',
+            results['nvd'],
+            nvd_synced_at,
+            advance_cursor,
+            tolerated=(NVDAPIError, NVDParseError),
+        )
+    return state_changed
+
+
 async def fetch_and_store(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     max_items: Optional[int] = None,
-    differential: bool = False,
+    differential: bool = True,
     nvd_only: bool = False,
     jvn_only: bool = False,
+    bulk: bool = False,
 ) -> dict:
     """
     Fetch vulnerabilities from JVN iPedia API and/or NVD API 2.0 and store in database.
@@ -126,9 +390,10 @@ async def fetch_and_store(
         start_date: Start date for fetching (ISO 8601: YYYY-MM-DD)
         end_date: End date for fetching (ISO 8601: YYYY-MM-DD)
         max_items: Maximum number of items to fetch (None = fetch all)
-        differential: If True, fetch only data updated since last database update
+        differential: If True, fetch only data updated since each source's last sync
         nvd_only: If True, fetch from NVD API only (skip JVN iPedia)
         jvn_only: If True, fetch from JVN iPedia API only (skip NVD)
+        bulk: If True, load pages with COPY through a staging table (initial backfill)
 
     Returns:
         dict: Statistics with keys 'fetched', 'inserted', 'updated', 'failed'
@@ -136,8 +401,6 @@ async def fetch_and_store(
     Raises:
         JVNAPIError: When JVN API request fails
         JVNParseError: When JVN XML parsing fails
-        NVDAPIError: When NVD API request fails
-        NVDParseError: When NVD JSON parsing fails
         SQLAlchemyError: When database operation fails
     """
     stats = {
@@ -152,128 +415,64 @@ async def fetch_and_store(
     }
 
     # Initialize services
-    fetcher = JVNFetcherService()
     db = SessionLocal()
+    state = read_state()
+    state_changed = False
 
     try:
         db_service = DatabaseVulnerabilityService(db)
 
-        # Determine date range
-        fetch_start_date = start_date
-        fetch_end_date = end_date
+        run_now = datetime.now(timezone.utc)
+        fetch_start_date, fetch_end_date = resolve_fetch_window(start_date, end_date, differential, run_now)
+
+        # The sync cursor only advances after a complete differential fetch: only then has
+        # everything modified since the previous cursor been fetched
+        advance_cursor = differential and max_items is None
+
+        # Each source tracks its own cursor in sync_state
+        jvn_window = None if nvd_only else (fetch_start_date, fetch_end_date)
+        nvd_window = None if jvn_only else (fetch_start_date, fetch_end_date)
+        nvd_cursor: Optional[datetime] = None
 
         if differential:
-            # Fetch only new/updated data since last update
-            logger.info('Differential fetch mode: fetching data since last update')
-            latest_date_str = db_service.get_latest_modified_date()
-
-            if latest_date_str:
-                latest_date = datetime.fromisoformat(latest_date_str)
-                fetch_start_date = latest_date.strftime('%Y-%m-%d')
-                logger.info(f'Last update date: {fetch_start_date}')
-            else:
-                # No data in database, fetch last 3 years
-                logger.warning('No data in database, falling back to last 3 years')
-                fetch_start_date = (datetime.now() - timedelta(days=365 * settings.FETCH_YEARS)).strftime(
-                    '%Y-%m-%d'
-                )
-
-            fetch_end_date = datetime.now().strftime('%Y-%m-%d')
-
-        elif not start_date:
-            # Default: fetch last 3 years
-            fetch_start_date = (datetime.now() - timedelta(days=365 * settings.FETCH_YEARS)).strftime(
-                '%Y-%m-%d'
+            jvn_window, nvd_window, nvd_cursor = resolve_due_windows(
+                db_service, state, run_now, jvn_window, nvd_window, fetch_end_date
             )
-            fetch_end_date = datetime.now().strftime('%Y-%m-%d')
-            logger.info(f'Default fetch mode: fetching last {settings.FETCH_YEARS} years')
+            if jvn_window is None and nvd_window is None:
+                logger.info('No new window since last sync')
+                return stats
+        else:
+            logger.info(f'Fetch date range: {fetch_start_date} to {fetch_end_date}')
+
+        # Prefer the NVD server timestamp as its cursor so local clock skew cannot open a gap
+        results, nvd_sync_cursor = await run_fetchers(
+            db_service, stats, jvn_window, nvd_window, nvd_cursor, max_items, bulk
+        )
 
-        logger.info(f'Fetch date range: {fetch_start_date} to {fetch_end_date}')
+        state_changed = record_results(
+            db_service, state, stats, results, run_now, nvd_sync_cursor or run_now, advance_cursor
+        )
 
-        all_vulnerabilities = []
+        # Dashboard aggregates are materialized views, so refresh them once new rows are in
+        if stats['inserted'] or stats['updated']:
+            db_service.refresh_dashboard_views()
 
-        # Fetch from JVN iPedia API (unless nvd_only is set)
-        if not nvd_only:
-            logger.info('Starting data fetch from JVN iPedia API...')
-            jvn_fetcher = JVNFetcherService()
-            jvn_vulnerabilities = await jvn_fetcher.fetch_vulnerabilities(
-                start_date=fetch_start_date, end_date=fetch_end_date, max_items=max_items
-            )
+        stats['fetched'] = stats['jvn_fetched'] + stats['nvd_fetched']
 
-            stats['jvn_fetched'] = len(jvn_vulnerabilities)
-            logger.info(f'Fetched {stats["jvn_fetched"]} vulnerabilities from JVN iPedia API')
-            all_vulnerabilities.extend(jvn_vulnerabilities)
-
-            # Store JVN data first
-            if jvn_vulnerabilities:
-                logger.info('Storing JVN vulnerabilities in database...')
-                jvn_db_stats = db_service.upsert_vulnerabilities_batch(jvn_vulnerabilities)
-                logger.info(
-                    f'JVN data stored: inserted={jvn_db_stats["inserted"]}, '
-                    f'updated={jvn_db_stats["updated"]}, failed={jvn_db_stats["failed"]}'
-                )
-
-        # Fetch from NVD API 2.0 (unless jvn_only is set)
-        if not jvn_only:
-            logger.info('Starting data fetch from NVD API 2.0...')
-            nvd_fetcher = NVDFetcherService()
-
-            # Convert date format for NVD API (ISO 8601 with time)
-            nvd_start_date = f"{fetch_start_date}T00:00:00.000" if fetch_start_date else None
-            nvd_end_date = f"{fetch_end_date}T23:59:59.999" if fetch_end_date else None
-
-            try:
-                nvd_vulnerabilities = await nvd_fetcher.fetch_vulnerabilities(
-                    start_date=nvd_start_date,
-                    end_date=nvd_end_date,
-                    max_items=max_items,
-                )
-
-                stats['nvd_fetched'] = len(nvd_vulnerabilities)
-                logger.info(f'Fetched {stats["nvd_fetched"]} vulnerabilities from NVD API 2.0')
-
-                # Filter out duplicates (CVE IDs already in database)
-                existing_cve_ids = db_service.get_all_cve_ids()
-                new_vulnerabilities = [v for v in nvd_vulnerabilities if v.cve_id not in existing_cve_ids]
-
-                logger.info(
-                    f'NVD filtering: {len(nvd_vulnerabilities)} total, '
-                    f'{len(new_vulnerabilities)} new (skipped {len(nvd_vulnerabilities) - len(new_vulnerabilities)} duplicates)'
-                )
-
-                all_vulnerabilities.extend(new_vulnerabilities)
-
-                # Store NVD data
-                if new_vulnerabilities:
-                    logger.info('Storing NVD vulnerabilities in database...')
-                    nvd_db_stats = db_service.upsert_vulnerabilities_batch(new_vulnerabilities)
-                    logger.info(
-                        f'NVD data stored: inserted={nvd_db_stats["inserted"]}, '
-                        f'updated={nvd_db_stats["updated"]}, failed={nvd_db_stats["failed"]}'
-                    )
-                    stats['inserted'] += nvd_db_stats['inserted']
-                    stats['updated'] += nvd_db_stats['updated']
-                    stats['failed'] += nvd_db_stats['failed']
-
-            except (NVDAPIError, NVDParseError) as e:
-                logger.error(f'NVD API error (continuing with JVN data only): {e}')
-                # Continue with JVN data even if NVD fails
-
-        stats['fetched'] = len(all_vulnerabilities)
-
-        if not all_vulnerabilities:
+        if not stats['fetched']:
             logger.warning('No vulnerabilities fetched from any API')
-            return stats
-
-        logger.info(
-            f'Total vulnerabilities processed: {stats["fetched"]} '
-            f'(JVN: {stats["jvn_fetched"]}, NVD: {stats["nvd_fetched"]})'
-        )
+        else:
+            logger.info(
+                f'Total vulnerabilities processed: {stats["fetched"]} '
+                f'(JVN: {stats["jvn_fetched"]}, NVD: {stats["nvd_fetched"]})'
+            )
 
         return stats
 
     finally:
         stats['end_time'] = datetime.now()
+        if state_changed:
+            write_state(state)
         db.close()
 
 
@@ -304,22 +503,25 @@ def main() -> int:
 
     logger.info('Database connection successful')
 
+    # Ensure tables exist (sync_state holds the per-source differential fetch cursor)
+    init_db()
+
     # Determine fetch mode and parameters
     start_date = args.start_date
     end_date = args.end_date
     max_items = args.max_items
-    differential = args.differential
+    differential = not args.all and not args.full and not (start_date or end_date)
 
     if args.all:
         logger.info('Fetch mode: ALL historical data')
         start_date = None
         end_date = None
-    elif differential:
-        logger.info('Fetch mode: DIFFERENTIAL (only new/updated data)')
+    elif args.full:
+        logger.info(f'Fetch mode: FULL (last {settings.FETCH_YEARS} years)')
     elif start_date or end_date:
         logger.info(f'Fetch mode: CUSTOM date range ({start_date} to {end_date})')
     else:
-        logger.info(f'Fetch mode: DEFAULT (last {settings.FETCH_YEARS} years)')
+        logger.info('Fetch mode: DIFFERENTIAL (only new/updated data, default)')
 
     # Run fetch and store operation
     try:
@@ -331,6 +533,7 @@ def main() -> int:
                 differential=differential,
                 nvd_only=args.nvd_only,
                 jvn_only=args.jvn_only,
+                bulk=args.all,
             )
         )
 
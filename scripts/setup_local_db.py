@@ -2,10 +2,16 @@
 """
 ローカルPostgreSQLにテーブルを作成し、Neonからデータをコピーするスクリプト
 """
+import csv
+import io
+import logging
 import os
 import sys
 from pathlib import Path
+
+import orjson
 from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
 
 # プロジェクトルートをパスに追加
 project_root = Path(__file__).parent.parent
@@ -15,11 +21,8 @@ sys.path.insert(0, str(project_root))
 env_path = project_root / '.env'
 load_dotenv(env_path, override=True)
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from src.models.vulnerability import Base, Vulnerability
-import logging
-import json
+from src.models import Base
+from src.models.dashboard_views import VULNERABILITY_VIEWS
 
 # ロギング設定
 logging.basicConfig(
@@ -28,6 +31,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JSON/JSONB列（COPY用に文字列へ変換する）
+JSON_COLS = ('affected_products', 'vendor_info', 'references')
+
 
 def create_local_tables():
     """ローカルPostgreSQLにテーブルを作成"""
@@ -62,6 +68,46 @@ def create_local_tables():
         raise
 
 
+def drop_secondary_indexes(cur):
+    """主キー以外のインデックスを削除し、再作成用の定義を返す（COPY中のインデックス更新を省く）"""
+    cur.execute("""
+        SELECT indexname, indexdef
+        FROM pg_indexes
+        WHERE schemaname = 'public'
+          AND tablename = 'vulnerabilities'
+          AND indexname NOT IN (
+              SELECT conname FROM pg_constraint WHERE conrelid = 'vulnerabilities'::regclass
+          )
+    """)
+    index_defs = cur.fetchall()
+    for index_name, _ in index_defs:
+        cur.execute(f'DROP INDEX "{index_name}"')
+    logger.info(f"インデックスを一時削除: {len(index_defs)}件")
+    return [index_def for _, index_def in index_defs]
+
+
+def recreate_indexes(cur, index_defs):
+    """drop_secondary_indexesで削除したインデックスを再作成"""
+    logger.info("インデックスを再作成中...")
+    for index_def in index_defs:
+        cur.execute(index_def)
+
+
+def encode_csv_rows(rows, json_indexes):
+    """COPY用のCSVバッファを作成（NULLは \\N、JSON/JSONBフィールドは文字列に変換）"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        values = list(row)
+        for i in json_indexes:
+            v = values[i]
+            if v is not None:
+                values[i] = orjson.dumps(v).decode()
+        writer.writerow(['\\N' if v is None else v for v in values])
+    buf.seek(0)
+    return buf
+
+
 def copy_data_from_neon(local_engine):
     """NeonからローカルPostgreSQLにデータをコピー"""
     # Neonの接続文字列（.envから直接取得）
@@ -75,73 +121,57 @@ def copy_data_from_neon(local_engine):
         # Neonエンジン作成
         neon_engine = create_engine(neon_db_url)
 
-        # Neonからデータ取得
+        # Neonからデータ取得（サーバーサイドカーソルで1000件ずつストリーミング）
         logger.info("Neonからデータを取得中...")
-        with neon_engine.connect() as neon_conn:
-            result = neon_conn.execute(text("SELECT * FROM vulnerabilities ORDER BY created_at"))
-            rows = result.fetchall()
-            columns = result.keys()
-            logger.info(f"取得件数: {len(rows)}件")
-
-        if len(rows) == 0:
-            logger.warning("⚠️  Neonにデータが存在しません")
-            return
-
-        # ローカルにデータ挿入
-        logger.info("ローカルPostgreSQLにデータを挿入中...")
-        with local_engine.connect() as local_conn:
-            # トランザクション開始
-            trans = local_conn.begin()
-            try:
+        raw_conn = local_engine.raw_connection()
+        try:
+            with neon_engine.connect().execution_options(stream_results=True, yield_per=1000) as neon_conn, \
+                    raw_conn.cursor() as cur:
+                result = neon_conn.execute(text("SELECT * FROM vulnerabilities ORDER BY created_at"))
+                columns = list(result.keys())
+                column_list = ", ".join(f'"{c}"' for c in columns)  # referencesは予約語なので引用符で囲む
+                # 同一トランザクションでTRUNCATEするため、FREEZEで書き込み済み行をそのまま凍結する
+                copy_sql = f"COPY vulnerabilities ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N', FREEZE)"
+                json_indexes = tuple(columns.index(c) for c in JSON_COLS if c in columns)
+
                 # 既存データ削除（クリーンスタート）
-                local_conn.execute(text("TRUNCATE TABLE vulnerabilities"))
+                cur.execute("TRUNCATE TABLE vulnerabilities")
+
+                # 一括ロード用の設定（ローカルの使い捨てロードなので耐久性より速度を優先）
+                cur.execute("SET LOCAL synchronous_commit = OFF")
+                index_defs = drop_secondary_indexes(cur)
 
-                # データ挿入
+                # ローカルにデータ挿入（取得したバッチごとにCOPY FROM STDINで転送）
+                logger.info("ローカルPostgreSQLにデータを挿入中...")
                 inserted = 0
-                for row in rows:
-                    # 辞書形式に変換
-                    row_dict = dict(zip(columns, row))
-
-                    # JSON/JSONBフィールドを文字列に変換
-                    if row_dict.get('affected_products') and isinstance(row_dict['affected_products'], dict):
-                        row_dict['affected_products'] = json.dumps(row_dict['affected_products'])
-                    if row_dict.get('vendor_info') and isinstance(row_dict['vendor_info'], dict):
-                        row_dict['vendor_info'] = json.dumps(row_dict['vendor_info'])
-                    if row_dict.get('references') and isinstance(row_dict['references'], dict):
-                        row_dict['references'] = json.dumps(row_dict['references'])
-
-                    # INSERT文を構築（referencesは予約語なので引用符で囲む）
-                    local_conn.execute(
-                        text("""
-                            INSERT INTO vulnerabilities (
-                                cve_id, title, description, cvss_score, severity,
-                                published_date, modified_date, affected_products,
-                                vendor_info, "references", created_at, updated_at
-                            ) VALUES (
-                                :cve_id, :title, :description, :cvss_score, :severity,
-                                :published_date, :modified_date,
-                                CAST(:affected_products AS jsonb),
-                                CAST(:vendor_info AS jsonb),
-                                CAST(:references AS jsonb),
-                                :created_at, :updated_at
-                            )
-                        """),
-                        row_dict
-                    )
-                    inserted += 1
-
-                    # 進捗表示（100件ごと）
-                    if inserted % 100 == 0:
-                        logger.info(f"  {inserted}/{len(rows)}件 挿入完了")
-
-                # コミット
-                trans.commit()
-                logger.info(f"✅ データコピー完了: {inserted}件")
-
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"❌ データ挿入失敗（ロールバック）: {e}")
-                raise
+                for partition in result.partitions():
+                    cur.copy_expert(copy_sql, encode_csv_rows(partition, json_indexes))
+                    inserted += len(partition)
+                    logger.info(f"  {inserted}件 挿入完了")
+
+                # インデックスを再作成して統計情報を更新
+                recreate_indexes(cur, index_defs)
+                cur.execute("ANALYZE vulnerabilities")
+
+                # ダッシュボード用マテリアライズドビューをロード後のデータで再計算
+                for view in VULNERABILITY_VIEWS:
+                    cur.execute(f"REFRESH MATERIALIZED VIEW {view.name}")
+
+            if inserted == 0:
+                raw_conn.rollback()
+                logger.warning("⚠️  Neonにデータが存在しません")
+                return
+
+            # コミット
+            raw_conn.commit()
+            logger.info(f"✅ データコピー完了: {inserted}件")
+
+        except Exception as e:
+            raw_conn.rollback()
+            logger.error(f"❌ データ挿入失敗（ロールバック）: {e}")
+            raise
+        finally:
+            raw_conn.close()
 
         # データ件数確認
         with local_engine.connect() as local_conn:
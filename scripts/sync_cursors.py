@@ -0,0 +1,144 @@
+"""
+Per-source sync cursors for scripts/fetch_vulnerabilities.py.
+
+Differential fetches start each data source at its last sync. The cursors are cached in a
+local state file (avoids DB lookups on every run) and fall back to the database when absent.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Tuple
+
+from src.config import settings
+from src.services.database_vulnerability_service import DatabaseVulnerabilityService
+
+logger = logging.getLogger(__name__)
+
+# Local cache of the per-source sync cursors (avoids DB lookups on every run)
+SYNC_STATE_PATH = Path(__file__).resolve().parent.parent / '.sync_state.json'
+
+
+def read_state() -> dict:
+    """
+    Read cached sync cursors from the local state file.
+
+    Returns:
+        dict: Cursors keyed by '<source>_last_mod' (ISO 8601), or an empty dict when absent or unreadable
+    """
+    try:
+        with open(SYNC_STATE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f'Ignoring unreadable sync state file {SYNC_STATE_PATH}: {e}')
+        return {}
+
+
+def write_state(state: dict) -> None:
+    """
+    Write sync cursors to the local state file (atomically, via a temporary file).
+
+    Args:
+        state: Cursors keyed by '<source>_last_mod' (ISO 8601)
+    """
+    tmp_path = SYNC_STATE_PATH.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        tmp_path.replace(SYNC_STATE_PATH)
+    except OSError as e:
+        logger.warning(f'Failed to write sync state file {SYNC_STATE_PATH}: {e}')
+
+
+def resolve_sync_cursor(
+    db_service: DatabaseVulnerabilityService, source: str, state: dict, run_now: datetime
+) -> datetime:
+    """
+    Resolve the start of a differential fetch window for one data source.
+
+    Uses the local state file first, then the source's sync_state cursor, then the latest
+    modified_date in the database, and finally the last FETCH_YEARS years when the database is empty.
+
+    Args:
+        db_service: Database vulnerability service
+        source: Data source name ('jvn' or 'nvd')
+        state: Cached cursors from read_state()
+        run_now: Start time of the current run (UTC)
+
+    Returns:
+        datetime: Start of the differential fetch window
+    """
+    cached = state.get(f'{source}_last_mod')
+    cursor = datetime.fromisoformat(cached) if cached else None
+
+    if cursor is None:
+        cursor = db_service.get_sync_cursor(source)
+
+    if cursor is None:
+        cursor = db_service.get_latest_modified_date()
+
+    if cursor is None:
+        logger.warning(
+            f'No sync state for {source} and no data in database, '
+            f'falling back to last {settings.FETCH_YEARS} years'
+        )
+        return run_now - timedelta(days=365 * settings.FETCH_YEARS)
+
+    if cursor.tzinfo is None:
+        cursor = cursor.replace(tzinfo=timezone.utc)
+
+    logger.info(f'Last {source} sync: {cursor.isoformat()}')
+    return cursor
+
+
+Window = Tuple[Optional[str], Optional[str]]
+
+
+def resolve_due_windows(
+    db_service: DatabaseVulnerabilityService,
+    state: dict,
+    run_now: datetime,
+    jvn_window: Optional[Window],
+    nvd_window: Optional[Window],
+    end_date: Optional[str],
+) -> Tuple[Optional[Window], Optional[Window], Optional[datetime]]:
+    """
+    Narrow a differential fetch to the sources that are due, starting each at its sync cursor.
+
+    A source whose window since the last sync is shorter than MIN_SYNC_INTERVAL is skipped.
+
+    Args:
+        db_service: Database vulnerability service
+        state: Cached cursors from read_state()
+        run_now: Start time of the current run (UTC)
+        jvn_window: JVN (start_date, end_date), or None if JVN iPedia is disabled
+        nvd_window: NVD (start_date, end_date), or None if NVD is disabled
+        end_date: End date of the fetch (ISO 8601: YYYY-MM-DD)
+
+    Returns:
+        Tuple: JVN window, NVD window (None = source skipped) and the NVD cursor
+    """
+    min_interval = timedelta(seconds=settings.MIN_SYNC_INTERVAL)
+    cursors = {}
+
+    for source, window in (('jvn', jvn_window), ('nvd', nvd_window)):
+        cursor = resolve_sync_cursor(db_service, source, state, run_now) if window is not None else None
+        if cursor is not None and run_now - cursor < min_interval:
+            logger.info(f'{source.upper()} synced less than {settings.MIN_SYNC_INTERVAL}s ago, skipping')
+            cursor = None
+        cursors[source] = cursor
+
+    jvn_cursor, nvd_cursor = cursors['jvn'], cursors['nvd']
+    logger.info(
+        f'Fetch date range: JVN {jvn_cursor.strftime("%Y-%m-%d") if jvn_cursor else "skipped"} to {end_date}, '
+        f'NVD modified since {nvd_cursor.isoformat() if nvd_cursor else "skipped"}'
+    )
+
+    return (
+        (jvn_cursor.strftime('%Y-%m-%d'), end_date) if jvn_cursor else None,
+        nvd_window if nvd_cursor else None,
+        nvd_cursor,
+    )
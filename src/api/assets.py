@@ -9,18 +9,21 @@ This module provides REST API endpoints for:
 - File import (POST /api/assets/import/{composer|npm|docker})
 """
 
-import json
 import logging
-from typing import Optional
+import re
+from typing import Callable, Iterable, Iterator, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.database import get_db
 from src.models.asset import Asset
+from src.models.dashboard_views import ASSET_VIEWS, refresh_materialized_views
 from src.schemas.asset import (
     AssetCreate,
     AssetListResponse,
@@ -29,15 +32,63 @@ from src.schemas.asset import (
     FileImportResponse,
 )
 from src.utils.cpe_generator import (
+    DOCKER_VENDOR_MAP,
+    NPM_VENDOR_MAP,
     generate_cpe_from_composer,
     generate_cpe_from_docker,
     generate_cpe_from_manual,
     generate_cpe_from_npm,
+    normalize_version,
 )
+from src.utils.pagination import approximate_row_count, decode_cursor, encode_cursor
+from src.utils.templates import templates
 
 router = APIRouter(tags=["assets"])
 logger = logging.getLogger(__name__)
-templates = Jinja2Templates(directory="src/templates")
+
+# Dockerfile FROM instruction (matched per line): image name and optional tag
+_FROM_RE = re.compile(r"^FROM\s+([^:\s]+)(?::([^\s]+))?", re.IGNORECASE)
+
+# Rows per INSERT page in file imports (7 columns x 1000 rows stays well under PostgreSQL's 65535 bind parameters)
+ASSET_INSERT_BATCH_SIZE = 1000
+
+# Core INSERT for file imports: skips duplicates and returns only the rows actually inserted
+_ASSET_IMPORT_STMT = (
+    pg_insert(Asset.__table__)
+    .on_conflict_do_nothing(index_elements=["vendor", "product", "version"])
+    .returning(Asset.__table__.c.asset_id)
+)
+
+
+def _insert_assets(db: Session, rows: list[dict]) -> int:
+    """
+    Bulk insert imported assets, skipping duplicates, in a single transaction.
+
+    Uses a Core executemany so SQLAlchemy's insertmanyvalues batches the rows into
+    multi-row INSERT statements without ORM unit-of-work overhead.
+    Duplicates within the upload are dropped in memory first (first occurrence wins);
+    duplicates of existing assets are skipped by ON CONFLICT DO NOTHING.
+
+    Args:
+        db: Database session
+        rows: Asset column values (asset_name, vendor, product, version, cpe_code, source)
+
+    Returns:
+        Number of rows actually inserted (duplicates are not counted)
+    """
+    unique_rows = {}
+    for row in rows:
+        unique_rows.setdefault((row["vendor"], row["product"], row["version"]), row)
+    if not unique_rows:
+        return 0
+    result = db.execute(
+        _ASSET_IMPORT_STMT,
+        list(unique_rows.values()),
+        execution_options={"insertmanyvalues_page_size": ASSET_INSERT_BATCH_SIZE},
+    )
+    inserted = len(result.all())
+    db.commit()
+    return inserted
 
 
 @router.get("/assets", response_class=HTMLResponse, tags=["Frontend"])
@@ -58,7 +109,7 @@ async def get_assets_page(request: Request):
         HTMLResponse: Rendered HTML page
     """
     logger.info("Rendering asset management page")
-    return templates.TemplateResponse("assets.html", {"request": request})
+    return templates.TemplateResponse(request, "assets.html")
 
 
 @router.post("/api/assets", response_model=AssetResponse, status_code=status.HTTP_201_CREATED)
@@ -83,23 +134,23 @@ def create_asset(asset_data: AssetCreate, db: Session = Depends(get_db)):
     # Generate CPE code
     cpe_code = generate_cpe_from_manual(asset_data.vendor, asset_data.product, asset_data.version)
 
-    # Create asset instance
-    asset = Asset(
-        asset_name=asset_data.asset_name,
-        vendor=asset_data.vendor,
-        product=asset_data.product,
-        version=asset_data.version,
-        cpe_code=cpe_code,
-        source="manual",
+    # Insert, letting the unique constraint skip duplicates instead of raising IntegrityError
+    stmt = (
+        pg_insert(Asset)
+        .values(
+            asset_name=asset_data.asset_name,
+            vendor=asset_data.vendor,
+            product=asset_data.product,
+            version=asset_data.version,
+            cpe_code=cpe_code,
+            source="manual",
+        )
+        .on_conflict_do_nothing(index_elements=["vendor", "product", "version"])
+        .returning(Asset)
     )
+    asset = db.scalars(stmt).first()
 
-    try:
-        db.add(asset)
-        db.commit()
-        db.refresh(asset)
-        logger.info(f"Asset created successfully: {asset.asset_id}")
-        return asset
-    except IntegrityError as e:
+    if asset is None:
         db.rollback()
         logger.warning(f"Duplicate asset detected: {asset_data.vendor}/{asset_data.product}/{asset_data.version}")
         raise HTTPException(
@@ -108,27 +159,38 @@ def create_asset(asset_data: AssetCreate, db: Session = Depends(get_db)):
             f"and version '{asset_data.version}' already exists",
         )
 
+    # Serialize before commit so the returned row is not reloaded after expiry
+    response = AssetResponse.model_validate(asset)
+    db.commit()
+    logger.info(f"Asset created successfully: {asset.asset_id}")
+    return response
+
 
 @router.get("/api/assets", response_model=AssetListResponse)
 def list_assets(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
     source: Optional[str] = Query(None, description="Filter by source (manual/composer/npm/docker)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous response's next_cursor"),
     db: Session = Depends(get_db),
 ):
     """
     Retrieve asset list with pagination.
 
+    With a cursor, the page is fetched by keyset (created_at, asset_id) instead of OFFSET,
+    and total is the planner's approximate row count rather than an exact COUNT(*).
+
     Args:
-        page: Page number (starting from 1)
+        page: Page number (starting from 1; ignored when cursor is given)
         limit: Items per page (max 100)
         source: Optional filter by source type
+        cursor: Optional keyset cursor (next_cursor of the previous page)
         db: Database session
 
     Returns:
         Paginated asset list
     """
-    logger.info(f"Fetching assets: page={page}, limit={limit}, source={source}")
+    logger.info(f"Fetching assets: page={page}, limit={limit}, source={source}, cursor={cursor}")
 
     # Build query
     query = db.query(Asset)
@@ -139,16 +201,36 @@ def list_assets(
             )
         query = query.filter(Asset.source == source)
 
-    # Get total count
-    total = query.count()
+    # Newest first; ORDER BY must be applied before OFFSET/LIMIT on a legacy Query
+    page_query = query.order_by(Asset.created_at.desc(), Asset.asset_id.desc())
 
-    # Apply pagination
-    offset = (page - 1) * limit
-    assets = query.order_by(Asset.created_at.desc()).offset(offset).limit(limit).all()
+    total = None
+    if cursor:
+        # Keyset pagination: no OFFSET scan, and an estimate instead of COUNT(*)
+        cursor_created_at, cursor_asset_id = decode_cursor(cursor)
+        page_query = page_query.filter(
+            tuple_(Asset.created_at, Asset.asset_id) < tuple_(cursor_created_at, cursor_asset_id)
+        )
+        if not source:
+            total = approximate_row_count(db, Asset.__tablename__)
+    else:
+        page_query = page_query.offset((page - 1) * limit)
+
+    # Fetch one extra row to know whether another page follows
+    rows = page_query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    assets = rows[:limit]
+    next_cursor = encode_cursor(assets[-1].created_at, assets[-1].asset_id) if has_more else None
+
+    # Exact count for page-number navigation (and when no estimate is available)
+    if total is None:
+        total = query.count()
 
     logger.info(f"Fetched {len(assets)} assets (total: {total})")
 
-    return AssetListResponse(items=assets, total=total, page=page, limit=limit)
+    return AssetListResponse(
+        items=assets, total=total, page=page, limit=limit, has_more=has_more, next_cursor=next_cursor
+    )
 
 
 @router.get("/api/assets/{asset_id}", response_model=AssetResponse)
@@ -212,9 +294,6 @@ def update_asset(asset_id: str, asset_data: AssetUpdate, db: Session = Depends(g
 
     try:
         db.commit()
-        db.refresh(asset)
-        logger.info(f"Asset updated successfully: {asset_id}")
-        return asset
     except IntegrityError as e:
         db.rollback()
         logger.warning(f"Update would create duplicate asset: {asset.vendor}/{asset.product}/{asset.version}")
@@ -224,6 +303,15 @@ def update_asset(asset_id: str, asset_data: AssetUpdate, db: Session = Depends(g
             f"product '{asset.product}', and version '{asset.version}'",
         )
 
+    # Show the new asset name in the dashboard ranking
+    if asset_data.asset_name is not None:
+        refresh_materialized_views(db, ASSET_VIEWS)
+        db.commit()
+
+    db.refresh(asset)
+    logger.info(f"Asset updated successfully: {asset_id}")
+    return asset
+
 
 @router.delete("/api/assets/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_asset(asset_id: str, db: Session = Depends(get_db)):
@@ -248,113 +336,161 @@ def delete_asset(asset_id: str, db: Session = Depends(get_db)):
 
     db.delete(asset)
     db.commit()
+
+    # Drop the deleted asset from the dashboard ranking
+    refresh_materialized_views(db, ASSET_VIEWS)
+    db.commit()
     logger.info(f"Asset deleted successfully: {asset_id}")
 
 
-@router.post("/api/assets/import/composer", response_model=FileImportResponse, status_code=status.HTTP_201_CREATED)
-async def import_composer(file: UploadFile = File(...), db: Session = Depends(get_db)):
+def _bulk_import(
+    source: str,
+    dependencies: Iterable[tuple[str, str]],
+    build_asset: Callable[[str, str], Optional[tuple[str, str, str, str, str]]],
+    db: Session,
+) -> FileImportResponse:
     """
-    Import assets from Composer file (composer.json or composer.lock).
+    Shared import path for file uploads: build asset rows and bulk insert them.
 
     Args:
-        file: Uploaded Composer file
+        source: Source type stored on the assets (composer/npm/docker)
+        dependencies: (name, version_spec) pairs extracted from the file
+        build_asset: Returns (asset_name, vendor, product, version, cpe_code) for a dependency,
+            or None to skip it
         db: Database session
 
     Returns:
         Import statistics
-
-    Raises:
-        HTTPException: 400 if file format is invalid
     """
-    logger.info(f"Importing Composer file: {file.filename}")
+    rows = []
+    errors = []
 
-    # Validate file name
-    if not file.filename or not (file.filename.endswith("composer.json") or file.filename.endswith("composer.lock")):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file name. Must be composer.json or composer.lock",
+    for name, version_spec in dependencies:
+        try:
+            asset = build_asset(name, version_spec)
+        except Exception as e:
+            logger.error(f"Failed to import {name}: {e}")
+            errors.append(f"{name}: {str(e)}")
+            continue
+        if asset is None:
+            continue
+
+        asset_name, vendor, product, version, cpe_code = asset
+        rows.append(
+            {
+                "asset_name": asset_name,
+                "vendor": vendor,
+                "product": product,
+                "version": version,
+                "cpe_code": cpe_code,
+                "source": source,
+            }
         )
 
-    # Read and parse JSON
-    try:
-        content = await file.read()
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON: {e}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON format: {e}")
+    # Insert all rows at once; duplicates are skipped by the unique constraint
+    imported_count = _insert_assets(db, rows)
+    skipped_count = len(rows) - imported_count
 
-    # Extract dependencies
-    dependencies = {}
-    if "require" in data:
-        dependencies.update(data["require"])
-    if "require-dev" in data:
-        dependencies.update(data["require-dev"])
+    logger.info(f"{source} import completed: imported={imported_count}, skipped={skipped_count}, errors={len(errors)}")
 
-    # For composer.lock, extract from packages
-    if "packages" in data:
-        for package in data["packages"]:
+    return FileImportResponse(imported_count=imported_count, skipped_count=skipped_count, errors=errors)
+
+
+def _iter_composer_dependencies(data: dict) -> Iterator[tuple[str, str]]:
+    """
+    Yield unique (package_name, version_spec) pairs from a parsed composer.json / composer.lock.
+
+    Locked versions from "packages" take precedence over "require-dev", then "require";
+    only the first occurrence of each package is yielded.
+    """
+
+    def candidates():
+        for package in data.get("packages", ()):
             package_name = package.get("name")
             package_version = package.get("version", "").lstrip("v")
             if package_name and package_version:
-                dependencies[package_name] = package_version
+                yield package_name, package_version
+        yield from data.get("require-dev", {}).items()
+        yield from data.get("require", {}).items()
 
-    logger.info(f"Found {len(dependencies)} dependencies in Composer file")
+    seen = set()
+    for package_name, version_spec in candidates():
+        if package_name not in seen:
+            seen.add(package_name)
+            yield package_name, version_spec
 
-    # Import assets
-    imported_count = 0
-    skipped_count = 0
-    errors = []
 
-    for package_name, version_spec in dependencies.items():
-        try:
-            # Skip PHP version constraint
-            if package_name == "php":
+def _iter_npm_dependencies(data: dict) -> Iterator[tuple[str, str]]:
+    """
+    Yield unique (package_name, version_spec) pairs from a parsed package.json / package-lock.json.
+
+    Locked versions from "packages" take precedence over "devDependencies", then "dependencies";
+    only the first occurrence of each package is yielded.
+    """
+
+    def candidates():
+        for package_path, package_info in data.get("packages", {}).items():
+            if package_path == "":  # Root package
                 continue
+            # "node_modules/a/node_modules/@scope/b" -> "@scope/b" (lstrip would strip characters, not the prefix)
+            package_name = package_path.rpartition("node_modules/")[2]
+            package_version = package_info.get("version", "")
+            if package_name and package_version:
+                yield package_name, package_version
+        yield from data.get("devDependencies", {}).items()
+        yield from data.get("dependencies", {}).items()
 
-            # Generate CPE code
-            cpe_code = generate_cpe_from_composer(package_name, version_spec)
+    seen = set()
+    for package_name, version_spec in candidates():
+        if package_name not in seen:
+            seen.add(package_name)
+            yield package_name, version_spec
 
-            # Extract vendor/product from package name
-            if "/" in package_name:
-                vendor, product = package_name.split("/", 1)
-            else:
-                vendor = product = package_name
 
-            # Normalize version
-            from src.utils.cpe_generator import normalize_version
+def _composer_asset(package_name: str, version_spec: str) -> Optional[tuple[str, str, str, str, str]]:
+    """Build asset values for a Composer package (skips the PHP version constraint)."""
+    if package_name == "php":
+        return None
 
-            version = normalize_version(version_spec)
+    cpe_code = generate_cpe_from_composer(package_name, version_spec)
 
-            # Create asset
-            asset = Asset(
-                asset_name=package_name, vendor=vendor, product=product, version=version, cpe_code=cpe_code, source="composer"
-            )
+    # Extract vendor/product from package name
+    if "/" in package_name:
+        vendor, product = package_name.split("/", 1)
+    else:
+        vendor = product = package_name
 
-            try:
-                db.add(asset)
-                db.commit()
-                imported_count += 1
-            except IntegrityError:
-                db.rollback()
-                skipped_count += 1
-                logger.debug(f"Skipped duplicate: {package_name} {version}")
+    return package_name, vendor, product, normalize_version(version_spec), cpe_code
 
-        except Exception as e:
-            logger.error(f"Failed to import {package_name}: {e}")
-            errors.append(f"{package_name}: {str(e)}")
 
-    logger.info(f"Composer import completed: imported={imported_count}, skipped={skipped_count}, errors={len(errors)}")
+def _npm_asset(package_name: str, version_spec: str) -> tuple[str, str, str, str, str]:
+    """Build asset values for an NPM package."""
+    cpe_code = generate_cpe_from_npm(package_name, version_spec)
+    vendor = NPM_VENDOR_MAP.get(package_name, "npmjs")
+    product = package_name.lstrip("@").split("/")[-1]
+    return package_name, vendor, product, normalize_version(version_spec), cpe_code
 
-    return FileImportResponse(imported_count=imported_count, skipped_count=skipped_count, errors=errors)
 
+def _docker_asset(image_name: str, image_tag: Optional[str]) -> Optional[tuple[str, str, str, str, str]]:
+    """Build asset values for a Docker base image (skips scratch, defaults the tag to latest)."""
+    if image_name.lower() == "scratch":
+        return None
 
-@router.post("/api/assets/import/npm", response_model=FileImportResponse, status_code=status.HTTP_201_CREATED)
-async def import_npm(file: UploadFile = File(...), db: Session = Depends(get_db)):
+    if not image_tag:
+        image_tag = "latest"
+
+    cpe_code = generate_cpe_from_docker(image_name, image_tag)
+    vendor = DOCKER_VENDOR_MAP.get(image_name, "docker")
+    return f"Docker: {image_name}:{image_tag}", vendor, image_name, normalize_version(image_tag), cpe_code
+
+
+@router.post("/api/assets/import/composer", response_model=FileImportResponse, status_code=status.HTTP_201_CREATED)
+def import_composer(file: UploadFile = File(...), db: Session = Depends(get_db)):
     """
-    Import assets from NPM file (package.json or package-lock.json).
+    Import assets from Composer file (composer.json or composer.lock).
 
     Args:
-        file: Uploaded NPM file
+        file: Uploaded Composer file
         db: Database session
 
     Returns:
@@ -363,84 +499,63 @@ async def import_npm(file: UploadFile = File(...), db: Session = Depends(get_db)
     Raises:
         HTTPException: 400 if file format is invalid
     """
-    logger.info(f"Importing NPM file: {file.filename}")
+    logger.info(f"Importing Composer file: {file.filename}")
 
     # Validate file name
-    if not file.filename or not (file.filename.endswith("package.json") or file.filename.endswith("package-lock.json")):
+    if not file.filename or not (file.filename.endswith("composer.json") or file.filename.endswith("composer.lock")):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file name. Must be package.json or package-lock.json",
+            detail="Invalid file name. Must be composer.json or composer.lock",
         )
 
     # Read and parse JSON
     try:
-        content = await file.read()
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
+        content = file.file.read()
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON: {e}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON format: {e}")
 
-    # Extract dependencies
-    dependencies = {}
-    if "dependencies" in data:
-        dependencies.update(data["dependencies"])
-    if "devDependencies" in data:
-        dependencies.update(data["devDependencies"])
+    return _bulk_import("composer", _iter_composer_dependencies(data), _composer_asset, db)
 
-    # For package-lock.json, extract from packages
-    if "packages" in data:
-        for package_path, package_info in data["packages"].items():
-            if package_path == "":  # Root package
-                continue
-            package_name = package_path.lstrip("node_modules/")
-            package_version = package_info.get("version", "")
-            if package_name and package_version:
-                dependencies[package_name] = package_version
 
-    logger.info(f"Found {len(dependencies)} dependencies in NPM file")
-
-    # Import assets
-    imported_count = 0
-    skipped_count = 0
-    errors = []
-
-    for package_name, version_spec in dependencies.items():
-        try:
-            # Generate CPE code
-            cpe_code = generate_cpe_from_npm(package_name, version_spec)
-
-            # Extract vendor/product
-            from src.utils.cpe_generator import NPM_VENDOR_MAP, normalize_version
+@router.post("/api/assets/import/npm", response_model=FileImportResponse, status_code=status.HTTP_201_CREATED)
+def import_npm(file: UploadFile = File(...), db: Session = Depends(get_db)):
+    """
+    Import assets from NPM file (package.json or package-lock.json).
 
-            vendor = NPM_VENDOR_MAP.get(package_name, "npmjs")
-            product = package_name.lstrip("@").split("/")[-1]
-            version = normalize_version(version_spec)
+    Args:
+        file: Uploaded NPM file
+        db: Database session
 
-            # Create asset
-            asset = Asset(
-                asset_name=package_name, vendor=vendor, product=product, version=version, cpe_code=cpe_code, source="npm"
-            )
+    Returns:
+        Import statistics
 
-            try:
-                db.add(asset)
-                db.commit()
-                imported_count += 1
-            except IntegrityError:
-                db.rollback()
-                skipped_count += 1
-                logger.debug(f"Skipped duplicate: {package_name} {version}")
+    Raises:
+        HTTPException: 400 if file format is invalid
+    """
+    logger.info(f"Importing NPM file: {file.filename}")
 
-        except Exception as e:
-            logger.error(f"Failed to import {package_name}: {e}")
-            errors.append(f"{package_name}: {str(e)}")
+    # Validate file name
+    if not file.filename or not (file.filename.endswith("package.json") or file.filename.endswith("package-lock.json")):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file name. Must be package.json or package-lock.json",
+        )
 
-    logger.info(f"NPM import completed: imported={imported_count}, skipped={skipped_count}, errors={len(errors)}")
+    # Read and parse JSON
+    try:
+        content = file.file.read()
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON format: {e}")
 
-    return FileImportResponse(imported_count=imported_count, skipped_count=skipped_count, errors=errors)
+    return _bulk_import("npm", _iter_npm_dependencies(data), _npm_asset, db)
 
 
 @router.post("/api/assets/import/docker", response_model=FileImportResponse, status_code=status.HTTP_201_CREATED)
-async def import_docker(file: UploadFile = File(...), db: Session = Depends(get_db)):
+def import_docker(file: UploadFile = File(...), db: Session = Depends(get_db)):
     """
     Import assets from Dockerfile.
 
@@ -462,70 +577,17 @@ async def import_docker(file: UploadFile = File(...), db: Session = Depends(get_
     if not file.filename or not (file.filename == "Dockerfile" or file.filename.startswith("Dockerfile.")):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file name. Must be Dockerfile or Dockerfile.*")
 
-    # Read content
+    # Extract FROM instructions line by line (the upload is never buffered as a whole)
+    matches = []
     try:
-        content = await file.read()
-        dockerfile_content = content.decode("utf-8")
+        for line in file.file:
+            match = _FROM_RE.match(line.decode("utf-8"))
+            if match:
+                matches.append(match.groups())
     except Exception as e:
         logger.error(f"Failed to read Dockerfile: {e}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Failed to read file: {e}")
 
-    # Extract FROM instructions
-    import re
-
-    from_pattern = re.compile(r"^FROM\s+([^:\s]+)(?::([^\s]+))?", re.MULTILINE | re.IGNORECASE)
-    matches = from_pattern.findall(dockerfile_content)
-
     logger.info(f"Found {len(matches)} FROM instructions in Dockerfile")
 
-    # Import assets
-    imported_count = 0
-    skipped_count = 0
-    errors = []
-
-    for image_name, image_tag in matches:
-        try:
-            # Skip scratch image
-            if image_name.lower() == "scratch":
-                continue
-
-            # Default tag is "latest"
-            if not image_tag:
-                image_tag = "latest"
-
-            # Generate CPE code
-            cpe_code = generate_cpe_from_docker(image_name, image_tag)
-
-            # Extract vendor/product
-            from src.utils.cpe_generator import DOCKER_VENDOR_MAP, normalize_version
-
-            vendor = DOCKER_VENDOR_MAP.get(image_name, "docker")
-            product = image_name
-            version = normalize_version(image_tag)
-
-            # Create asset
-            asset = Asset(
-                asset_name=f"Docker: {image_name}:{image_tag}",
-                vendor=vendor,
-                product=product,
-                version=version,
-                cpe_code=cpe_code,
-                source="docker",
-            )
-
-            try:
-                db.add(asset)
-                db.commit()
-                imported_count += 1
-            except IntegrityError:
-                db.rollback()
-                skipped_count += 1
-                logger.debug(f"Skipped duplicate: {image_name}:{image_tag}")
-
-        except Exception as e:
-            logger.error(f"Failed to import {image_name}:{image_tag}: {e}")
-            errors.append(f"{image_name}:{image_tag}: {str(e)}")
-
-    logger.info(f"Docker import completed: imported={imported_count}, skipped={skipped_count}, errors={len(errors)}")
-
-    return FileImportResponse(imported_count=imported_count, skipped_count=skipped_count, errors=errors)
+    return _bulk_import("docker", matches, _docker_asset, db)
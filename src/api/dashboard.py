@@ -9,17 +9,16 @@ This module provides REST API endpoints for dashboard widgets:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, case, func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import and_, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.database import get_db
-from src.models.asset import Asset, AssetVulnerabilityMatch
-from src.models.vulnerability import Vulnerability
+from src.models.dashboard_views import mv_asset_ranking, mv_daily_vuln_counts, mv_severity_counts
 from src.schemas.dashboard import (
     AssetRankingResponse,
     DashboardSummaryResponse,
@@ -29,15 +28,46 @@ from src.schemas.dashboard import (
     TrendDataResponse,
     AssetRankingItemSchema,
 )
+from src.utils.http_cache import compute_dashboard_etag, not_modified
+from src.utils.response_cache import dashboard_cache
 
 logger = logging.getLogger(__name__)
 
 # Router for dashboard endpoints
 router = APIRouter(prefix="/api/dashboard")
 
+# Severity counts reported as 0 when no vulnerability has that severity
+_EMPTY_SEVERITY_COUNTS = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+
+# Previous week counts: vulnerabilities published at least this many days ago
+PREVIOUS_WEEK_DAYS = 7
+
+
+def _severity_totals(prev_cutoff: Optional[date] = None):
+    """
+    Per-severity totals summed over the publication dates of mv_severity_counts.
+
+    Args:
+        prev_cutoff: If given, also sum the counts published on or before this date (prev_total)
+
+    Returns:
+        Subquery with columns severity, total (and prev_total)
+    """
+    view = mv_severity_counts
+    columns = [func.lower(view.c.severity).label("severity"), func.sum(view.c.total).label("total")]
+    if prev_cutoff is not None:
+        prev_total = func.sum(view.c.total).filter(view.c.date <= prev_cutoff)
+        columns.append(func.coalesce(prev_total, 0).label("prev_total"))
+    return select(*columns).group_by(view.c.severity).subquery()
+
 
 @router.get("/summary", response_model=DashboardSummaryResponse, tags=["Dashboard"])
-async def get_dashboard_summary(db: Session = Depends(get_db)):
+def get_dashboard_summary(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    etag: str = Depends(compute_dashboard_etag),
+):
     """
     Get dashboard summary data with severity counts and previous week comparison.
 
@@ -46,7 +76,10 @@ async def get_dashboard_summary(db: Session = Depends(get_db)):
     - Previous week severity counts (7 days ago)
 
     Args:
+        request: FastAPI request object (If-None-Match)
+        response: FastAPI response object (ETag header)
         db: Database session (dependency injection)
+        etag: ETag for the current dashboard data (dependency injection)
 
     Returns:
         DashboardSummaryResponse: Summary data with severity counts
@@ -54,53 +87,42 @@ async def get_dashboard_summary(db: Session = Depends(get_db)):
     Raises:
         HTTPException: 500 for server errors
     """
-    try:
-        logger.info("Fetching dashboard summary data")
+    # Unchanged since the client's last request: 304 without building the response
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
 
-        # Current severity counts
-        current_counts = (
-            db.query(
-                Vulnerability.severity,
-                func.count(Vulnerability.cve_id).label("count"),
-            )
-            .group_by(Vulnerability.severity)
-            .all()
-        )
+    # Served from the in-process cache (keyed by ETag, so a data change misses the cache)
+    result = dashboard_cache.get(("summary", etag))
+    if result is not None:
+        return result
 
-        # 7 days ago
-        seven_days_ago = datetime.now() - timedelta(days=7)
+    try:
+        logger.info("Fetching dashboard summary data")
 
-        # Previous week severity counts (published_date <= seven_days_ago)
-        prev_counts = (
-            db.query(
-                Vulnerability.severity,
-                func.count(Vulnerability.cve_id).label("count"),
+        # Current and previous week (published 7+ days ago) counts, pivoted to {severity: count} in SQL
+        totals = _severity_totals(prev_cutoff=date.today() - timedelta(days=PREVIOUS_WEEK_DAYS))
+        current, previous = db.execute(
+            select(
+                func.json_object_agg(totals.c.severity, totals.c.total),
+                func.json_object_agg(totals.c.severity, totals.c.prev_total),
             )
-            .filter(Vulnerability.published_date <= seven_days_ago)
-            .group_by(Vulnerability.severity)
-            .all()
-        )
-
-        # Convert to dictionaries
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        prev_severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-
-        for severity, count in current_counts:
-            if severity:
-                severity_counts[severity.lower()] = count
+        ).one()
 
-        for severity, count in prev_counts:
-            if severity:
-                prev_severity_counts[severity.lower()] = count
+        # json_object_agg returns NULL for an empty view; severities without rows default to 0
+        severity_counts = {**_EMPTY_SEVERITY_COUNTS, **(current or {})}
+        prev_severity_counts = {**_EMPTY_SEVERITY_COUNTS, **(previous or {})}
 
         logger.info(
             f"Dashboard summary fetched: current={severity_counts}, previous={prev_severity_counts}"
         )
 
-        return DashboardSummaryResponse(
-            severityCounts=SeverityCountsSchema(**severity_counts),
-            prevSeverityCounts=SeverityCountsSchema(**prev_severity_counts),
+        result = DashboardSummaryResponse(
+            severityCounts=SeverityCountsSchema.model_construct(**severity_counts),
+            prevSeverityCounts=SeverityCountsSchema.model_construct(**prev_severity_counts),
         )
+        dashboard_cache.set(("summary", etag), result)
+        return result
 
     except SQLAlchemyError as e:
         logger.error(f"Database error fetching dashboard summary: {str(e)}", exc_info=True)
@@ -111,9 +133,12 @@ async def get_dashboard_summary(db: Session = Depends(get_db)):
 
 
 @router.get("/trend", response_model=TrendDataResponse, tags=["Dashboard"])
-async def get_dashboard_trend(
+def get_dashboard_trend(
+    request: Request,
+    response: Response,
     days: int = Query(30, ge=1, le=365, description="Number of days to fetch trend data"),
     db: Session = Depends(get_db),
+    etag: str = Depends(compute_dashboard_etag),
 ):
     """
     Get dashboard trend data with daily vulnerability detection counts.
@@ -123,8 +148,11 @@ async def get_dashboard_trend(
     - Data points for the specified number of days (default: 30)
 
     Args:
+        request: FastAPI request object (If-None-Match)
+        response: FastAPI response object (ETag header)
         days: Number of days to fetch trend data (1-365)
         db: Database session (dependency injection)
+        etag: ETag for the current dashboard data (dependency injection)
 
     Returns:
         TrendDataResponse: Trend data with daily counts
@@ -132,6 +160,16 @@ async def get_dashboard_trend(
     Raises:
         HTTPException: 500 for server errors
     """
+    # Unchanged since the client's last request: 304 without building the response
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+
+    # Served from the in-process cache (keyed by ETag, so a data change misses the cache)
+    result = dashboard_cache.get(("trend", days, etag))
+    if result is not None:
+        return result
+
     try:
         logger.info(f"Fetching dashboard trend data for {days} days")
 
@@ -139,36 +177,29 @@ async def get_dashboard_trend(
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days - 1)
 
-        # Query daily counts
-        daily_counts = (
-            db.query(
-                func.date(Vulnerability.published_date).label("date"),
-                func.count(Vulnerability.cve_id).label("detected"),
-            )
-            .filter(
+        # Query daily counts (pre-aggregated per publication date) as plain mappings
+        daily_counts = db.execute(
+            select(mv_daily_vuln_counts.c.date, mv_daily_vuln_counts.c.detected)
+            .where(
                 and_(
-                    Vulnerability.published_date >= start_date,
-                    Vulnerability.published_date <= end_date,
+                    mv_daily_vuln_counts.c.date >= start_date.date(),
+                    mv_daily_vuln_counts.c.date <= end_date.date(),
                 )
             )
-            .group_by(func.date(Vulnerability.published_date))
-            .order_by(func.date(Vulnerability.published_date))
-            .all()
-        )
+            .order_by(mv_daily_vuln_counts.c.date)
+        ).mappings()
 
         # Convert to list of TrendDataPointSchema
-        data_points = []
-        for date_obj, detected in daily_counts:
-            data_points.append(
-                TrendDataPointSchema(
-                    date=date_obj.strftime("%Y-%m-%d") if hasattr(date_obj, 'strftime') else str(date_obj),
-                    detected=detected,
-                )
-            )
+        data_points = [
+            TrendDataPointSchema(date=row["date"], detected=row["detected"])
+            for row in daily_counts
+        ]
 
         logger.info(f"Dashboard trend data fetched: {len(data_points)} data points")
 
-        return TrendDataResponse(dataPoints=data_points)
+        result = TrendDataResponse(dataPoints=data_points)
+        dashboard_cache.set(("trend", days, etag), result)
+        return result
 
     except SQLAlchemyError as e:
         logger.error(f"Database error fetching dashboard trend: {str(e)}", exc_info=True)
@@ -179,7 +210,12 @@ async def get_dashboard_trend(
 
 
 @router.get("/severity-distribution", response_model=SeverityDistributionResponse, tags=["Dashboard"])
-async def get_severity_distribution(db: Session = Depends(get_db)):
+def get_severity_distribution(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    etag: str = Depends(compute_dashboard_etag),
+):
     """
     Get severity distribution data.
 
@@ -187,7 +223,10 @@ async def get_severity_distribution(db: Session = Depends(get_db)):
     - Counts of vulnerabilities by severity level (Critical/High/Medium/Low)
 
     Args:
+        request: FastAPI request object (If-None-Match)
+        response: FastAPI response object (ETag header)
         db: Database session (dependency injection)
+        etag: ETag for the current dashboard data (dependency injection)
 
     Returns:
         SeverityDistributionResponse: Severity distribution data
@@ -195,29 +234,29 @@ async def get_severity_distribution(db: Session = Depends(get_db)):
     Raises:
         HTTPException: 500 for server errors
     """
-    try:
-        logger.info("Fetching severity distribution data")
+    # Unchanged since the client's last request: 304 without building the response
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
 
-        # Query severity counts
-        severity_counts = (
-            db.query(
-                Vulnerability.severity,
-                func.count(Vulnerability.cve_id).label("count"),
-            )
-            .group_by(Vulnerability.severity)
-            .all()
-        )
+    # Served from the in-process cache (keyed by ETag, so a data change misses the cache)
+    result = dashboard_cache.get(("severity-distribution", etag))
+    if result is not None:
+        return result
 
-        # Convert to dictionary
-        distribution = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    try:
+        logger.info("Fetching severity distribution data")
 
-        for severity, count in severity_counts:
-            if severity:
-                distribution[severity.lower()] = count
+        # Query severity counts, pivoted to {severity: count} in SQL
+        totals = _severity_totals()
+        counts = db.scalar(select(func.json_object_agg(totals.c.severity, totals.c.total)))
+        distribution = {**_EMPTY_SEVERITY_COUNTS, **(counts or {})}
 
         logger.info(f"Severity distribution fetched: {distribution}")
 
-        return SeverityDistributionResponse(**distribution)
+        result = SeverityDistributionResponse.model_construct(**distribution)
+        dashboard_cache.set(("severity-distribution", etag), result)
+        return result
 
     except SQLAlchemyError as e:
         logger.error(f"Database error fetching severity distribution: {str(e)}", exc_info=True)
@@ -228,7 +267,12 @@ async def get_severity_distribution(db: Session = Depends(get_db)):
 
 
 @router.get("/asset-ranking", response_model=AssetRankingResponse, tags=["Dashboard"])
-async def get_asset_ranking(db: Session = Depends(get_db)):
+def get_asset_ranking(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    etag: str = Depends(compute_dashboard_etag),
+):
     """
     Get asset ranking by vulnerability count (TOP 10).
 
@@ -238,7 +282,10 @@ async def get_asset_ranking(db: Session = Depends(get_db)):
     - Limited to TOP 10 assets
 
     Args:
+        request: FastAPI request object (If-None-Match)
+        response: FastAPI response object (ETag header)
         db: Database session (dependency injection)
+        etag: ETag for the current dashboard data (dependency injection)
 
     Returns:
         AssetRankingResponse: Asset ranking data
@@ -246,53 +293,40 @@ async def get_asset_ranking(db: Session = Depends(get_db)):
     Raises:
         HTTPException: 500 for server errors
     """
+    # Unchanged since the client's last request: 304 without building the response
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+
+    # Served from the in-process cache (keyed by ETag, so a data change misses the cache)
+    result = dashboard_cache.get(("asset-ranking", etag))
+    if result is not None:
+        return result
+
     try:
         logger.info("Fetching asset ranking data")
 
-        # Query asset ranking with JOIN
-        # Count total vulnerabilities, critical, and high for each asset
-        ranking_query = (
-            db.query(
-                Asset.asset_id,
-                Asset.asset_name,
-                func.count(AssetVulnerabilityMatch.match_id).label("vulnerability_count"),
-                func.sum(
-                    case(
-                        (Vulnerability.severity == "Critical", 1),
-                        else_=0,
-                    )
-                ).label("critical_count"),
-                func.sum(
-                    case(
-                        (Vulnerability.severity == "High", 1),
-                        else_=0,
-                    )
-                ).label("high_count"),
+        # Query the pre-aggregated asset ranking (total, critical, and high counts per asset) as plain mappings
+        ranking_rows = db.execute(
+            select(
+                mv_asset_ranking.c.asset_id,
+                mv_asset_ranking.c.asset_name,
+                mv_asset_ranking.c.vulnerability_count,
+                mv_asset_ranking.c.critical_count,
+                mv_asset_ranking.c.high_count,
             )
-            .join(AssetVulnerabilityMatch, Asset.asset_id == AssetVulnerabilityMatch.asset_id)
-            .join(Vulnerability, AssetVulnerabilityMatch.cve_id == Vulnerability.cve_id)
-            .group_by(Asset.asset_id, Asset.asset_name)
-            .order_by(func.count(AssetVulnerabilityMatch.match_id).desc())
+            .order_by(mv_asset_ranking.c.vulnerability_count.desc())
             .limit(10)
-            .all()
-        )
+        ).mappings()
 
-        # Convert to list of AssetRankingItemSchema
-        ranking = []
-        for asset_id, asset_name, vuln_count, critical_count, high_count in ranking_query:
-            ranking.append(
-                AssetRankingItemSchema(
-                    asset_id=asset_id,
-                    asset_name=asset_name,
-                    vulnerability_count=vuln_count,
-                    critical_count=critical_count or 0,
-                    high_count=high_count or 0,
-                )
-            )
+        # Convert to list of AssetRankingItemSchema (column names match the schema fields)
+        ranking = [AssetRankingItemSchema(**row) for row in ranking_rows]
 
         logger.info(f"Asset ranking fetched: {len(ranking)} assets")
 
-        return AssetRankingResponse(ranking=ranking)
+        result = AssetRankingResponse(ranking=ranking)
+        dashboard_cache.set(("asset-ranking", etag), result)
+        return result
 
     except SQLAlchemyError as e:
         logger.error(f"Database error fetching asset ranking: {str(e)}", exc_info=True)
@@ -5,20 +5,22 @@ This module provides REST API endpoints for:
 - Matching execution (POST /api/matching/execute)
 - Matching results retrieval (GET /api/matching/results)
 - Asset-specific vulnerability list (GET /api/assets/{asset_id}/vulnerabilities)
+- Asset-specific vulnerability stream (GET /api/matching/assets/{asset_id}/vulnerabilities/stream)
 - Dashboard statistics (GET /api/matching/dashboard)
 """
 
 import logging
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import distinct, func
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import HTMLResponse, StreamingResponse
+from sqlalchemy import bindparam, distinct, func, select, tuple_
 from sqlalchemy.orm import Session
 
-from src.database import get_db
+from src.database import SessionLocal, get_db
 from src.models.asset import Asset, AssetVulnerabilityMatch
 from src.models.vulnerability import Vulnerability
 from src.schemas.matching import (
@@ -29,10 +31,57 @@ from src.schemas.matching import (
     MatchingResultResponse,
 )
 from src.services.matching_service import execute_full_matching
+from src.utils.http_cache import compute_dashboard_etag, not_modified
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.response_cache import dashboard_cache
+from src.utils.templates import templates
 
 router = APIRouter(tags=["matching"])
 logger = logging.getLogger(__name__)
-templates = Jinja2Templates(directory="src/templates")
+
+# Accepted filter values for matching results
+_VALID_SEVERITIES = frozenset({"Critical", "High", "Medium", "Low"})
+_VALID_SOURCES = frozenset({"manual", "composer", "npm", "docker"})
+
+# Matching results with asset and vulnerability details. Built once at import; handlers only
+# append filters and paging, so the statement's cache key is shared across requests and
+# SQLAlchemy reuses the compiled SQL.
+_MATCHING_RESULTS_STMT = (
+    select(
+        AssetVulnerabilityMatch.match_id,
+        AssetVulnerabilityMatch.asset_id,
+        Asset.asset_name,
+        AssetVulnerabilityMatch.cve_id,
+        Vulnerability.title.label("vulnerability_title"),
+        Vulnerability.severity,
+        Vulnerability.cvss_score,
+        AssetVulnerabilityMatch.match_reason,
+        AssetVulnerabilityMatch.matched_at,
+    )
+    .join(Asset, AssetVulnerabilityMatch.asset_id == Asset.asset_id)
+    .join(Vulnerability, AssetVulnerabilityMatch.cve_id == Vulnerability.cve_id)
+)
+
+# Vulnerabilities affecting one asset, highest CVSS first (asset_id is bound per request)
+_ASSET_VULNERABILITIES_STMT = (
+    select(
+        Vulnerability.cve_id,
+        Vulnerability.title,
+        Vulnerability.severity,
+        Vulnerability.cvss_score,
+        AssetVulnerabilityMatch.match_reason,
+        AssetVulnerabilityMatch.matched_at,
+    )
+    .join(AssetVulnerabilityMatch, Vulnerability.cve_id == AssetVulnerabilityMatch.cve_id)
+    .where(AssetVulnerabilityMatch.asset_id == bindparam("asset_id"))
+    .order_by(Vulnerability.cvss_score.desc().nullslast())
+)
+
+# Rows fetched per round trip when streaming an asset's vulnerabilities
+ASSET_VULNERABILITIES_STREAM_BATCH_SIZE = 500
+
+# Newest first; match_id breaks ties so keyset cursors are stable
+_MATCHING_RESULTS_ORDER = (AssetVulnerabilityMatch.matched_at.desc(), AssetVulnerabilityMatch.match_id.desc())
 
 
 @router.get("/matching", response_class=HTMLResponse, tags=["Frontend"])
@@ -53,7 +102,7 @@ async def get_matching_page(request: Request):
         HTMLResponse: Rendered HTML page
     """
     logger.info("Rendering matching results page")
-    return templates.TemplateResponse("matching_results.html", {"request": request})
+    return templates.TemplateResponse(request, "matching_results.html")
 
 
 @router.post("/api/matching/execute", response_model=MatchingExecutionResponse)
@@ -72,11 +121,11 @@ def execute_matching(db: Session = Depends(get_db)):
     """
     logger.info("Starting matching execution...")
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         stats = execute_full_matching(db)
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
         logger.info(f"Matching execution completed in {execution_time:.2f}s: {stats}")
 
@@ -95,83 +144,115 @@ def get_matching_results(
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
     severity: Optional[str] = Query(None, description="Filter by severity (Critical/High/Medium/Low)"),
     source: Optional[str] = Query(None, description="Filter by asset source (manual/composer/npm/docker)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous response's next_cursor"),
     db: Session = Depends(get_db),
 ):
     """
     Retrieve matching results with pagination and filtering.
 
+    With a cursor, the page is fetched by keyset (matched_at, match_id) instead of OFFSET,
+    so deep pages cost the same as the first one.
+
     Args:
-        page: Page number (starting from 1)
+        page: Page number (starting from 1; ignored when cursor is given)
         limit: Items per page (max 100)
         severity: Optional filter by severity level
         source: Optional filter by asset source type
+        cursor: Optional keyset cursor (next_cursor of the previous page)
         db: Database session
 
     Returns:
         Paginated matching results
     """
-    logger.info(f"Fetching matching results: page={page}, limit={limit}, severity={severity}, source={source}")
-
-    # Build query with joins
-    query = (
-        db.query(
-            AssetVulnerabilityMatch.match_id,
-            AssetVulnerabilityMatch.asset_id,
-            Asset.asset_name,
-            AssetVulnerabilityMatch.cve_id,
-            Vulnerability.title.label("vulnerability_title"),
-            Vulnerability.severity,
-            Vulnerability.cvss_score,
-            AssetVulnerabilityMatch.match_reason,
-            AssetVulnerabilityMatch.matched_at,
-        )
-        .join(Asset, AssetVulnerabilityMatch.asset_id == Asset.asset_id)
-        .join(Vulnerability, AssetVulnerabilityMatch.cve_id == Vulnerability.cve_id)
+    logger.info(
+        f"Fetching matching results: page={page}, limit={limit}, severity={severity}, source={source}, cursor={cursor}"
     )
 
+    stmt = _MATCHING_RESULTS_STMT
+
     # Apply filters
     if severity:
-        if severity not in ["Critical", "High", "Medium", "Low"]:
+        if severity not in _VALID_SEVERITIES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid severity: {severity}. Must be one of: Critical, High, Medium, Low",
             )
-        query = query.filter(Vulnerability.severity == severity)
+        stmt = stmt.where(Vulnerability.severity == severity)
 
     if source:
-        if source not in ["manual", "composer", "npm", "docker"]:
+        if source not in _VALID_SOURCES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid source: {source}. Must be one of: manual, composer, npm, docker",
             )
-        query = query.filter(Asset.source == source)
+        stmt = stmt.where(Asset.source == source)
+
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+
+    if cursor:
+        # Keyset pagination: seek past the previous page's last row instead of scanning an OFFSET
+        cursor_matched_at, cursor_match_id = decode_cursor(cursor)
+        results = (
+            db.execute(
+                stmt.where(
+                    tuple_(AssetVulnerabilityMatch.matched_at, AssetVulnerabilityMatch.match_id)
+                    < tuple_(cursor_matched_at, cursor_match_id)
+                )
+                .order_by(*_MATCHING_RESULTS_ORDER)
+                .limit(limit + 1)
+            )
+            .mappings()
+            .all()
+        )
+        total = db.scalar(count_stmt)
+    else:
+        # Apply pagination and sorting; the total comes from a window count in the same execution
+        offset = (page - 1) * limit
+        results = (
+            db.execute(
+                stmt.add_columns(func.count().over().label("_total"))
+                .order_by(*_MATCHING_RESULTS_ORDER)
+                .offset(offset)
+                .limit(limit + 1)
+            )
+            .mappings()
+            .all()
+        )
 
-    # Get total count
-    total = query.count()
+        if results:
+            total = results[0]["_total"]
+        elif offset:
+            # Page past the end: no row carries the window count, so count separately
+            total = db.scalar(count_stmt)
+        else:
+            total = 0
 
-    # Apply pagination and sorting
-    offset = (page - 1) * limit
-    results = query.order_by(AssetVulnerabilityMatch.matched_at.desc()).offset(offset).limit(limit).all()
+    # One extra row was fetched to know whether another page follows
+    has_more = len(results) > limit
+    results = results[:limit]
+    next_cursor = encode_cursor(results[-1]["matched_at"], results[-1]["match_id"]) if has_more else None
 
-    # Convert to response model
+    # Convert to response model (values come typed from the DB, so field validation is skipped)
     items = [
-        MatchingResultResponse(
-            match_id=str(r.match_id),
-            asset_id=str(r.asset_id),
-            asset_name=r.asset_name,
-            cve_id=r.cve_id,
-            vulnerability_title=r.vulnerability_title,
-            severity=r.severity,
-            cvss_score=r.cvss_score,
-            match_reason=r.match_reason,
-            matched_at=r.matched_at,
+        MatchingResultResponse.model_construct(
+            match_id=str(r["match_id"]),
+            asset_id=str(r["asset_id"]),
+            asset_name=r["asset_name"],
+            cve_id=r["cve_id"],
+            vulnerability_title=r["vulnerability_title"],
+            severity=r["severity"],
+            cvss_score=r["cvss_score"],
+            match_reason=r["match_reason"],
+            matched_at=r["matched_at"],
         )
         for r in results
     ]
 
     logger.info(f"Fetched {len(items)} matching results (total: {total})")
 
-    return MatchingResultListResponse(items=items, total=total, page=page, limit=limit)
+    return MatchingResultListResponse.model_construct(
+        items=items, total=total, page=page, limit=limit, has_more=has_more, next_cursor=next_cursor
+    )
 
 
 @router.get("/api/matching/assets/{asset_id}/vulnerabilities", response_model=AssetVulnerabilityListResponse)
@@ -197,38 +278,12 @@ def get_asset_vulnerabilities(asset_id: str, db: Session = Depends(get_db)):
         logger.warning(f"Asset not found: {asset_id}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Asset not found: {asset_id}")
 
-    # Get matching results for this asset
-    matches = (
-        db.query(
-            Vulnerability.cve_id,
-            Vulnerability.title,
-            Vulnerability.severity,
-            Vulnerability.cvss_score,
-            AssetVulnerabilityMatch.match_reason,
-            AssetVulnerabilityMatch.matched_at,
-        )
-        .join(AssetVulnerabilityMatch, Vulnerability.cve_id == AssetVulnerabilityMatch.cve_id)
-        .filter(AssetVulnerabilityMatch.asset_id == asset_id)
-        .order_by(Vulnerability.cvss_score.desc().nullslast())
-        .all()
-    )
-
-    # Convert to dict format
-    vulnerabilities = [
-        {
-            "cve_id": m.cve_id,
-            "title": m.title,
-            "severity": m.severity,
-            "cvss_score": m.cvss_score,
-            "match_reason": m.match_reason,
-            "matched_at": m.matched_at,
-        }
-        for m in matches
-    ]
+    # Get matching results for this asset (mappings already carry the response keys)
+    vulnerabilities = [dict(m) for m in db.execute(_ASSET_VULNERABILITIES_STMT, {"asset_id": asset_id}).mappings()]
 
     logger.info(f"Found {len(vulnerabilities)} vulnerabilities for asset {asset_id}")
 
-    return AssetVulnerabilityListResponse(
+    return AssetVulnerabilityListResponse.model_construct(
         asset_id=str(asset.asset_id),
         asset_name=asset.asset_name,
         vulnerabilities=vulnerabilities,
@@ -236,8 +291,55 @@ def get_asset_vulnerabilities(asset_id: str, db: Session = Depends(get_db)):
     )
 
 
+@router.get("/api/matching/assets/{asset_id}/vulnerabilities/stream", response_class=StreamingResponse)
+def stream_asset_vulnerabilities(asset_id: str, db: Session = Depends(get_db)):
+    """
+    Stream all vulnerabilities affecting a specific asset as NDJSON.
+
+    Streaming alternative to get_asset_vulnerabilities for assets with many matches:
+    rows are fetched in batches and written one JSON object per line, so memory stays
+    flat and the first rows are sent before the query is exhausted.
+
+    Args:
+        asset_id: Asset UUID
+        db: Database session (used for the existence check)
+
+    Returns:
+        StreamingResponse (application/x-ndjson), one vulnerability per line
+
+    Raises:
+        HTTPException: 404 if asset not found
+    """
+    logger.info(f"Streaming vulnerabilities for asset: {asset_id}")
+
+    # Check if asset exists (before the response starts, so a 404 can still be returned)
+    if db.query(Asset.asset_id).filter(Asset.asset_id == asset_id).first() is None:
+        logger.warning(f"Asset not found: {asset_id}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Asset not found: {asset_id}")
+
+    def generate() -> Iterator[bytes]:
+        # The stream outlives the request dependency, so it uses its own session
+        stream_db = SessionLocal()
+        try:
+            rows = stream_db.execute(
+                _ASSET_VULNERABILITIES_STMT.execution_options(yield_per=ASSET_VULNERABILITIES_STREAM_BATCH_SIZE),
+                {"asset_id": asset_id},
+            ).mappings()
+            for row in rows:
+                yield orjson.dumps(dict(row)) + b"\n"
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/api/matching/dashboard", response_model=DashboardResponse)
-def get_dashboard_stats(db: Session = Depends(get_db)):
+def get_dashboard_stats(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    etag: str = Depends(compute_dashboard_etag),
+):
     """
     Retrieve dashboard statistics.
 
@@ -248,43 +350,56 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
     - Last matching execution timestamp
 
     Args:
+        request: FastAPI request object (If-None-Match)
+        response: FastAPI response object (ETag header)
         db: Database session
+        etag: ETag for the current dashboard data
 
     Returns:
-        Dashboard statistics
+        Dashboard statistics (304 Not Modified if unchanged since the client's copy)
     """
-    logger.info("Fetching dashboard statistics...")
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
 
-    # Count affected assets (distinct)
-    affected_assets_count = db.query(func.count(distinct(AssetVulnerabilityMatch.asset_id))).scalar() or 0
+    # Served from the in-process cache (keyed by ETag, so a data change misses the cache)
+    result = dashboard_cache.get(("matching-dashboard", etag))
+    if result is not None:
+        return result
 
-    # Total matches
-    total_matches = db.query(func.count(AssetVulnerabilityMatch.match_id)).scalar() or 0
+    logger.info("Fetching dashboard statistics...")
 
-    # Count vulnerabilities by severity
-    severity_counts = (
-        db.query(Vulnerability.severity, func.count(distinct(AssetVulnerabilityMatch.match_id)))
-        .join(AssetVulnerabilityMatch, Vulnerability.cve_id == AssetVulnerabilityMatch.cve_id)
-        .group_by(Vulnerability.severity)
-        .all()
+    # All statistics in one pass over the matches (conditional aggregation per severity)
+    (
+        affected_assets_count,
+        total_matches,
+        critical_vulnerabilities,
+        high_vulnerabilities,
+        medium_vulnerabilities,
+        low_vulnerabilities,
+        last_matching_result,
+    ) = (
+        db.query(
+            func.count(distinct(AssetVulnerabilityMatch.asset_id)),
+            func.count(AssetVulnerabilityMatch.match_id),
+            func.count().filter(Vulnerability.severity == "Critical"),
+            func.count().filter(Vulnerability.severity == "High"),
+            func.count().filter(Vulnerability.severity == "Medium"),
+            func.count().filter(Vulnerability.severity == "Low"),
+            func.max(AssetVulnerabilityMatch.matched_at),
+        )
+        .select_from(AssetVulnerabilityMatch)
+        .outerjoin(Vulnerability, AssetVulnerabilityMatch.cve_id == Vulnerability.cve_id)
+        .one()
     )
 
-    severity_map = {severity: count for severity, count in severity_counts}
-    critical_vulnerabilities = severity_map.get("Critical", 0)
-    high_vulnerabilities = severity_map.get("High", 0)
-    medium_vulnerabilities = severity_map.get("Medium", 0)
-    low_vulnerabilities = severity_map.get("Low", 0)
-
-    # Last matching timestamp
-    last_matching_result = db.query(func.max(AssetVulnerabilityMatch.matched_at)).scalar()
-
     logger.info(
         f"Dashboard stats: affected_assets={affected_assets_count}, total_matches={total_matches}, "
         f"critical={critical_vulnerabilities}, high={high_vulnerabilities}, "
         f"medium={medium_vulnerabilities}, low={low_vulnerabilities}"
     )
 
-    return DashboardResponse(
+    result = DashboardResponse(
         affected_assets_count=affected_assets_count,
         total_matches=total_matches,
         critical_vulnerabilities=critical_vulnerabilities,
@@ -293,3 +408,5 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
         low_vulnerabilities=low_vulnerabilities,
         last_matching_at=last_matching_result,
     )
+    dashboard_cache.set(("matching-dashboard", etag), result)
+    return result
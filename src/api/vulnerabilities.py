@@ -5,32 +5,69 @@ This module provides REST API endpoints for vulnerability data:
 - GET / - HTML page rendering (Jinja2 template)
 - GET /api/vulnerabilities - JSON API with search, sort, pagination
 - GET /api/vulnerabilities/{cve_id} - Detailed vulnerability information
-- POST /api/fetch-now - Fetch latest vulnerabilities from JVN iPedia API
+- POST /api/fetch-now - Start fetching latest vulnerabilities from JVN iPedia API (background job)
+- GET /api/fetch-status/{job_id} - Progress and result of a fetch-now job
 """
 
+import asyncio
 import logging
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from src.database import get_db
+from src.database import SessionLocal, get_db
 from src.fetchers.jvn_fetcher import JVNFetcherService
 from src.schemas.vulnerability import VulnerabilityListResponse, VulnerabilityResponse
-from src.services.database_vulnerability_service import DatabaseVulnerabilityService
+from src.services.database_vulnerability_service import (
+    KEYSET_SORT_FIELDS,
+    UPSERT_BATCH_SIZE,
+    DatabaseVulnerabilityService,
+)
+from src.utils.http_cache import VULNERABILITY_DETAIL_CACHE_CONTROL
+from src.utils.pagination import decode_cursor
+from src.utils.response_cache import (
+    vulnerability_detail_cache,
+    vulnerability_list_cache,
+    vulnerability_missing_cache,
+)
+from src.utils.templates import templates
 
 logger = logging.getLogger(__name__)
 
 # Router for vulnerability endpoints
 router = APIRouter()
 
-# Jinja2 templates configuration
-templates = Jinja2Templates(directory="src/templates")
+# Accepted list sort parameters and their (preformatted) 400 error details
+_VALID_SORT_FIELDS = frozenset({"cve_id", "title", "published_date", "modified_date", "severity", "cvss_score"})
+_VALID_SORT_ORDERS = frozenset({"asc", "desc"})
+_SORT_FIELDS_MSG = f"Invalid sort_by parameter. Must be one of: {sorted(_VALID_SORT_FIELDS)}"
+_SORT_ORDERS_MSG = f"Invalid sort_order parameter. Must be one of: {sorted(_VALID_SORT_ORDERS)}"
+
+# Stored CVE IDs (same format as VulnerabilityCreate.cve_id); anything else cannot exist
+_CVE_ID_RE = re.compile(r"^CVE-\d{4}-\d{4,}$")
+
+
+def get_vulnerability_service(db: Session = Depends(get_db)) -> DatabaseVulnerabilityService:
+    """
+    Dependency injection of the vulnerability service, bound to the request's database session.
+
+    Args:
+        db: Database session (dependency injection)
+
+    Returns:
+        DatabaseVulnerabilityService: Service for this request
+    """
+    return DatabaseVulnerabilityService(db)
 
 
 @router.get("/", response_class=HTMLResponse, tags=["Frontend"])
@@ -48,11 +85,11 @@ async def get_vulnerabilities_page(request: Request):
         HTMLResponse: Rendered HTML page
     """
     logger.info("Rendering vulnerability list page")
-    return templates.TemplateResponse("vulnerabilities.html", {"request": request})
+    return templates.TemplateResponse(request, "vulnerabilities.html")
 
 
 @router.get("/api/vulnerabilities", response_model=VulnerabilityListResponse, tags=["API"])
-async def list_vulnerabilities(
+def list_vulnerabilities(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: Optional[int] = Query(None, ge=1, le=100, description="Number of items per page (deprecated, use limit)"),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Number of items per page"),
@@ -62,7 +99,10 @@ async def list_vulnerabilities(
     ),
     sort_order: str = Query("desc", description="Sort order (asc or desc)"),
     search: Optional[str] = Query(None, description="Search keyword (CVE ID or title)"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous response's next_cursor (date sorts only)"
+    ),
+    service: DatabaseVulnerabilityService = Depends(get_vulnerability_service),
 ):
     """
     Get paginated vulnerability list with search and sort functionality.
@@ -71,14 +111,16 @@ async def list_vulnerabilities(
     - Pagination (page, page_size)
     - Sorting (sort_by, sort_order)
     - Search (CVE ID or title partial match)
+    - Keyset pagination (cursor) when sorting by published_date or modified_date
 
     Args:
-        page: Page number (1-indexed)
+        page: Page number (1-indexed; ignored when cursor is given)
         page_size: Number of items per page (1-100)
         sort_by: Sort field
         sort_order: Sort order (asc or desc)
         search: Search keyword
-        db: Database session (dependency injection)
+        cursor: Keyset cursor (next_cursor of the previous page)
+        service: Vulnerability service (dependency injection)
 
     Returns:
         VulnerabilityListResponse: Paginated vulnerability list
@@ -88,42 +130,52 @@ async def list_vulnerabilities(
     """
     try:
         # Validate sort_by parameter
-        valid_sort_fields = {"cve_id", "title", "published_date", "modified_date", "severity", "cvss_score"}
-        if sort_by not in valid_sort_fields:
+        if sort_by not in _VALID_SORT_FIELDS:
             logger.warning(f"Invalid sort_by parameter: {sort_by}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid sort_by parameter. Must be one of: {valid_sort_fields}",
-            )
+            raise HTTPException(status_code=400, detail=_SORT_FIELDS_MSG)
 
         # Validate sort_order parameter
-        valid_sort_orders = {"asc", "desc"}
-        if sort_order not in valid_sort_orders:
+        if sort_order not in _VALID_SORT_ORDERS:
             logger.warning(f"Invalid sort_order parameter: {sort_order}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid sort_order parameter. Must be one of: {valid_sort_orders}",
-            )
+            raise HTTPException(status_code=400, detail=_SORT_ORDERS_MSG)
+
+        # Keyset cursors encode the sort date, so they only apply to date sorts
+        decoded_cursor = None
+        if cursor:
+            if sort_by not in KEYSET_SORT_FIELDS:
+                logger.warning(f"Cursor used with unsupported sort_by: {sort_by}")
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cursor pagination requires sort_by to be one of: {sorted(KEYSET_SORT_FIELDS)}",
+                )
+            decoded_cursor = decode_cursor(cursor)
 
         # Support both 'limit' and 'page_size' parameters (limit takes precedence)
         items_per_page = limit or page_size or 50
 
         logger.info(
             f"API request: page={page}, limit={items_per_page}, "
-            f"sort_by={sort_by}, sort_order={sort_order}, search={search}"
+            f"sort_by={sort_by}, sort_order={sort_order}, search={search}, cursor={cursor}"
         )
 
+        # Served from the in-process cache (cleared whenever vulnerabilities are written)
+        cache_key = (page, items_per_page, sort_by, sort_order, search, cursor)
+        result = vulnerability_list_cache.get(cache_key)
+        if result is not None:
+            return result
+
         # Use database service for real data
-        service = DatabaseVulnerabilityService(db)
         result = service.search_vulnerabilities(
             page=page,
             page_size=items_per_page,
             sort_by=sort_by,
             sort_order=sort_order,
             search=search,
+            cursor=decoded_cursor,
         )
 
         logger.info(f"Returning {len(result.items)} vulnerabilities (page {page}/{result.total_pages})")
+        vulnerability_list_cache.set(cache_key, result)
         return result
 
     except HTTPException:
@@ -141,7 +193,11 @@ async def list_vulnerabilities(
     response_model=VulnerabilityResponse,
     tags=["API"],
 )
-async def get_vulnerability_detail(cve_id: str, db: Session = Depends(get_db)):
+def get_vulnerability_detail(
+    cve_id: str,
+    response: Response,
+    service: DatabaseVulnerabilityService = Depends(get_vulnerability_service),
+):
     """
     Get detailed vulnerability information by CVE ID.
 
@@ -150,26 +206,40 @@ async def get_vulnerability_detail(cve_id: str, db: Session = Depends(get_db)):
 
     Args:
         cve_id: CVE identifier (e.g., CVE-2024-0001)
-        db: Database session (dependency injection)
+        response: FastAPI response object (Cache-Control header)
+        service: Vulnerability service (dependency injection)
 
     Returns:
         VulnerabilityResponse: Detailed vulnerability information
 
     Raises:
-        HTTPException: 404 if CVE not found, 500 for server errors
+        HTTPException: 400 for a malformed CVE ID, 404 if CVE not found, 500 for server errors
     """
+    # Malformed IDs are rejected without a database lookup
+    if not _CVE_ID_RE.match(cve_id):
+        raise HTTPException(status_code=400, detail=f"Invalid CVE ID format: {cve_id}")
+
+    # Recently looked up and not found: answer 404 again without a database lookup
+    if vulnerability_missing_cache.get(cve_id):
+        raise HTTPException(status_code=404, detail=f"Vulnerability not found: {cve_id}")
+
     try:
         logger.info(f"API request for vulnerability detail: {cve_id}")
 
-        # Use database service for real data
-        service = DatabaseVulnerabilityService(db)
-        vulnerability = service.get_vulnerability_by_cve_id(cve_id)
+        # Served from the in-process cache (cleared whenever vulnerabilities are written)
+        vulnerability = vulnerability_detail_cache.get(cve_id)
+        if vulnerability is None:
+            # Use database service for real data
+            vulnerability = service.get_vulnerability_by_cve_id(cve_id)
 
-        if not vulnerability:
-            logger.warning(f"Vulnerability not found: {cve_id}")
-            raise HTTPException(status_code=404, detail=f"Vulnerability not found: {cve_id}")
+            if not vulnerability:
+                logger.warning(f"Vulnerability not found: {cve_id}")
+                vulnerability_missing_cache.set(cve_id, True)
+                raise HTTPException(status_code=404, detail=f"Vulnerability not found: {cve_id}")
+            vulnerability_detail_cache.set(cve_id, vulnerability)
 
         logger.info(f"Returning vulnerability detail: {cve_id}")
+        response.headers["Cache-Control"] = VULNERABILITY_DETAIL_CACHE_CONTROL
         return vulnerability
 
     except HTTPException:
@@ -183,9 +253,18 @@ async def get_vulnerability_detail(cve_id: str, db: Session = Depends(get_db)):
 
 
 class FetchNowResponse(BaseModel):
-    """Response model for fetch-now endpoint"""
+    """Response model for fetch-now endpoint (the job runs in the background)"""
+
+    job_id: str
+    status: str
+    status_url: str
+
 
-    success: bool
+class FetchStatusResponse(BaseModel):
+    """Response model for fetch-status endpoint"""
+
+    job_id: str
+    status: str  # running / completed / failed
     message: str
     fetched: int
     inserted: int
@@ -194,77 +273,174 @@ class FetchNowResponse(BaseModel):
     elapsed_seconds: float
 
 
-@router.post("/api/fetch-now", response_model=FetchNowResponse, tags=["API"])
-async def fetch_vulnerabilities_now(db: Session = Depends(get_db)):
-    """
-    Fetch latest vulnerabilities from JVN iPedia API in real-time.
+# In-process fetch job registry: at most one job runs at a time, and the most recent
+# FETCH_JOB_HISTORY jobs stay queryable through /api/fetch-status/{job_id}
+FETCH_JOB_HISTORY = 20
+_fetch_jobs: "OrderedDict[str, dict]" = OrderedDict()
+_fetch_lock = threading.Lock()
 
-    This endpoint triggers an immediate fetch of vulnerability data from JVN iPedia API
-    and stores it in the database. It uses differential fetching (fetches only new/updated
-    data since last fetch) for better performance.
+
+def _start_fetch_job() -> Optional[dict]:
+    """
+    Register a new fetch job unless one is already running.
 
     Returns:
-        FetchNowResponse: Result of the fetch operation
+        Optional[dict]: The new job's status record, or None if a fetch is already running
+    """
+    with _fetch_lock:
+        if any(job["status"] == "running" for job in _fetch_jobs.values()):
+            return None
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "status": "running",
+            "message": "Fetch in progress",
+            "fetched": 0,
+            "inserted": 0,
+            "updated": 0,
+            "failed": 0,
+            "elapsed_seconds": 0.0,
+        }
+        _fetch_jobs[job_id] = job
+        while len(_fetch_jobs) > FETCH_JOB_HISTORY:
+            _fetch_jobs.popitem(last=False)
+        return job
+
+
+async def _run_fetch_job(job: dict) -> None:
+    """
+    Fetch from JVN iPedia and store the results, updating the job record after every batch.
 
-    Raises:
-        HTTPException: 500 for server errors
+    Runs after the fetch-now response has been sent, so it uses its own database session.
+
+    Args:
+        job: Status record created by _start_fetch_job
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
+    db = SessionLocal()
 
     try:
-        logger.info("Manual fetch triggered via API")
-
-        # Initialize services
-        fetcher = JVNFetcherService()
         service = DatabaseVulnerabilityService(db)
 
         # Get latest modified date from database for differential fetching
-        latest_modified = service.get_latest_modified_date()
-
-        # Determine fetch strategy
-        if latest_modified:
-            # Differential fetch: only fetch data modified since last update
-            logger.info(f"Differential fetch: fetching data since {latest_modified}")
-            latest_date = datetime.fromisoformat(latest_modified)
-            # Fetch from last modified date to now
-            vulnerabilities = await fetcher.fetch_since_last_update(latest_date)
-        else:
-            # Initial fetch: fetch last 3 years of data
-            logger.info("Initial fetch: no existing data, fetching last 3 years")
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=3 * 365)
-            logger.info(f"Fetching vulnerabilities from {start_date.date()} to {end_date.date()}")
-            vulnerabilities = await fetcher.fetch_vulnerabilities(
-                start_date=start_date.strftime("%Y-%m-%d"), end_date=end_date.strftime("%Y-%m-%d")
-            )
-
-        fetched_count = len(vulnerabilities)
-        logger.info(f"Fetched {fetched_count} vulnerabilities from JVN iPedia API")
-
-        # Store in database (service already initialized above)
-        result = service.upsert_vulnerabilities_batch(vulnerabilities)
-
-        elapsed = (datetime.now() - start_time).total_seconds()
+        latest_modified = await asyncio.to_thread(service.get_latest_modified_date)
+
+        buffer: list = []
+
+        def flush() -> None:
+            # Pages are stored in UPSERT_BATCH_SIZE batches while the download continues,
+            # so memory stays bounded by one batch instead of the whole date range
+            stats = service.upsert_vulnerabilities_batch(buffer)
+            with _fetch_lock:
+                for key in ("inserted", "updated", "failed"):
+                    job[key] += stats[key]
+                job["elapsed_seconds"] = time.perf_counter() - start_time
+            buffer.clear()
+
+        async with JVNFetcherService() as fetcher:
+            # Determine fetch strategy
+            if latest_modified:
+                # Differential fetch: only fetch data modified since last update
+                logger.info(f"Differential fetch: fetching data since {latest_modified.isoformat()}")
+                pages = fetcher.iter_since_last_update(latest_modified)
+            else:
+                # Initial fetch: fetch last 3 years of data
+                logger.info("Initial fetch: no existing data, fetching last 3 years")
+                end_date = datetime.now()
+                start_date = end_date - timedelta(days=3 * 365)
+                logger.info(f"Fetching vulnerabilities from {start_date.date()} to {end_date.date()}")
+                pages = fetcher.iter_vulnerabilities(
+                    start_date=start_date.strftime("%Y-%m-%d"), end_date=end_date.strftime("%Y-%m-%d")
+                )
+
+            async for page in pages:
+                job["fetched"] += len(page)
+                buffer.extend(page)
+                if len(buffer) >= UPSERT_BATCH_SIZE:
+                    # The Session is synchronous: write from a worker thread to keep the event loop free
+                    await asyncio.to_thread(flush)
+
+            if buffer:
+                await asyncio.to_thread(flush)
+
+        logger.info(f"Fetched {job['fetched']} vulnerabilities from JVN iPedia API")
+
+        if job["inserted"] or job["updated"]:
+            await asyncio.to_thread(service.refresh_dashboard_views)
+
+        with _fetch_lock:
+            job["elapsed_seconds"] = time.perf_counter() - start_time
+            job["message"] = f"Successfully fetched {job['fetched']} vulnerabilities from JVN iPedia"
+            job["status"] = "completed"
 
         logger.info(
-            f'Fetch completed: fetched={fetched_count}, inserted={result["inserted"]}, '
-            f'updated={result["updated"]}, failed={result["failed"]}, elapsed={elapsed:.2f}s'
-        )
-
-        return FetchNowResponse(
-            success=True,
-            message=f"Successfully fetched {fetched_count} vulnerabilities from JVN iPedia",
-            fetched=fetched_count,
-            inserted=result["inserted"],
-            updated=result["updated"],
-            failed=result["failed"],
-            elapsed_seconds=elapsed,
+            f'Fetch completed: fetched={job["fetched"]}, inserted={job["inserted"]}, '
+            f'updated={job["updated"]}, failed={job["failed"]}, elapsed={job["elapsed_seconds"]:.2f}s'
         )
 
     except Exception as e:
-        elapsed = (datetime.now() - start_time).total_seconds()
         logger.error(f"Error during manual fetch: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to fetch vulnerabilities: {str(e)}",
-        )
+        with _fetch_lock:
+            job["elapsed_seconds"] = time.perf_counter() - start_time
+            job["message"] = f"Failed to fetch vulnerabilities: {str(e)}"
+            job["status"] = "failed"
+    finally:
+        db.close()
+
+
+@router.post("/api/fetch-now", response_model=FetchNowResponse, status_code=202, tags=["API"])
+async def fetch_vulnerabilities_now(background_tasks: BackgroundTasks):
+    """
+    Start fetching the latest vulnerabilities from JVN iPedia API in the background.
+
+    The fetch uses differential fetching (only new/updated data since the last fetch)
+    and stores the results in the database. The response returns immediately with a job ID;
+    poll GET /api/fetch-status/{job_id} for progress and the final counts.
+
+    Args:
+        background_tasks: FastAPI background tasks (runs the fetch after the response)
+
+    Returns:
+        FetchNowResponse: ID and status URL of the started job
+
+    Raises:
+        HTTPException: 409 if a fetch is already running
+    """
+    logger.info("Manual fetch triggered via API")
+
+    job = _start_fetch_job()
+    if job is None:
+        logger.warning("Manual fetch rejected: a fetch is already running")
+        raise HTTPException(status_code=409, detail="A fetch is already running")
+
+    background_tasks.add_task(_run_fetch_job, job)
+
+    return FetchNowResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        status_url=f"/api/fetch-status/{job['job_id']}",
+    )
+
+
+@router.get("/api/fetch-status/{job_id}", response_model=FetchStatusResponse, tags=["API"])
+async def get_fetch_status(job_id: str):
+    """
+    Get the progress or result of a fetch-now job.
+
+    Args:
+        job_id: Job ID returned by POST /api/fetch-now
+
+    Returns:
+        FetchStatusResponse: Current job status and counts
+
+    Raises:
+        HTTPException: 404 if the job is unknown (or no longer retained)
+    """
+    # Copy under the lock: the job's worker thread updates the record while the fetch runs
+    with _fetch_lock:
+        job = _fetch_jobs.get(job_id)
+        snapshot = dict(job) if job is not None else None
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"Fetch job not found: {job_id}")
+    return FetchStatusResponse(**snapshot)
@@ -15,14 +15,21 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits (also reported by get_pool_status)
+POOL_SIZE = 20  # Maximum number of connections in the pool
+MAX_OVERFLOW = 20  # Overflow up to 40, the default threadpool size that runs the sync endpoints
+
 # SQLAlchemy engine
 # Connection pooling is configured for production use
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
     pool_pre_ping=True,  # Verify connections before using them
-    pool_size=5,  # Maximum number of connections in the pool
-    max_overflow=10,  # Maximum overflow connections
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_use_lifo=True,  # Reuse the most recent connection so surplus ones idle out and get recycled
+    pool_timeout=30,  # Seconds to wait for a free connection before failing
+    pool_recycle=1800,  # Replace connections older than 30 minutes (managed Postgres drops idle ones)
 )
 
 # Session factory
@@ -31,6 +38,7 @@ SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
+    expire_on_commit=False,  # Loaded objects stay readable after commit without a re-SELECT per attribute
 )
 
 
@@ -81,7 +89,8 @@ def init_db() -> None:
         >>> from src.database import init_db
         >>> init_db()  # Creates all tables
     """
-    from src.models.vulnerability import Base
+    # Import the package so every model (vulnerabilities, assets, sync_state) is registered on Base
+    from src.models import Base
 
     logger.info("Initializing database tables...")
     Base.metadata.create_all(bind=engine)
@@ -109,14 +118,14 @@ def check_db_connection() -> bool:
     import time
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         db = SessionLocal()
 
         # Execute simple query to verify connection (SQLAlchemy 2.0 style)
         result = db.execute(text("SELECT 1"))
         result.scalar()
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.debug(f"Database health check completed in {elapsed:.3f}s")
 
         db.close()
@@ -126,6 +135,31 @@ def check_db_connection() -> bool:
         return False
 
 
+def get_pool_status() -> dict:
+    """
+    Get connection pool statistics.
+
+    Used by the pool debug endpoint (/api/debug/pool) to check for pool exhaustion
+    under dashboard polling.
+
+    Returns:
+        dict: Pool size, checked-in/checked-out connections and current overflow
+
+    Example:
+        >>> from src.database import get_pool_status
+        >>> get_pool_status()
+        {'pool_size': 20, 'max_overflow': 20, 'checked_in': 2, 'checked_out': 1, 'overflow': -17}
+    """
+    pool = engine.pool
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
 def close_db() -> None:
     """
     Close database connections.
@@ -3,9 +3,9 @@ JVN iPedia API Fetcher Service.
 
 This module provides functionality to fetch vulnerability data from JVN iPedia API.
 It implements:
-- XML response parsing
+- XML response parsing (lxml)
 - Differential data fetching
-- Pagination handling
+- Pagination handling (pages fetched concurrently)
 - Timeout settings
 - Rate limiting
 - Retry logic with exponential backoff
@@ -15,18 +15,47 @@ JVN iPedia API Documentation: https://jvndb.jvn.jp/apis/myjvn/
 
 import asyncio
 import logging
+import random
+import re
 import time
-import xml.etree.ElementTree as ET
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterator, List, Optional
 
 import httpx
+from lxml import etree as ET
 
 from src.config import settings
 from src.schemas.vulnerability import VulnerabilityCreate
+from src.utils.page_cache import PageCache
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared HTTP client
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# Client error statuses worth retrying (request timeout, throttling); other 4xx fail immediately
+RETRYABLE_CLIENT_ERROR_STATUSES = frozenset({408, 429})
+
+# Characters fed to the incremental XML parser at a time
+XML_FEED_CHUNK_SIZE = 64 * 1024
+
+# XML namespaces of JVN iPedia API responses (overview list / detail)
+_NS = {
+    "status": "http://jvndb.jvn.jp/myjvn/Status",
+    "rss": "http://purl.org/rss/1.0/",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "sec": "http://jvn.jp/rss/mod_sec/3.0/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+}
+_VULDEF_NS = {"vuldef": "http://jvn.jp/vuldef/"}
+
+# CVE ID and JVNDB ID patterns (compiled once, used for every item)
+_CVE_RE = re.compile(r"CVE-\d{4}-\d{4,}")
+_JVNDB_ID_RE = re.compile(r"JVNDB-\d{4}-\d+")
+
 
 class JVNFetcherError(Exception):
     """Base exception for JVN Fetcher errors."""
@@ -52,7 +81,7 @@ class JVNFetcherService:
 
     This service implements all required features for M1 milestone:
     - M1.1: JVNFetcherService class creation
-    - M1.2: XML response parsing (xml.etree.ElementTree)
+    - M1.2: XML response parsing (lxml)
     - M1.3: Differential fetching logic (lastModStartDate/lastModEndDate)
     - M1.4: Pagination handling (50 items/request)
     - M1.5: Timeout setting (30 seconds)
@@ -67,14 +96,26 @@ class JVNFetcherService:
     """
 
     # XML namespace for JVN iPedia API
-    NAMESPACES = {
-        "status": "http://jvndb.jvn.jp/myjvn/Status",
-        "rss": "http://purl.org/rss/1.0/",
-        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-        "sec": "http://jvn.jp/rss/mod_sec/3.0/",
-        "dc": "http://purl.org/dc/elements/1.1/",
-        "dcterms": "http://purl.org/dc/terms/",
-    }
+    NAMESPACES = _NS
+
+    # Fully-qualified (Clark notation) tags read from each <item>, so find() needs no prefix lookup
+    _TAG_ITEM = f"{{{_NS['rss']}}}item"
+    _TAG_TITLE = f"{{{_NS['rss']}}}title"
+    _TAG_LINK = f"{{{_NS['rss']}}}link"
+    _TAG_DESCRIPTION = f"{{{_NS['rss']}}}description"
+    _TAG_IDENTIFIER = f"{{{_NS['sec']}}}identifier"
+    _TAG_REFERENCES = f"{{{_NS['sec']}}}references"
+    _TAG_CVSS = f"{{{_NS['sec']}}}cvss"
+    _TAG_DATE = f"{{{_NS['dc']}}}date"
+    _TAG_MODIFIED = f"{{{_NS['dcterms']}}}modified"
+    _TEXT_TAGS = frozenset({_TAG_TITLE, _TAG_LINK, _TAG_DESCRIPTION, _TAG_IDENTIFIER, _TAG_DATE, _TAG_MODIFIED})
+
+    # Detail response (VULDEF): affected items are located with a precompiled XPath
+    _XP_AFFECTED_ITEMS = ET.XPath(".//vuldef:AffectedItem", namespaces=_VULDEF_NS)
+    _TAG_VULDEF_NAME = f"{{{_VULDEF_NS['vuldef']}}}Name"
+    _TAG_VULDEF_PRODUCT_NAME = f"{{{_VULDEF_NS['vuldef']}}}ProductName"
+    _TAG_VULDEF_CPE = f"{{{_VULDEF_NS['vuldef']}}}Cpe"
+    _TAG_VULDEF_VERSION_NUMBER = f"{{{_VULDEF_NS['vuldef']}}}VersionNumber"
 
     def __init__(self) -> None:
         """Initialize JVN Fetcher Service with configuration from settings."""
@@ -83,13 +124,86 @@ class JVNFetcherService:
         self.max_retries = settings.JVN_API_MAX_RETRIES
         self.retry_delay = settings.JVN_API_RETRY_DELAY
         self.rate_limit_delay = 0.4  # 0.4 seconds = 2.5 requests/second
-        self.last_request_time = 0.0
+        # Leaky bucket: monotonic time of the next free request slot
+        self._next_request_time = 0.0
+
+        # Concurrent page requests (request starts are still spaced by rate_limit_delay)
+        self.max_concurrent_requests = settings.JVN_API_MAX_CONCURRENT_REQUESTS
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        # On-disk conditional page cache (disabled unless JVN_API_CACHE_DIR is set)
+        self._page_cache: Optional[PageCache] = None
+        if settings.JVN_API_CACHE_DIR:
+            self._page_cache = PageCache(settings.JVN_API_CACHE_DIR, ttl=settings.JVN_API_CACHE_TTL_DAYS * 86400)
+
+        # Shared HTTP client, open while the service is used as an async context manager
+        self._client: Optional[httpx.AsyncClient] = None
 
         logger.info(
             f"JVN Fetcher Service initialized: endpoint={self.api_endpoint}, "
             f"timeout={self.timeout}s, max_retries={self.max_retries}"
         )
 
+    async def __aenter__(self) -> "JVNFetcherService":
+        """
+        Open a shared HTTP client so every request reuses pooled connections.
+
+        Example:
+            >>> async with JVNFetcherService() as service:
+            ...     vulnerabilities = await service.fetch_vulnerabilities(start_date='2024-01-01')
+        """
+        self._client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_LIMITS)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @asynccontextmanager
+    async def _client_scope(self) -> AsyncIterator[None]:
+        """
+        Keep one shared HTTP client open for a multi-request operation.
+
+        Reuses the client opened by ``async with``; otherwise opens one for the duration
+        of the operation, so all of its pages share pooled keep-alive connections.
+        """
+        if self._client is not None:
+            yield
+            return
+
+        await self.__aenter__()
+        try:
+            yield
+        finally:
+            await self.__aexit__()
+
+    async def _get(self, params: dict, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        Send a GET request to the API endpoint.
+
+        Reuses the shared client inside ``async with``; otherwise opens a one-off client.
+
+        Args:
+            params: Request parameters
+            headers: Additional request headers (e.g. conditional request headers)
+
+        Returns:
+            httpx.Response: Successful or 304 Not Modified response
+
+        Raises:
+            httpx.HTTPStatusError: When API returns an error status
+        """
+        if self._client is not None:
+            response = await self._client.get(self.api_endpoint, params=params, headers=headers)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.api_endpoint, params=params, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
     async def fetch_vulnerabilities(
         self,
         start_date: Optional[str] = None,
@@ -124,60 +238,162 @@ class JVNFetcherService:
             >>> len(vulnerabilities)
             150
         """
+        all_vulnerabilities: List[VulnerabilityCreate] = []
+
+        async for page in self.iter_vulnerabilities(
+            start_date=start_date, end_date=end_date, max_items=max_items, use_modified_date=use_modified_date
+        ):
+            all_vulnerabilities.extend(page)
+
+        return all_vulnerabilities
+
+    async def iter_vulnerabilities(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_items: Optional[int] = None,
+        use_modified_date: bool = False,
+    ) -> AsyncIterator[List[VulnerabilityCreate]]:
+        """
+        Fetch vulnerabilities from JVN iPedia API page by page.
+
+        Yields each page as soon as it is parsed, so callers can store results
+        without holding the whole date range in memory.
+
+        Args:
+            start_date: Start date for differential fetching (ISO 8601: YYYY-MM-DD)
+            end_date: End date for differential fetching (ISO 8601: YYYY-MM-DD)
+            max_items: Maximum number of items to fetch (None = fetch all)
+            use_modified_date: If True, filter by modified date; if False, filter by published date
+
+        Yields:
+            List of VulnerabilityCreate objects for one page
+
+        Raises:
+            JVNAPIError: When API returns an error
+            JVNParseError: When XML parsing fails
+        """
         logger.info(
             f"Starting vulnerability fetch: start_date={start_date}, end_date={end_date}, max_items={max_items}"
         )
 
-        all_vulnerabilities: List[VulnerabilityCreate] = []
+        total = 0
+        pages = 0
         start_item = 1
+        next_start_item = 1
         items_per_page = 50  # JVN iPedia API maximum
 
-        while True:
-            # Check if we've reached the maximum items limit
-            if max_items and len(all_vulnerabilities) >= max_items:
-                logger.info(f"Reached maximum items limit: {max_items}")
-                all_vulnerabilities = all_vulnerabilities[:max_items]
-                break
+        # The API does not report the total count, so the first page shows whether more exist;
+        # while pages come back full, the following pages are fetched ahead of the consumer,
+        # keeping at most max_concurrent_requests pages in flight
+        pending: deque = deque()
 
-            # Calculate how many items to fetch in this page
-            fetch_count = items_per_page
-            if max_items:
-                remaining = max_items - len(all_vulnerabilities)
-                fetch_count = min(items_per_page, remaining)
-
-            # Fetch one page of results
+        # One pooled client for every page of this fetch
+        async with self._client_scope():
             try:
                 vulnerabilities = await self._fetch_page(
                     start_date=start_date,
                     end_date=end_date,
                     start_item=start_item,
-                    max_count=fetch_count,
+                    max_count=self._page_item_count(start_item, items_per_page, max_items),
                     use_modified_date=use_modified_date,
                 )
-            except JVNAPIError as e:
-                logger.error(f"API error during pagination: {e}")
-                raise
-            except JVNParseError as e:
-                logger.error(f"Parse error during pagination: {e}")
+                next_start_item += items_per_page
+
+                while True:
+                    if not vulnerabilities:
+                        logger.info(f"No more vulnerabilities found at start_item={start_item}")
+                        break
+
+                    if max_items:
+                        vulnerabilities = vulnerabilities[: max_items - total]
+
+                    total += len(vulnerabilities)
+                    is_last_page = len(vulnerabilities) < items_per_page or (max_items and total >= max_items)
+
+                    # Speculatively request the following pages before handing this one out
+                    if not is_last_page:
+                        next_start_item = self._prefetch_pages(
+                            pending, next_start_item, items_per_page, max_items, start_date, end_date, use_modified_date
+                        )
+
+                    pages += 1
+                    yield vulnerabilities
+
+                    # Check if we've fetched all available items
+                    if len(vulnerabilities) < items_per_page:
+                        logger.info("Fetched all available vulnerabilities (last page was incomplete)")
+                        break
+
+                    # Check if we've reached the maximum items limit
+                    if max_items and total >= max_items:
+                        logger.info(f"Reached maximum items limit: {max_items}")
+                        break
+
+                    if not pending:
+                        break
+
+                    # Move to next page
+                    start_item, task = pending.popleft()
+                    vulnerabilities = await task
+
+            except (JVNAPIError, JVNParseError) as e:
+                logger.error(f"{e.__class__.__name__} during pagination: {e}")
                 raise
+            finally:
+                # Discard pages requested beyond the last one
+                for _, task in pending:
+                    task.cancel()
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
 
-            if not vulnerabilities:
-                logger.info(f"No more vulnerabilities found at start_item={start_item}")
-                break
+        logger.info(f"Completed vulnerability fetch: total={total} items in {pages} pages")
 
-            all_vulnerabilities.extend(vulnerabilities)
-            logger.info(f"Fetched {len(vulnerabilities)} vulnerabilities (total: {len(all_vulnerabilities)})")
+    def _prefetch_pages(
+        self,
+        pending: deque,
+        next_start_item: int,
+        items_per_page: int,
+        max_items: Optional[int],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        use_modified_date: bool,
+    ) -> int:
+        """
+        Start fetching the following pages until max_concurrent_requests pages are pending.
 
-            # Check if we've fetched all available items
-            if len(vulnerabilities) < items_per_page:
-                logger.info("Fetched all available vulnerabilities (last page was incomplete)")
-                break
+        Args:
+            pending: Queue of (start_item, task) for pages already requested, in page order
+            next_start_item: Starting item index of the next page to request
+            items_per_page: Items per page
+            max_items: Maximum number of items to fetch (None = fetch all)
+            start_date: Start date for differential fetching
+            end_date: End date for differential fetching
+            use_modified_date: If True, filter by modified date; if False, filter by published date
+
+        Returns:
+            Starting item index of the page after the last one requested
+        """
+        while len(pending) < self.max_concurrent_requests and (not max_items or next_start_item <= max_items):
+            task = asyncio.create_task(
+                self._fetch_page(
+                    start_date=start_date,
+                    end_date=end_date,
+                    start_item=next_start_item,
+                    max_count=self._page_item_count(next_start_item, items_per_page, max_items),
+                    use_modified_date=use_modified_date,
+                )
+            )
+            pending.append((next_start_item, task))
+            next_start_item += items_per_page
 
-            # Move to next page
-            start_item += items_per_page
+        return next_start_item
 
-        logger.info(f"Completed vulnerability fetch: total={len(all_vulnerabilities)} items")
-        return all_vulnerabilities
+    @staticmethod
+    def _page_item_count(start_item: int, items_per_page: int, max_items: Optional[int]) -> int:
+        """Number of items to request for the page starting at start_item (1-indexed)."""
+        if max_items:
+            return min(items_per_page, max_items - start_item + 1)
+        return items_per_page
 
     def _handle_retry_error(self, error: Exception, attempt: int, error_type: str) -> None:
         """Handle retry errors with consistent logging."""
@@ -199,7 +415,8 @@ class JVNFetcherService:
         use_modified_date: bool = False,
     ) -> List[VulnerabilityCreate]:
         """
-        Fetch a single page of vulnerabilities from JVN iPedia API.
+        Fetch a single page of vulnerabilities from JVN iPedia API, bounded by the
+        concurrent request semaphore.
 
         This method implements M1.5 (timeout) and M1.6 (rate limiting).
 
@@ -216,76 +433,165 @@ class JVNFetcherService:
         Raises:
             JVNAPIError: When API returns an error or max retries exceeded
         """
-        # Rate limiting (M1.6)
-        await self._apply_rate_limit()
-
         # Build request parameters
         params = self._build_request_params(start_date, end_date, start_item, max_count, use_modified_date)
 
+        async with self._request_semaphore:
+            return await self._fetch_with_retry(params, start_item)
+
+    async def _fetch_with_retry(self, params: dict, start_item: int) -> List[VulnerabilityCreate]:
+        """
+        Request and parse one page with retry logic (exponential backoff).
+
+        Args:
+            params: Request parameters
+            start_item: Starting item index (for logging)
+
+        Returns:
+            List of VulnerabilityCreate objects for this page
+
+        Raises:
+            JVNAPIError: When API returns an error or max retries exceeded
+        """
+        # Rate limiting (M1.6)
+        await self._apply_rate_limit()
+
         # Retry logic with exponential backoff
         for attempt in range(1, self.max_retries + 1):
+            retry_after = None
             try:
-                logger.debug(f"Fetching page: start_item={start_item}, attempt={attempt}/{self.max_retries}")
-
                 # M1.5: Timeout setting (30 seconds)
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(self.api_endpoint, params=params)
-                    response.raise_for_status()
-
-                # Parse XML response (M1.2)
-                vulnerabilities = self._parse_xml_response(response.text)
-                logger.debug(f"Successfully parsed {len(vulnerabilities)} vulnerabilities")
+                vulnerabilities = await self._request_page(params)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Fetched page: start_item={start_item}, {len(vulnerabilities)} vulnerabilities "
+                        f"(attempt {attempt}/{self.max_retries})"
+                    )
                 return vulnerabilities
 
             except (httpx.HTTPStatusError, httpx.TimeoutException, httpx.RequestError) as e:
+                if isinstance(e, httpx.HTTPStatusError):
+                    if not self._is_retryable_status(e.response.status_code):
+                        raise JVNAPIError(f"API request failed: {e}")
+                    retry_after = self._parse_retry_after(e.response)
                 error_type = e.__class__.__name__.replace("Exception", " error").replace("Error", " error")
                 self._handle_retry_error(e, attempt, error_type)
 
             except JVNParseError as e:
                 self._handle_retry_error(e, attempt, "XML parsing error")
 
-            # Exponential backoff
+            # Exponential backoff (or Retry-After) with jitter
             if attempt < self.max_retries:
-                delay = self.retry_delay * (2 ** (attempt - 1))
-                logger.info(f"Retrying in {delay} seconds...")
+                delay = self._retry_backoff(attempt, retry_after)
+                logger.info(f"Retrying in {delay:.1f} seconds...")
                 await asyncio.sleep(delay)
 
         return []
 
+    async def _request_page(self, params: dict) -> List[VulnerabilityCreate]:
+        """
+        Request one page and parse it, revalidating a cached copy when the page cache is enabled.
+
+        A page stored by an earlier run is requested with If-None-Match / If-Modified-Since;
+        on 304 Not Modified its stored records are returned without parsing any XML. Pages
+        whose response carries an ETag or Last-Modified header are stored for the next run.
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            List of VulnerabilityCreate objects for this page
+
+        Raises:
+            httpx.HTTPStatusError: When API returns an error status
+            JVNParseError: When XML parsing fails
+        """
+        cached_page = self._page_cache.get(params) if self._page_cache else None
+        response = await self._get(params, headers=cached_page.conditional_headers if cached_page else None)
+
+        if response.status_code == 304 and cached_page:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Page not modified, using cached copy: start_item={params.get('startItem')}")
+            return [VulnerabilityCreate.model_validate(record) for record in cached_page.records]
+
+        # Parse XML response (M1.2)
+        vulnerabilities = self._parse_xml_response(response.text)
+
+        if self._page_cache:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                records = [vulnerability.model_dump(mode="json") for vulnerability in vulnerabilities]
+                self._page_cache.set(params, etag, last_modified, records)
+
+        return vulnerabilities
+
+    @staticmethod
+    def _is_retryable_status(status_code: int) -> bool:
+        """Whether a request that failed with this HTTP status may succeed when retried."""
+        return status_code >= 500 or status_code in RETRYABLE_CLIENT_ERROR_STATUSES
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+        """
+        Get the Retry-After delay (seconds) from a 429/503 response.
+
+        Args:
+            response: HTTP error response
+
+        Returns:
+            Optional[float]: Delay in seconds, or None if not a throttling response or the header is not numeric
+        """
+        if response.status_code not in (429, 503):
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return max(float(retry_after), 0.0) if retry_after else None
+        except ValueError:
+            return None
+
+    def _retry_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before the next attempt.
+
+        Honours Retry-After when the server sent one, otherwise uses exponential backoff.
+        Random jitter (up to the same delay again) keeps concurrent page requests that
+        failed together from retrying in lockstep.
+        """
+        delay = retry_after if retry_after is not None else self.retry_delay * (2 ** (attempt - 1))
+        return delay * (1 + random.random())
+
     def _build_request_params(
-        self, start_date: Optional[str], end_date: Optional[str], start_item: int, max_count: int, use_modified_date: bool = False
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        start_item: int,
+        max_count: int,
+        use_modified_date: bool = False,
     ) -> dict:
-        """Build request parameters for JVN API."""
+        """Build request parameters for JVN API (httpx stringifies the integer values)."""
         params = {
             "method": "getVulnOverviewList",
             "feed": "hnd",
-            "startItem": str(start_item),
-            "maxCountItem": str(max_count),
+            "startItem": start_item,
+            "maxCountItem": max_count,
         }
 
+        # Use modified date for differential fetching, published date for initial fetching
+        date_prefix = "dateMod" if use_modified_date else "datePublic"
+
         if start_date:
-            if use_modified_date:
-                # Use modified date for differential fetching
-                params["dateModStartY"] = start_date.split("-")[0]
-                params["dateModStartM"] = start_date.split("-")[1]
-                params["dateModStartD"] = start_date.split("-")[2]
-            else:
-                # Use published date for initial fetching
-                params["datePublicStartY"] = start_date.split("-")[0]
-                params["datePublicStartM"] = start_date.split("-")[1]
-                params["datePublicStartD"] = start_date.split("-")[2]
+            year, month, day = start_date.split("-")
+            params[f"{date_prefix}StartY"] = year
+            params[f"{date_prefix}StartM"] = month
+            params[f"{date_prefix}StartD"] = day
 
         if end_date:
-            if use_modified_date:
-                # Use modified date for differential fetching
-                params["dateModEndY"] = end_date.split("-")[0]
-                params["dateModEndM"] = end_date.split("-")[1]
-                params["dateModEndD"] = end_date.split("-")[2]
-            else:
-                # Use published date for initial fetching
-                params["datePublicEndY"] = end_date.split("-")[0]
-                params["datePublicEndM"] = end_date.split("-")[1]
-                params["datePublicEndD"] = end_date.split("-")[2]
+            year, month, day = end_date.split("-")
+            params[f"{date_prefix}EndY"] = year
+            params[f"{date_prefix}EndM"] = month
+            params[f"{date_prefix}EndD"] = day
 
         return params
 
@@ -295,22 +601,25 @@ class JVNFetcherService:
 
         This method implements M1.6: Rate limiting (2-3 requests/second).
         Uses 0.4 seconds delay = 2.5 requests/second (safe middle ground).
+
+        Each caller reserves the next free slot (leaky bucket without burst) and then sleeps
+        until it, so concurrent page requests queue up in order and never start closer together
+        than rate_limit_delay. The reservation has no await, so it needs no lock.
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        current_time = time.monotonic()
+        request_time = max(current_time, self._next_request_time)
+        self._next_request_time = request_time + self.rate_limit_delay
 
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
+        sleep_time = request_time - current_time
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             await asyncio.sleep(sleep_time)
 
-        self.last_request_time = time.time()
-
     def _parse_xml_response(self, xml_text: str) -> List[VulnerabilityCreate]:
         """
         Parse XML response from JVN iPedia API.
 
-        This method implements M1.2: XML response parsing using xml.etree.ElementTree.
+        This method implements M1.2: XML response parsing using lxml.
 
         Args:
             xml_text: Raw XML response text from API
@@ -334,41 +643,44 @@ class JVNFetcherService:
                 </item>
             </rdf:RDF>
         """
-        try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError as e:
-            raise JVNParseError(f"Failed to parse XML response: {e}")
+        return list(self._iter_parsed_vulnerabilities(xml_text))
 
-        vulnerabilities: List[VulnerabilityCreate] = []
+    def _iter_parsed_vulnerabilities(self, xml_text: str) -> Iterator[VulnerabilityCreate]:
+        """
+        Parse XML response from JVN iPedia API one <item> at a time.
 
-        # Find all <item> elements using RSS namespace
-        items = root.findall(".//rss:item", self.NAMESPACES)
+        Args:
+            xml_text: Raw XML response text from API
 
-        if not items:
-            # Try without namespace (fallback)
-            items = root.findall(".//item")
+        Yields:
+            VulnerabilityCreate objects (one per CVE ID in each item)
 
-        logger.debug(f"Found {len(items)} items in XML response")
+        Raises:
+            JVNParseError: When XML parsing fails
+        """
+        item_count = 0
+        no_results_count = 0
 
-        for item in items:
+        for item in self._iter_xml_items(xml_text):
+            item_count += 1
             try:
+                fields = self._read_item_fields(item)
+
                 # Skip "no results" message item
-                title = self._get_element_text(item, "rss:title", self.NAMESPACES)
+                title = fields.get(self._TAG_TITLE)
                 if title and "MyJVN　該当する脆弱性対策情報はありません" in title:
-                    logger.debug('Skipping "no results" message item')
+                    no_results_count += 1
                     continue
 
                 # Extract all CVE IDs from this item
-                cve_ids = self._extract_cve_ids(item, title)
+                cve_ids = self._extract_cve_ids(fields)
 
                 # Create a vulnerability record for each CVE ID
-                for cve_id in cve_ids:
-                    vulnerability = self._parse_vulnerability_item(item, cve_id)
-                    vulnerabilities.append(vulnerability)
+                vulnerabilities = self._parse_vulnerability_item(fields, cve_ids)
 
-                # Log if multiple CVE IDs found
-                if len(cve_ids) > 1:
-                    jvndb_id = self._get_element_text(item, "sec:identifier", self.NAMESPACES)
+                # Log if multiple CVE IDs found (skip the formatting when INFO is disabled)
+                if len(cve_ids) > 1 and logger.isEnabledFor(logging.INFO):
+                    jvndb_id = fields.get(self._TAG_IDENTIFIER)
                     logger.info(
                         f"Multiple CVE IDs found for {jvndb_id}: {', '.join(cve_ids)} "
                         f"(created {len(cve_ids)} records)"
@@ -379,57 +691,129 @@ class JVNFetcherService:
                 logger.warning(f"Failed to parse vulnerability item: {e}")
                 continue
 
-        return vulnerabilities
+            finally:
+                # Release the parsed subtree and the already processed sibling items,
+                # so only the current item is kept in memory
+                item.clear()
+                parent = item.getparent()
+                if parent is not None:
+                    while item.getprevious() is not None:
+                        del parent[0]
+
+            yield from vulnerabilities
+
+        # One summary per response instead of a log call per item
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Found {item_count} items in XML response ({no_results_count} "no results" items skipped)')
+
+    def _iter_xml_items(self, xml_text: str) -> Iterator[ET._Element]:
+        """
+        Incrementally parse XML and yield each completed <item> element.
+
+        Uses lxml's XMLPullParser (libxml2) so items are handed out as soon as their end tag
+        is read, instead of building the full document tree first.
+
+        Args:
+            xml_text: Raw XML response text from API
+
+        Yields:
+            <item> elements (RSS namespace)
+
+        Raises:
+            JVNParseError: When XML parsing fails
+        """
+        # Only end events of <item> are reported (filtered by lxml, not per element in Python)
+        parser = ET.XMLPullParser(events=("end",), tag=self._TAG_ITEM)
+
+        try:
+            for offset in range(0, len(xml_text), XML_FEED_CHUNK_SIZE):
+                parser.feed(xml_text[offset : offset + XML_FEED_CHUNK_SIZE])
+                for _, element in parser.read_events():
+                    yield element
+            parser.close()
+            for _, element in parser.read_events():
+                yield element
+        except ET.ParseError as e:
+            raise JVNParseError(f"Failed to parse XML response: {e}")
 
-    def _extract_cve_ids(self, item: ET.Element, title: str) -> List[str]:
-        """Extract all CVE IDs from vulnerability item (supports multiple CVEs)."""
+    def _read_item_fields(self, item: ET._Element) -> Dict:
+        """
+        Read the fields of a vulnerability item in a single pass over its children.
+
+        Args:
+            item: XML element representing a single vulnerability
+
+        Returns:
+            Dictionary with the stripped text of each field in _TEXT_TAGS (keyed by tag),
+            "references" (list of (source, id) of sec:references) and
+            "cvss" ((score, severity) of the first sec:cvss, or None)
+        """
+        fields: Dict = {"references": [], "cvss": None}
+
+        for child in item:
+            tag = child.tag
+            if tag == self._TAG_REFERENCES:
+                fields["references"].append((child.get("source"), child.get("id")))
+            elif tag == self._TAG_CVSS:
+                if fields["cvss"] is None:
+                    fields["cvss"] = (child.get("score"), child.get("severity"))
+            elif tag in self._TEXT_TAGS and tag not in fields:
+                # First occurrence wins, like find()
+                fields[tag] = child.text.strip() if child.text else None
+
+        return fields
+
+    def _extract_cve_ids(self, fields: Dict) -> List[str]:
+        """Extract all CVE IDs from vulnerability item fields (supports multiple CVEs)."""
         cve_ids = []
+        seen = set()
 
-        # Extract all CVE IDs from sec:references elements
-        references_elements = item.findall("sec:references", self.NAMESPACES)
-        for ref in references_elements:
-            source = ref.get("source")
-            ref_id = ref.get("id")
-            if source == "CVE" and ref_id and ref_id.startswith("CVE-"):
-                if ref_id not in cve_ids:  # Avoid duplicates
-                    cve_ids.append(ref_id)
+        # Extract all CVE IDs from sec:references elements (in document order, without duplicates)
+        for source, ref_id in fields["references"]:
+            if source == "CVE" and ref_id and ref_id.startswith("CVE-") and ref_id not in seen:
+                seen.add(ref_id)
+                cve_ids.append(ref_id)
 
         # If no CVE IDs found in references, try extracting from title
-        if not cve_ids:
+        title = fields.get(self._TAG_TITLE)
+        if not cve_ids and title:
             cve_id_from_title = self._extract_cve_from_title(title)
             if cve_id_from_title:
                 cve_ids.append(cve_id_from_title)
 
         # If still no CVE IDs found, raise error
         if not cve_ids:
-            jvndb_id = self._get_element_text(item, "sec:identifier", self.NAMESPACES)
+            jvndb_id = fields.get(self._TAG_IDENTIFIER)
             if jvndb_id:
                 raise JVNParseError(f"No CVE ID found for JVNDB entry: {jvndb_id}")
 
         return cve_ids
 
-    def _extract_dates(self, item: ET.Element) -> tuple:
-        """Extract published and modified dates from vulnerability item."""
-        published_date_str = self._get_element_text(item, "dc:date", self.NAMESPACES)
-        modified_date_str = self._get_element_text(item, "dcterms:modified", self.NAMESPACES)
+    def _extract_dates(self, fields: Dict) -> tuple:
+        """Extract published and modified dates from vulnerability item fields."""
+        published_date_str = fields.get(self._TAG_DATE)
+        modified_date_str = fields.get(self._TAG_MODIFIED)
 
         if not published_date_str:
             raise JVNParseError("Missing required field: published date")
 
         published_date = self._parse_date(published_date_str)
-        modified_date = self._parse_date(modified_date_str) if modified_date_str else published_date
+
+        # Unmodified entries carry the same timestamp twice; parse it only once
+        if not modified_date_str or modified_date_str == published_date_str:
+            modified_date = published_date
+        else:
+            modified_date = self._parse_date(modified_date_str)
 
         return published_date, modified_date
 
-    def _extract_cvss_info(self, item: ET.Element) -> tuple:
-        """Extract CVSS score and severity from vulnerability item."""
-        cvss_element = item.find("sec:cvss", self.NAMESPACES)
+    def _extract_cvss_info(self, fields: Dict) -> tuple:
+        """Extract CVSS score and severity from vulnerability item fields."""
         cvss_score = None
         severity = None
 
-        if cvss_element is not None:
-            cvss_score_str = cvss_element.get("score")
-            severity = cvss_element.get("severity")
+        if fields["cvss"] is not None:
+            cvss_score_str, severity = fields["cvss"]
 
             if cvss_score_str:
                 try:
@@ -439,85 +823,55 @@ class JVNFetcherService:
 
         return cvss_score, severity
 
-    def _parse_vulnerability_item(self, item: ET.Element, cve_id: str) -> VulnerabilityCreate:
+    def _parse_vulnerability_item(self, fields: Dict, cve_ids: List[str]) -> List[VulnerabilityCreate]:
         """
-        Parse a single vulnerability item from XML for a specific CVE ID.
+        Parse a single vulnerability item into one record per CVE ID.
 
         Args:
-            item: XML element representing a single vulnerability
-            cve_id: CVE ID to use for this record
+            fields: Item fields read by _read_item_fields
+            cve_ids: CVE IDs to create records for
 
         Returns:
-            VulnerabilityCreate object
+            List of VulnerabilityCreate objects (one per CVE ID)
 
         Raises:
             JVNParseError: When required fields are missing
         """
+        if not cve_ids:
+            return []
+
         # Extract required fields
-        title = self._get_element_text(item, "rss:title", self.NAMESPACES)
+        title = fields.get(self._TAG_TITLE)
         if not title:
             raise JVNParseError("Missing required field: title")
 
-        description = self._get_element_text(item, "rss:description", self.NAMESPACES)
+        description = fields.get(self._TAG_DESCRIPTION)
         if not description:
             raise JVNParseError("Missing required field: description")
 
-        # Extract dates and CVSS info using helper methods
-        published_date, modified_date = self._extract_dates(item)
-        cvss_score, severity = self._extract_cvss_info(item)
+        # Extract dates and CVSS info using helper methods (once for all CVE IDs of the item)
+        published_date, modified_date = self._extract_dates(fields)
+        cvss_score, severity = self._extract_cvss_info(fields)
 
         # Extract additional information
-        link = self._get_element_text(item, "rss:link", self.NAMESPACES)
-        references = {"jvn_link": link} if link else None
-
-        # Create VulnerabilityCreate object
-        return VulnerabilityCreate(
-            cve_id=cve_id,
-            title=title,
-            description=description,
-            cvss_score=cvss_score,
-            severity=severity,
-            published_date=published_date,
-            modified_date=modified_date,
-            affected_products=None,  # Not available in overview list
-            vendor_info=None,  # Not available in overview list
-            references=references,
-        )
-
-    def _get_element_text(
-        self,
-        parent: ET.Element,
-        tag: str,
-        namespaces: Optional[Dict[str, str]] = None,
-    ) -> Optional[str]:
-        """
-        Get text content of a child element.
-
-        Args:
-            parent: Parent XML element
-            tag: Tag name to search for
-            namespaces: XML namespaces (optional)
-
-        Returns:
-            Text content or None if element not found
-        """
-        # Try with namespace first
-        element = parent.find(tag, namespaces) if namespaces else None
-
-        # If not found and tag doesn't have namespace prefix, try without namespace
-        if element is None and namespaces and ":" not in tag:
-            # Search for element by local name (without namespace)
-            for child in parent:
-                local_name = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if local_name == tag:
-                    element = child
-                    break
-
-        # Fallback: try without namespace
-        if element is None:
-            element = parent.find(tag)
-
-        return element.text.strip() if element is not None and element.text else None
+        link = fields.get(self._TAG_LINK)
+
+        # Create a VulnerabilityCreate object for each CVE ID
+        return [
+            VulnerabilityCreate(
+                cve_id=cve_id,
+                title=title,
+                description=description,
+                cvss_score=cvss_score,
+                severity=severity,
+                published_date=published_date,
+                modified_date=modified_date,
+                affected_products=None,  # Not available in overview list
+                vendor_info=None,  # Not available in overview list
+                references={"jvn_link": link} if link else None,
+            )
+            for cve_id in cve_ids
+        ]
 
     def _extract_cve_from_title(self, title: str) -> Optional[str]:
         """
@@ -533,10 +887,7 @@ class JVNFetcherService:
             >>> service._extract_cve_from_title('CVE-2024-0001: Buffer overflow')
             'CVE-2024-0001'
         """
-        import re
-
-        pattern = r"CVE-\d{4}-\d{4,}"
-        match = re.search(pattern, title)
+        match = _CVE_RE.search(title)
         return match.group(0) if match else None
 
     def _parse_date(self, date_str: str) -> datetime:
@@ -560,21 +911,16 @@ class JVNFetcherService:
         # Remove timezone info for simplicity (store as naive datetime)
         date_str = date_str.replace("Z", "+00:00")
 
-        # Try ISO 8601 format with timezone
+        # Branch on the shape instead of trying each format and catching the failures
         try:
-            dt = datetime.fromisoformat(date_str)
-            # Convert to naive datetime (remove timezone)
-            return dt.replace(tzinfo=None)
-        except ValueError:
-            pass
+            # Simple date format
+            if len(date_str) == 10 and date_str[4] == "-":
+                return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
 
-        # Try simple date format
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
+            # ISO 8601 format with timezone, converted to naive datetime (remove timezone)
+            return datetime.fromisoformat(date_str).replace(tzinfo=None)
         except ValueError:
-            pass
-
-        raise JVNParseError(f"Failed to parse date: {date_str}")
+            raise JVNParseError(f"Failed to parse date: {date_str}")
 
     async def fetch_since_last_update(self, last_update_date: datetime) -> List[VulnerabilityCreate]:
         """
@@ -602,19 +948,21 @@ class JVNFetcherService:
         logger.info(f"Differential fetch: fetching data from {start_date} to {end_date}")
         logger.info("Using dual filtering: published date + modified date for comprehensive coverage")
 
-        # Fetch using published date filter (catches newly published CVEs)
-        logger.info("Step 1: Fetching by published date")
-        published_vulns = await self.fetch_vulnerabilities(
-            start_date=start_date, end_date=end_date, use_modified_date=False
-        )
-        logger.info(f"Fetched {len(published_vulns)} vulnerabilities by published date")
-
-        # Fetch using modified date filter (catches updated CVEs)
-        logger.info("Step 2: Fetching by modified date")
-        modified_vulns = await self.fetch_vulnerabilities(
-            start_date=start_date, end_date=end_date, use_modified_date=True
-        )
-        logger.info(f"Fetched {len(modified_vulns)} vulnerabilities by modified date")
+        # Both passes share one pooled client
+        async with self._client_scope():
+            # Fetch using published date filter (catches newly published CVEs)
+            logger.info("Step 1: Fetching by published date")
+            published_vulns = await self.fetch_vulnerabilities(
+                start_date=start_date, end_date=end_date, use_modified_date=False
+            )
+            logger.info(f"Fetched {len(published_vulns)} vulnerabilities by published date")
+
+            # Fetch using modified date filter (catches updated CVEs)
+            logger.info("Step 2: Fetching by modified date")
+            modified_vulns = await self.fetch_vulnerabilities(
+                start_date=start_date, end_date=end_date, use_modified_date=True
+            )
+            logger.info(f"Fetched {len(modified_vulns)} vulnerabilities by modified date")
 
         # Merge and deduplicate by CVE ID
         all_vulns_dict = {}
@@ -641,6 +989,36 @@ class JVNFetcherService:
 
         return merged_vulns
 
+    async def iter_since_last_update(self, last_update_date: datetime) -> AsyncIterator[List[VulnerabilityCreate]]:
+        """
+        Fetch vulnerabilities updated since the last update date page by page.
+
+        Streaming counterpart of fetch_since_last_update: runs the same published date and
+        modified date passes, but yields each page as soon as it is parsed. A CVE returned
+        by both passes is yielded once (both passes return its current record).
+
+        Args:
+            last_update_date: Last update timestamp from database
+
+        Yields:
+            List of VulnerabilityCreate objects for one page (not yet yielded CVEs only)
+        """
+        start_date = last_update_date.strftime("%Y-%m-%d")
+        end_date = datetime.now().strftime("%Y-%m-%d")
+
+        logger.info(f"Differential fetch: streaming data from {start_date} to {end_date}")
+
+        seen: set = set()
+        async with self._client_scope():
+            for use_modified_date in (False, True):
+                async for page in self.iter_vulnerabilities(
+                    start_date=start_date, end_date=end_date, use_modified_date=use_modified_date
+                ):
+                    new_items = [vuln for vuln in page if vuln.cve_id not in seen]
+                    seen.update(vuln.cve_id for vuln in new_items)
+                    if new_items:
+                        yield new_items
+
     async def fetch_recent_years(self, years: int = 3) -> List[VulnerabilityCreate]:
         """
         Fetch vulnerabilities from the last N years.
@@ -679,10 +1057,7 @@ class JVNFetcherService:
             >>> JVNFetcherService.extract_jvndb_id_from_url("https://jvndb.jvn.jp/ja/contents/2025/JVNDB-2025-025359.html")
             'JVNDB-2025-025359'
         """
-        import re
-
-        pattern = r"JVNDB-\d{4}-\d+"
-        match = re.search(pattern, url)
+        match = _JVNDB_ID_RE.search(url)
         return match.group(0) if match else None
 
     async def fetch_vulnerability_detail(self, jvndb_id: str) -> Optional[Dict]:
@@ -712,29 +1087,34 @@ class JVNFetcherService:
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                logger.debug(f"Fetching detail for {jvndb_id}, attempt={attempt}/{self.max_retries}")
-
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(self.api_endpoint, params=params)
-                    response.raise_for_status()
+                response = await self._get(params)
 
                 # Parse XML and extract affected products
                 affected_products = self._parse_detail_xml(response.text)
-                logger.debug(f"Extracted affected_products for {jvndb_id}: {affected_products}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Extracted affected_products for {jvndb_id} "
+                        f"(attempt {attempt}/{self.max_retries}): {affected_products}"
+                    )
                 return affected_products
 
             except (httpx.HTTPStatusError, httpx.TimeoutException, httpx.RequestError) as e:
                 error_type = e.__class__.__name__
                 logger.warning(f"{error_type} (attempt {attempt}/{self.max_retries}): {e}")
 
+                retry_after = None
+                if isinstance(e, httpx.HTTPStatusError):
+                    if not self._is_retryable_status(e.response.status_code):
+                        logger.error(f"Failed to fetch detail for {jvndb_id}: {e}")
+                        return None
+                    retry_after = self._parse_retry_after(e.response)
+
                 if attempt == self.max_retries:
                     logger.error(f"Failed to fetch detail for {jvndb_id} after {self.max_retries} attempts")
                     return None
 
-                # Exponential backoff
-                if attempt < self.max_retries:
-                    delay = self.retry_delay * (2 ** (attempt - 1))
-                    await asyncio.sleep(delay)
+                # Exponential backoff (or Retry-After) with jitter
+                await asyncio.sleep(self._retry_backoff(attempt, retry_after))
 
         return None
 
@@ -755,28 +1135,25 @@ class JVNFetcherService:
                 }
             }
         """
-        import re
-
         try:
-            root = ET.fromstring(xml_text)
+            # lxml only accepts an XML declaration with an encoding on bytes input
+            root = ET.fromstring(xml_text.encode("utf-8"))
         except ET.ParseError as e:
             logger.error(f"Failed to parse detail XML: {e}")
             return {"cpe": [], "version_ranges": {}}
 
-        ns = {'vuldef': 'http://jvn.jp/vuldef/'}
-
         affected_products = {
             "cpe": [],
             "version_ranges": {}
         }
 
-        affected_items = root.findall('.//vuldef:AffectedItem', ns)
+        affected_items = self._XP_AFFECTED_ITEMS(root)
 
         for item in affected_items:
-            name = item.find('vuldef:Name', ns)
-            product_name = item.find('vuldef:ProductName', ns)
-            cpe = item.find('vuldef:Cpe', ns)
-            version_number = item.find('vuldef:VersionNumber', ns)
+            name = item.find(self._TAG_VULDEF_NAME)
+            product_name = item.find(self._TAG_VULDEF_PRODUCT_NAME)
+            cpe = item.find(self._TAG_VULDEF_CPE)
+            version_number = item.find(self._TAG_VULDEF_VERSION_NUMBER)
 
             vendor = name.text if name is not None else "unknown"
             product = product_name.text if product_name is not None else "unknown"
@@ -846,8 +1223,6 @@ class JVNFetcherService:
             >>> JVNFetcherService._extract_version_range("1.0.0 以上 2.0.0 未満")
             {'versionStartIncluding': '1.0.0', 'versionEndExcluding': '2.0.0'}
         """
-        import re
-
         version_range = {}
 
         # Pattern 1: "X.X.X 以上 Y.Y.Y 未満" or "X.X.X から Y.Y.Y より前"
@@ -17,8 +17,9 @@ import asyncio
 import logging
 import os
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional
 
 import httpx
 
@@ -27,6 +28,9 @@ from src.schemas.vulnerability import VulnerabilityCreate
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared HTTP client
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
 
 class NVDFetcherError(Exception):
     """Base exception for NVD Fetcher errors."""
@@ -87,6 +91,19 @@ class NVDFetcherService:
             self.rate_limit_delay = 6.0  # 5 req/30s = 6s per request
 
         self.last_request_time = 0.0
+        self._rate_limit_lock = asyncio.Lock()
+
+        # Concurrent page requests (request starts are still spaced by rate_limit_delay)
+        self.max_concurrent_requests = int(os.getenv("NVD_API_MAX_CONCURRENT_REQUESTS", "5"))
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        # Server-side "timestamp" of the latest response (UTC), used as the next differential cursor
+        self.last_response_timestamp: Optional[datetime] = None
+        # lastModEndDate of the latest fetch_since_last_update() run (UTC)
+        self.last_mod_end_date: Optional[datetime] = None
+
+        # Shared HTTP client, open while the service is used as an async context manager
+        self._client: Optional[httpx.AsyncClient] = None
 
         logger.info(
             f"NVD Fetcher Service initialized: endpoint={self.api_endpoint}, "
@@ -95,6 +112,17 @@ class NVDFetcherService:
             f"rate_limit={self.rate_limit_delay}s"
         )
 
+    async def __aenter__(self) -> "NVDFetcherService":
+        """Open a shared HTTP client so every request reuses pooled connections."""
+        self._client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_LIMITS)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def fetch_vulnerabilities(
         self,
         start_date: Optional[str] = None,
@@ -116,57 +144,141 @@ class NVDFetcherService:
             NVDAPIError: API request error
             NVDParseError: JSON parsing error
         """
-        logger.info(f"Starting NVD API fetch: start_date={start_date}, end_date={end_date}, max_items={max_items}")
-
         all_vulnerabilities: List[VulnerabilityCreate] = []
-        start_index = 0
-        results_per_page = 2000  # NVD API 2.0 maximum
 
-        while True:
-            # Build request parameters
-            params = self._build_request_params(start_date, end_date, start_index, results_per_page)
+        async for page in self.iter_vulnerabilities(start_date=start_date, end_date=end_date, max_items=max_items):
+            all_vulnerabilities.extend(page)
 
-            # Fetch data with retry logic
-            response_data = await self._fetch_with_retry(params)
+        return all_vulnerabilities
 
-            # Parse response
-            vulnerabilities = self._parse_response(response_data)
-            all_vulnerabilities.extend(vulnerabilities)
+    async def iter_vulnerabilities(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[List[VulnerabilityCreate]]:
+        """
+        Fetch vulnerability data from NVD API 2.0 page by page.
 
-            logger.info(f"Fetched {len(vulnerabilities)} vulnerabilities (start_index={start_index})")
+        Yields each page as soon as it is parsed, so callers can store results
+        without holding the whole date range in memory.
 
-            # Check if we've fetched all results or reached max_items
-            total_results = response_data.get("totalResults", 0)
-            if start_index + results_per_page >= total_results:
-                break
+        Args:
+            start_date: Start date for lastModStartDate (ISO 8601: 2024-01-01T00:00:00.000)
+            end_date: End date for lastModEndDate (ISO 8601: 2024-01-01T23:59:59.999)
+            max_items: Maximum number of items to fetch (default: no limit)
 
-            if max_items and len(all_vulnerabilities) >= max_items:
-                all_vulnerabilities = all_vulnerabilities[:max_items]
-                break
+        Yields:
+            List of VulnerabilityCreate objects for one page
 
-            start_index += results_per_page
+        Raises:
+            NVDAPIError: API request error
+            NVDParseError: JSON parsing error
+        """
+        logger.info(f"Starting NVD API fetch: start_date={start_date}, end_date={end_date}, max_items={max_items}")
 
-        logger.info(f"Total fetched from NVD: {len(all_vulnerabilities)} vulnerabilities")
-        return all_vulnerabilities
+        total = 0
+        results_per_page = 2000  # NVD API 2.0 maximum
+
+        # The first page reveals totalResults; remaining pages are fetched concurrently,
+        # keeping at most max_concurrent_requests pages in flight ahead of the consumer
+        response_data = await self._fetch_page(start_date, end_date, 0, results_per_page)
+        total_results = response_data.get("totalResults", 0)
+        last_index = min(total_results, max_items) if max_items else total_results
+        next_indexes = iter(range(results_per_page, last_index, results_per_page))
 
-    async def fetch_since_last_update(self, last_update: Optional[datetime] = None) -> List[VulnerabilityCreate]:
+        pending: deque = deque()
+        start_index = 0
+
+        try:
+            while True:
+                for next_index in next_indexes:
+                    pending.append(
+                        (
+                            next_index,
+                            asyncio.create_task(self._fetch_page(start_date, end_date, next_index, results_per_page)),
+                        )
+                    )
+                    if len(pending) >= self.max_concurrent_requests:
+                        break
+
+                self._record_response_timestamp(response_data)
+
+                # Parse response
+                vulnerabilities = self._parse_response(response_data)
+                if max_items:
+                    vulnerabilities = vulnerabilities[: max_items - total]
+
+                total += len(vulnerabilities)
+                logger.info(f"Fetched {len(vulnerabilities)} vulnerabilities (start_index={start_index})")
+                yield vulnerabilities
+
+                # Check if we've fetched all results or reached max_items
+                if not pending or (max_items and total >= max_items):
+                    break
+
+                start_index, task = pending.popleft()
+                response_data = await task
+        finally:
+            # Discard pages requested beyond the last one
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+        logger.info(f"Total fetched from NVD: {total} vulnerabilities")
+
+    async def fetch_since_last_update(
+        self, last_update: Optional[datetime] = None, max_items: Optional[int] = None
+    ) -> List[VulnerabilityCreate]:
         """
         Fetch vulnerabilities modified since the last update (differential fetching).
 
+        Uses lastModStartDate/lastModEndDate, so items published long ago but modified
+        since last_update are included. After completion, sync_cursor holds the value
+        to pass as last_update on the next run.
+
         Args:
-            last_update: Last update datetime. If None, fetches from the last 3 years.
+            last_update: Last update datetime (naive values are treated as UTC).
+                If None, fetches from the last 3 years.
+            max_items: Maximum number of items to fetch (default: no limit)
 
         Returns:
             List of VulnerabilityCreate objects
         """
+        all_vulnerabilities: List[VulnerabilityCreate] = []
+
+        async for page in self.iter_since_last_update(last_update, max_items=max_items):
+            all_vulnerabilities.extend(page)
+
+        return all_vulnerabilities
+
+    async def iter_since_last_update(
+        self, last_update: Optional[datetime] = None, max_items: Optional[int] = None
+    ) -> AsyncIterator[List[VulnerabilityCreate]]:
+        """
+        Fetch vulnerabilities modified since the last update page by page.
+
+        Args:
+            last_update: Last update datetime (naive values are treated as UTC).
+                If None, fetches from the last 3 years.
+            max_items: Maximum number of items to fetch (default: no limit)
+
+        Yields:
+            List of VulnerabilityCreate objects for one page
+        """
+        now = datetime.now(timezone.utc)
+
         if last_update is None:
             # Default: fetch from the last 3 years
-            last_update = datetime.now() - timedelta(days=365 * 3)
+            last_update = now - timedelta(days=365 * 3)
+        elif last_update.tzinfo is None:
+            last_update = last_update.replace(tzinfo=timezone.utc)
 
         # NVD API has a 120-day range limit, so we need to split requests
-        all_vulnerabilities: List[VulnerabilityCreate] = []
-        current_start = last_update
-        now = datetime.now()
+        total = 0
+        current_start = last_update.astimezone(timezone.utc)
+        self.last_response_timestamp = None
+        self.last_mod_end_date = now
 
         while current_start < now:
             # Calculate end date (max 120 days from start)
@@ -177,13 +289,73 @@ class NVDFetcherService:
 
             logger.info(f"Fetching NVD data from {start_str} to {end_str}")
 
-            vulnerabilities = await self.fetch_vulnerabilities(start_date=start_str, end_date=end_str)
-            all_vulnerabilities.extend(vulnerabilities)
+            remaining = max_items - total if max_items else None
+            async for page in self.iter_vulnerabilities(start_date=start_str, end_date=end_str, max_items=remaining):
+                total += len(page)
+                yield page
+
+            if max_items and total >= max_items:
+                break
 
             # Move to next 120-day window
             current_start = current_end + timedelta(seconds=1)
 
-        return all_vulnerabilities
+    @property
+    def sync_cursor(self) -> Optional[datetime]:
+        """
+        Cursor for the next differential fetch (UTC).
+
+        The NVD server timestamp of the latest response, capped at the lastModEndDate
+        actually requested so changes made after the requested window are not skipped.
+
+        Returns:
+            Optional[datetime]: Next lastModStartDate, or None if nothing was fetched yet
+        """
+        if self.last_response_timestamp is None:
+            return None
+        if self.last_mod_end_date is None:
+            return self.last_response_timestamp
+        return min(self.last_response_timestamp, self.last_mod_end_date)
+
+    def _record_response_timestamp(self, response_data: dict) -> None:
+        """
+        Record the NVD server "timestamp" field of a response.
+
+        Args:
+            response_data: JSON response from NVD API
+        """
+        timestamp = response_data.get("timestamp")
+        if not timestamp:
+            return
+
+        try:
+            parsed = datetime.fromisoformat(timestamp)
+        except ValueError:
+            logger.warning(f"Unexpected NVD response timestamp: {timestamp}")
+            return
+
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        self.last_response_timestamp = parsed
+
+    async def _fetch_page(
+        self, start_date: Optional[str], end_date: Optional[str], start_index: int, results_per_page: int
+    ) -> dict:
+        """
+        Fetch one page from NVD API, bounded by the concurrent request semaphore.
+
+        Args:
+            start_date: Start date (ISO 8601)
+            end_date: End date (ISO 8601)
+            start_index: Pagination start index
+            results_per_page: Number of results per page
+
+        Returns:
+            Parsed JSON response
+        """
+        params = self._build_request_params(start_date, end_date, start_index, results_per_page)
+        async with self._request_semaphore:
+            return await self._fetch_with_retry(params)
 
     def _build_request_params(
         self,
@@ -239,20 +411,25 @@ class NVDFetcherService:
                 if self.api_key:
                     headers["apiKey"] = self.api_key
 
-                # Make request
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(self.api_endpoint, params=params, headers=headers)
-                    response.raise_for_status()
+                # Make request (reuse the shared client inside ``async with``)
+                if self._client is not None:
+                    response = await self._client.get(self.api_endpoint, params=params, headers=headers)
+                else:
+                    async with httpx.AsyncClient(timeout=self.timeout) as client:
+                        response = await client.get(self.api_endpoint, params=params, headers=headers)
+                response.raise_for_status()
 
-                    # Parse JSON
-                    data = response.json()
-                    return data
+                # Parse JSON
+                data = response.json()
+                return data
 
             except httpx.HTTPStatusError as e:
                 logger.error(f"NVD API HTTP error (attempt {attempt}/{self.max_retries}): {e}")
                 if attempt == self.max_retries:
                     raise NVDAPIError(f"NVD API request failed after {self.max_retries} retries: {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** (attempt - 1)))  # Exponential backoff
+                # Honour Retry-After on throttling responses, otherwise exponential backoff
+                retry_after = self._parse_retry_after(e.response)
+                await asyncio.sleep(retry_after if retry_after is not None else self.retry_delay * (2 ** (attempt - 1)))
 
             except httpx.RequestError as e:
                 logger.error(f"NVD API request error (attempt {attempt}/{self.max_retries}): {e}")
@@ -272,16 +449,39 @@ class NVDFetcherService:
 
         - Without API key: 5 req/30s (6 seconds per request)
         - With API key: 50 req/30s (0.6 seconds per request)
+
+        The lock keeps concurrent page requests from starting closer together than rate_limit_delay.
+        """
+        async with self._rate_limit_lock:
+            current_time = time.monotonic()
+            elapsed = current_time - self.last_request_time
+
+            if elapsed < self.rate_limit_delay:
+                sleep_time = self.rate_limit_delay - elapsed
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                await asyncio.sleep(sleep_time)
+
+            self.last_request_time = time.monotonic()
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> Optional[float]:
         """
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+        Get the Retry-After delay (seconds) from a 429/503 response.
 
-        if elapsed < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            await asyncio.sleep(sleep_time)
+        Args:
+            response: HTTP error response
 
-        self.last_request_time = time.time()
+        Returns:
+            Optional[float]: Delay in seconds, or None if not a throttling response or the header is not numeric
+        """
+        if response.status_code not in (429, 503):
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return max(float(retry_after), 0.0) if retry_after else None
+        except ValueError:
+            return None
 
     def _parse_response(self, response_data: dict) -> List[VulnerabilityCreate]:
         """
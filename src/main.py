@@ -5,6 +5,7 @@ This module initializes the FastAPI application with:
 - API routers
 - Static files and templates
 - CORS configuration
+- Response compression (gzip)
 - Health check endpoint
 """
 
@@ -13,6 +14,7 @@ from datetime import datetime
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from src.api.assets import router as assets_router
@@ -20,6 +22,7 @@ from src.api.dashboard import router as dashboard_router
 from src.api.matching import router as matching_router
 from src.api.vulnerabilities import router as vulnerabilities_router
 from src.config import settings
+from src.database import get_pool_status
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +44,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression: gzip bodies of 1KB+ when the client accepts it (JSON lists compress well)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="src/static"), name="static")
 
@@ -121,6 +127,19 @@ async def health_check():
     return health_status
 
 
+if settings.DEBUG:
+    # Pool internals are only exposed in debug mode
+    @app.get("/api/debug/pool", tags=["System"])
+    def pool_status():
+        """
+        Connection pool status endpoint (registered only when DEBUG is enabled).
+
+        Returns:
+            dict: Connection pool statistics (see src.database.get_pool_status)
+        """
+        return get_pool_status()
+
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -3,6 +3,17 @@ SQLAlchemy models for the vulnerability management system.
 """
 
 from src.models.asset import Asset, AssetVulnerabilityMatch
+from src.models.dashboard_views import mv_asset_ranking, mv_daily_vuln_counts, mv_severity_counts
+from src.models.sync_state import SyncState
 from src.models.vulnerability import Base, Vulnerability
 
-__all__ = ["Base", "Vulnerability", "Asset", "AssetVulnerabilityMatch"]
+__all__ = [
+    "Base",
+    "Vulnerability",
+    "Asset",
+    "AssetVulnerabilityMatch",
+    "SyncState",
+    "mv_severity_counts",
+    "mv_asset_ranking",
+    "mv_daily_vuln_counts",
+]
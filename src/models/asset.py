@@ -9,7 +9,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, String, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -172,13 +172,26 @@ class AssetVulnerabilityMatch(Base):
         comment="Match execution timestamp",
     )
 
+    # Denormalized from vulnerabilities.severity (set by matching and kept in sync by the
+    # vulnerability upserts), so per-asset severity counts (asset ranking) aggregate this
+    # table alone without joining vulnerabilities
+    severity: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True, comment="Vulnerability severity (Critical/High/Medium/Low)"
+    )
+
     # Relationships
     asset: Mapped["Asset"] = relationship("Asset", back_populates="matches")
     # Note: Vulnerability relationship is not defined here to avoid circular import
     # It will be accessed via join queries when needed
 
     # Unique constraint: Prevent duplicate matches for same asset and vulnerability
-    __table_args__ = (UniqueConstraint("asset_id", "cve_id", name="uq_asset_cve"),)
+    # Composite index: keyset pagination of matching results (matched_at DESC, match_id DESC)
+    # Covering index: asset ranking join (asset_id, cve_id -> match_id) as an index-only scan
+    __table_args__ = (
+        UniqueConstraint("asset_id", "cve_id", name="uq_asset_cve"),
+        Index("ix_avm_matched_at_match_id", matched_at.desc(), match_id.desc()),
+        Index("ix_avm_asset_cve", "asset_id", "cve_id", postgresql_include=["match_id"]),
+    )
 
     def __repr__(self) -> str:
         """String representation of AssetVulnerabilityMatch model."""
@@ -206,3 +219,26 @@ class AssetVulnerabilityMatch(Base):
         """
         valid_reasons = {"exact_match", "version_range", "wildcard_match"}
         return match_reason in valid_reasons
+
+
+# create_all does not add columns to an existing table: add the denormalized severity column
+# to databases created before it existed and backfill it from the matched vulnerabilities
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("ALTER TABLE asset_vulnerability_matches ADD COLUMN IF NOT EXISTS severity VARCHAR(20)").execute_if(
+        dialect="postgresql"
+    ),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        """
+        UPDATE asset_vulnerability_matches m
+        SET severity = v.severity
+        FROM vulnerabilities v
+        WHERE v.cve_id = m.cve_id AND m.severity IS NULL AND v.severity IS NOT NULL
+        """
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,143 @@
+"""
+Materialized views backing the dashboard widgets.
+
+The views are pre-aggregated snapshots of the vulnerabilities/assets tables so dashboard
+endpoints read a handful of rows instead of scanning the base tables on every request.
+They are created alongside the tables (Base.metadata.create_all) and refreshed after
+each data load (vulnerability fetch, matching execution).
+"""
+
+from typing import Union
+
+from sqlalchemy import DDL, BigInteger, Column, Date, DateTime, MetaData, String, Table, event, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from src.models.vulnerability import Base
+
+# Views live on their own MetaData so create_all never tries to create them as tables
+view_metadata = MetaData()
+
+# Severity distribution: counts per severity and publication date. Date cutoffs (previous week
+# counts) are applied when reading, so they follow the current date rather than the refresh time.
+mv_severity_counts = Table(
+    "mv_severity_counts",
+    view_metadata,
+    Column("severity", String(20), primary_key=True),
+    Column("date", Date, primary_key=True),
+    Column("total", BigInteger, nullable=False),
+)
+
+# Asset ranking: matched vulnerability counts per asset (all assets with at least one match),
+# using the severity stored on each match row (kept in sync by the vulnerability upserts)
+mv_asset_ranking = Table(
+    "mv_asset_ranking",
+    view_metadata,
+    Column("asset_id", String(36), primary_key=True),
+    Column("asset_name", String(200), nullable=False),
+    Column("vulnerability_count", BigInteger, nullable=False),
+    Column("critical_count", BigInteger, nullable=False),
+    Column("high_count", BigInteger, nullable=False),
+)
+
+# Daily vulnerability counts by publication date (trend chart)
+mv_daily_vuln_counts = Table(
+    "mv_daily_vuln_counts",
+    view_metadata,
+    Column("date", Date, primary_key=True),
+    Column("detected", BigInteger, nullable=False),
+)
+
+# Last refresh time per view, written by refresh_materialized_views in the refresh transaction.
+# A regular table (created by create_all): the dashboard ETag is derived from it.
+view_refresh_state = Table(
+    "view_refresh_state",
+    Base.metadata,
+    Column("view_name", String(63), primary_key=True),
+    Column("refreshed_at", DateTime(timezone=True), nullable=False),
+)
+
+_VIEW_DDL = {
+    mv_severity_counts: (
+        # Replace the earlier per-severity definition (with a refresh-time prev_total column)
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_attribute
+                WHERE attrelid = to_regclass('mv_severity_counts') AND attname = 'prev_total'
+            ) THEN
+                DROP MATERIALIZED VIEW mv_severity_counts;
+            END IF;
+        END $$
+        """,
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_severity_counts AS
+        SELECT severity, date(published_date) AS date, COUNT(*) AS total
+        FROM vulnerabilities
+        WHERE severity IS NOT NULL
+        GROUP BY severity, date(published_date)
+        """,
+        # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+        "CREATE UNIQUE INDEX IF NOT EXISTS mv_severity_counts_severity_date ON mv_severity_counts (severity, date)",
+    ),
+    mv_asset_ranking: (
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_asset_ranking AS
+        SELECT a.asset_id,
+               a.asset_name,
+               COUNT(m.match_id) AS vulnerability_count,
+               COUNT(*) FILTER (WHERE m.severity = 'Critical') AS critical_count,
+               COUNT(*) FILTER (WHERE m.severity = 'High') AS high_count
+        FROM assets a
+        JOIN asset_vulnerability_matches m ON m.asset_id = a.asset_id
+        GROUP BY a.asset_id, a.asset_name
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS mv_asset_ranking_asset_id ON mv_asset_ranking (asset_id)",
+        "CREATE INDEX IF NOT EXISTS mv_asset_ranking_count ON mv_asset_ranking (vulnerability_count DESC)",
+    ),
+    mv_daily_vuln_counts: (
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_vuln_counts AS
+        SELECT date(published_date) AS date, COUNT(*) AS detected
+        FROM vulnerabilities
+        GROUP BY date(published_date)
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS mv_daily_vuln_counts_date ON mv_daily_vuln_counts (date)",
+    ),
+}
+
+# Views derived from the vulnerabilities table (refreshed after each vulnerability load)
+VULNERABILITY_VIEWS = (mv_severity_counts, mv_asset_ranking, mv_daily_vuln_counts)
+
+# Views derived from assets and matching results (refreshed after matching / asset deletion)
+ASSET_VIEWS = (mv_asset_ranking,)
+
+for _view, _statements in _VIEW_DDL.items():
+    for _statement in _statements:
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    event.listen(
+        Base.metadata,
+        "before_drop",
+        DDL(f"DROP MATERIALIZED VIEW IF EXISTS {_view.name}").execute_if(dialect="postgresql"),
+    )
+
+
+def refresh_materialized_views(db: Union[Session, Connection], views=VULNERABILITY_VIEWS) -> None:
+    """
+    Refresh materialized views without blocking concurrent readers.
+
+    The refresh time of each view is recorded in view_refresh_state in the same transaction,
+    so the recorded state never runs ahead of (or behind) the view contents.
+
+    Args:
+        db: Database session or connection (the caller commits)
+        views: View tables to refresh
+    """
+    for view in views:
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+        stmt = insert(view_refresh_state).values(view_name=view.name, refreshed_at=func.clock_timestamp())
+        db.execute(
+            stmt.on_conflict_do_update(index_elements=["view_name"], set_={"refreshed_at": stmt.excluded.refreshed_at})
+        )
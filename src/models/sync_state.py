@@ -0,0 +1,45 @@
+"""
+SQLAlchemy model for SyncState table.
+
+This module defines the SyncState model that stores the differential fetch cursor per data source.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.models.vulnerability import Base
+
+
+class SyncState(Base):
+    """
+    Differential fetch cursor for each vulnerability data source.
+
+    One row per source ('jvn', 'nvd') so each API tracks its own
+    last successful sync time independently.
+    """
+
+    __tablename__ = "sync_state"
+
+    # Primary key: data source name
+    source: Mapped[str] = mapped_column(String(20), primary_key=True, comment="Data source (jvn/nvd)")
+
+    # Cursor: start of the next differential fetch window
+    last_sync_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="Last successful sync time"
+    )
+
+    # Metadata: DB timestamp
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        comment="Record last update timestamp",
+    )
+
+    def __repr__(self) -> str:
+        """String representation of SyncState model."""
+        return f"<SyncState(source={self.source}, last_sync_at={self.last_sync_at})>"
@@ -8,7 +8,7 @@ import re
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, Float, String, Text
+from sqlalchemy import DDL, JSON, DateTime, Float, Index, String, Text, event
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -19,6 +19,34 @@ class Base(DeclarativeBase):
     pass
 
 
+# Trigram operator classes (gin_trgm_ops) used by the search indexes below
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+# Earlier versions of scripts/cleanup_test_data.py created the title trigram index as
+# vulnerabilities_title_trgm: adopt it under the model's name (or drop it when both exist)
+# rather than maintaining two identical GIN indexes
+ADOPT_LEGACY_TITLE_TRGM_INDEX = DDL(
+    """
+    DO $$
+    BEGIN
+        IF to_regclass('vulnerabilities_title_trgm') IS NOT NULL THEN
+            IF to_regclass('ix_vuln_title_trgm') IS NULL THEN
+                ALTER INDEX vulnerabilities_title_trgm RENAME TO ix_vuln_title_trgm;
+            ELSE
+                DROP INDEX vulnerabilities_title_trgm;
+            END IF;
+        END IF;
+    END $$
+    """
+)
+event.listen(Base.metadata, "after_create", ADOPT_LEGACY_TITLE_TRGM_INDEX.execute_if(dialect="postgresql"))
+
+
 class Vulnerability(Base):
     """
     Vulnerability information from JVN iPedia API.
@@ -32,6 +60,18 @@ class Vulnerability(Base):
 
     __tablename__ = "vulnerabilities"
 
+    # Composite index: severity counts as of a date (WHERE published_date <= X GROUP BY severity)
+    # can be answered by an index-only scan
+    # Composite index: keyset pagination of the default list order (modified_date, cve_id)
+    # Trigram indexes: the list search (ILIKE '%keyword%' on CVE ID and title) uses an index
+    # instead of scanning every row
+    __table_args__ = (
+        Index("ix_vuln_pubdate_severity", "published_date", "severity"),
+        Index("ix_vuln_modified_date_cve_id", "modified_date", "cve_id"),
+        Index("ix_vuln_cve_id_trgm", "cve_id", postgresql_using="gin", postgresql_ops={"cve_id": "gin_trgm_ops"}),
+        Index("ix_vuln_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+
     # Primary key: CVE ID (e.g., CVE-2024-0001)
     cve_id: Mapped[str] = mapped_column(String(20), primary_key=True, index=True, comment="CVE identifier")
 
@@ -94,9 +94,11 @@ class AssetListResponse(BaseModel):
     """Schema for asset list response."""
 
     items: list[AssetResponse] = Field(..., description="List of assets")
-    total: int = Field(..., description="Total number of assets")
+    total: int = Field(..., description="Total number of assets (approximate when paging by cursor)")
     page: int = Field(..., description="Current page number")
     limit: int = Field(..., description="Items per page")
+    has_more: bool = Field(False, description="Whether another page follows")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (pass as ?cursor=)")
 
     class Config:
         json_schema_extra = {
@@ -117,6 +119,8 @@ class AssetListResponse(BaseModel):
                 "total": 150,
                 "page": 1,
                 "limit": 50,
+                "has_more": True,
+                "next_cursor": "2026-01-27T09:00:00+00:00|550e8400-e29b-41d4-a716-446655440000",
             }
         }
 
@@ -5,7 +5,7 @@ This module defines Pydantic models for dashboard widget data.
 All schemas follow the OpenAPI specification for FastAPI integration.
 """
 
-from datetime import date
+import datetime
 from typing import List
 
 from pydantic import BaseModel, Field
@@ -64,7 +64,7 @@ class DashboardSummaryResponse(BaseModel):
 class TrendDataPointSchema(BaseModel):
     """Schema for a single trend data point."""
 
-    date: str = Field(..., description="Date in YYYY-MM-DD format")
+    date: datetime.date = Field(..., description="Date (serialized as YYYY-MM-DD)")
     detected: int = Field(0, ge=0, description="Number of vulnerabilities detected on this date")
 
     model_config = {
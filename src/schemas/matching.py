@@ -71,6 +71,8 @@ class MatchingResultListResponse(BaseModel):
     total: int = Field(..., description="Total number of matches")
     page: int = Field(..., description="Current page number")
     limit: int = Field(..., description="Items per page")
+    has_more: bool = Field(False, description="Whether another page follows")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (pass as ?cursor=)")
 
     class Config:
         json_schema_extra = {
@@ -91,6 +93,8 @@ class MatchingResultListResponse(BaseModel):
                 "total": 42,
                 "page": 1,
                 "limit": 50,
+                "has_more": False,
+                "next_cursor": None,
             }
         }
 
@@ -149,6 +149,10 @@ class VulnerabilityListResponse(BaseModel):
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, le=100, description="Number of items per page")
     total_pages: int = Field(..., ge=0, description="Total number of pages")
+    has_more: bool = Field(False, description="Whether another page follows")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as ?cursor=; date sorts only)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -173,6 +177,8 @@ class VulnerabilityListResponse(BaseModel):
                 "page": 1,
                 "page_size": 50,
                 "total_pages": 30,
+                "has_more": True,
+                "next_cursor": "2024-01-20T00:00:00+00:00|CVE-2024-0001",
             }
         }
     }
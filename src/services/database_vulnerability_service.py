@@ -6,22 +6,63 @@ including search, filtering, sorting, and UPSERT operations.
 """
 
 import logging
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import case, or_
+from sqlalchemy import bindparam, case, func, literal_column, or_, select, text, tuple_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from src.models.dashboard_views import VULNERABILITY_VIEWS, refresh_materialized_views
+from src.models.sync_state import SyncState
 from src.models.vulnerability import Vulnerability
 from src.schemas.vulnerability import (
     VulnerabilityCreate,
     VulnerabilityListResponse,
     VulnerabilityResponse,
 )
+from src.services.vulnerability_bulk_copy import copy_vulnerabilities
+from src.utils.pagination import approximate_row_count, encode_cursor
+from src.utils.response_cache import invalidate_vulnerability_caches
 
 logger = logging.getLogger(__name__)
 
+# Sort fields that support keyset (cursor) pagination: non-null timestamps, tie-broken by cve_id
+KEYSET_SORT_FIELDS = frozenset({"published_date", "modified_date"})
+
+# Rows per multi-row INSERT statement (keeps bind parameters well below PostgreSQL's 65535 limit)
+UPSERT_BATCH_SIZE = 1000
+
+# Rows per COPY in bulk mode (no bind parameters involved, so batches can be much larger)
+BULK_COPY_BATCH_SIZE = 10000
+
+# Fields copied from ORM rows into VulnerabilityResponse without validation (list hot path)
+_RESPONSE_FIELDS = tuple(VulnerabilityResponse.model_fields)
+
+# Fixed statements, built once at import and reused (with bind parameters) by every service instance
+# (populate_existing: objects already in the session are overwritten with the fetched row, since
+# commits no longer expire them and Core UPSERTs bypass the identity map)
+_VULNERABILITY_BY_CVE_ID_STMT = (
+    select(Vulnerability)
+    .where(Vulnerability.cve_id == bindparam("cve_id"))
+    .execution_options(populate_existing=True)
+)
+_LATEST_MODIFIED_DATE_STMT = select(func.max(Vulnerability.modified_date))
+
+# Copy the current severity of updated vulnerabilities onto their match rows
+# (asset_vulnerability_matches.severity is denormalized for the asset ranking view)
+_SYNC_MATCH_SEVERITY_STMT = text(
+    """
+    UPDATE asset_vulnerability_matches m
+    SET severity = v.severity
+    FROM vulnerabilities v
+    WHERE v.cve_id = m.cve_id
+      AND m.cve_id = ANY(:cve_ids)
+      AND m.severity IS DISTINCT FROM v.severity
+    """
+)
+
 
 class DatabaseVulnerabilityService:
     """
@@ -52,16 +93,22 @@ class DatabaseVulnerabilityService:
         sort_by: str = "modified_date",
         sort_order: str = "desc",
         search: Optional[str] = None,
+        cursor: Optional[tuple[datetime, str]] = None,
     ) -> VulnerabilityListResponse:
         """
         Search and filter vulnerability data with pagination.
 
+        With a cursor (only for date sorts, see KEYSET_SORT_FIELDS), the page is fetched by
+        keyset (sort date, cve_id) instead of OFFSET, and total is the planner's estimate
+        unless a search filter is applied.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed; ignored when cursor is given)
             page_size: Number of items per page (1-100)
             sort_by: Sort field (published_date, modified_date, severity, cvss_score)
             sort_order: Sort order (asc or desc)
             search: Search keyword (CVE ID or title partial match)
+            cursor: Decoded keyset cursor (sort date, cve_id) of the previous page's last row
 
         Returns:
             VulnerabilityListResponse: Paginated vulnerability list
@@ -75,8 +122,8 @@ class DatabaseVulnerabilityService:
                 f"sort_by={sort_by}, sort_order={sort_order}, search={search}"
             )
 
-            # Start with base query
-            query = self.db.query(Vulnerability)
+            # Start with base query (rows overwrite stale objects in the session, see _VULNERABILITY_BY_CVE_ID_STMT)
+            query = self.db.query(Vulnerability).populate_existing()
 
             # Apply search filter (CVE ID or title partial match)
             if search:
@@ -89,31 +136,60 @@ class DatabaseVulnerabilityService:
                 )
                 logger.debug(f"Applied search filter: {search}")
 
-            # Apply sorting
-            query = self._apply_sorting(query, sort_by, sort_order)
-
-            # Get total count before pagination
-            total = query.count()
+            total = None
+            if cursor:
+                # Keyset pagination: seek past the previous page's last row instead of scanning an OFFSET
+                keyset = tuple_(getattr(Vulnerability, sort_by), Vulnerability.cve_id)
+                page_query = query.filter(keyset < tuple_(*cursor) if sort_order == "desc" else keyset > tuple_(*cursor))
+                if not search:
+                    total = approximate_row_count(self.db, Vulnerability.__tablename__)
+                # Apply sorting and fetch one extra row to know whether another page follows
+                rows = self._apply_sorting(page_query, sort_by, sort_order).limit(page_size + 1).all()
+            else:
+                # Page-number navigation: the exact total comes back with the page as a window count,
+                # so the search predicate is evaluated once instead of again by a separate COUNT
+                offset = (page - 1) * page_size
+                page_query = self._apply_sorting(
+                    query.add_columns(func.count().over().label("_total")), sort_by, sort_order
+                )
+                counted_rows = page_query.offset(offset).limit(page_size + 1).all()
+                rows = [row[0] for row in counted_rows]
+                if counted_rows:
+                    total = counted_rows[0][1]
+                elif not offset:
+                    total = 0
+
+            has_more = len(rows) > page_size
+            items = rows[:page_size]
+            next_cursor = None
+            if has_more and sort_by in KEYSET_SORT_FIELDS:
+                next_cursor = encode_cursor(getattr(items[-1], sort_by), items[-1].cve_id)
+
+            # Exact count when the window count is unavailable (page past the end, or a searched cursor page)
+            if total is None:
+                total = query.count()
             logger.debug(f"Total records found: {total}")
 
-            # Apply pagination
-            offset = (page - 1) * page_size
-            items = query.offset(offset).limit(page_size).all()
-
             # Calculate total pages
             total_pages = (total + page_size - 1) // page_size
 
             logger.info(f"Returning page {page}/{total_pages} with {len(items)} items (total: {total})")
 
-            # Convert SQLAlchemy models to Pydantic schemas
-            response_items = [VulnerabilityResponse.model_validate(item) for item in items]
+            # Convert SQLAlchemy models to Pydantic schemas: rows come from typed columns,
+            # so construct without re-running validation
+            response_items = [
+                VulnerabilityResponse.model_construct(**{field: getattr(item, field) for field in _RESPONSE_FIELDS})
+                for item in items
+            ]
 
-            return VulnerabilityListResponse(
+            return VulnerabilityListResponse.model_construct(
                 items=response_items,
                 total=total,
                 page=page,
                 page_size=page_size,
                 total_pages=total_pages,
+                has_more=has_more,
+                next_cursor=next_cursor,
             )
 
         except SQLAlchemyError as e:
@@ -149,12 +225,12 @@ class DatabaseVulnerabilityService:
 
             logger.debug(f"Applied custom severity sorting: {sort_order}")
         else:
-            # Standard column sorting
+            # Standard column sorting (cve_id breaks ties so keyset cursors are stable)
             order_column = getattr(Vulnerability, sort_by)
             if sort_order == "desc":
-                query = query.order_by(order_column.desc())
+                query = query.order_by(order_column.desc(), Vulnerability.cve_id.desc())
             else:
-                query = query.order_by(order_column.asc())
+                query = query.order_by(order_column.asc(), Vulnerability.cve_id.asc())
 
             logger.debug(f"Applied standard sorting: {sort_by} {sort_order}")
 
@@ -176,7 +252,7 @@ class DatabaseVulnerabilityService:
         try:
             logger.info(f"Fetching vulnerability: {cve_id}")
 
-            vulnerability = self.db.query(Vulnerability).filter(Vulnerability.cve_id == cve_id).first()
+            vulnerability = self.db.scalars(_VULNERABILITY_BY_CVE_ID_STMT, {"cve_id": cve_id}).first()
 
             if vulnerability:
                 logger.info(f"Found vulnerability: {cve_id}")
@@ -218,23 +294,25 @@ class DatabaseVulnerabilityService:
             # ON CONFLICT DO UPDATE: update all fields except cve_id and created_at
             update_dict = {key: value for key, value in data_dict.items() if key not in ["cve_id", "created_at"]}
 
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["cve_id"],  # Primary key
-                set_=update_dict,
+            # RETURNING hands back the stored row, so no follow-up SELECT is needed
+            stmt = (
+                stmt.on_conflict_do_update(
+                    index_elements=["cve_id"],  # Primary key
+                    set_=update_dict,
+                )
+                .returning(Vulnerability)
+                .execution_options(populate_existing=True)
             )
 
-            # Execute UPSERT
-            self.db.execute(stmt)
+            # Execute UPSERT and serialize the returned row before commit expires it
+            vulnerability = self.db.scalars(stmt).one()
+            result = VulnerabilityResponse.model_validate(vulnerability)
+            self._sync_match_severity([vulnerability_data.cve_id])
             self.db.commit()
+            invalidate_vulnerability_caches()
 
             logger.info(f"UPSERT completed: {vulnerability_data.cve_id}")
 
-            # Fetch and return the inserted/updated record
-            result = self.get_vulnerability_by_cve_id(vulnerability_data.cve_id)
-
-            if result is None:
-                raise SQLAlchemyError(f"UPSERT succeeded but record not found: {vulnerability_data.cve_id}")
-
             return result
 
         except IntegrityError as e:
@@ -246,7 +324,13 @@ class DatabaseVulnerabilityService:
             self.db.rollback()
             raise
 
-    def upsert_vulnerabilities_batch(self, vulnerabilities_data: list[VulnerabilityCreate]) -> dict[str, int]:
+    def upsert_vulnerabilities_batch(
+        self,
+        vulnerabilities_data: list[VulnerabilityCreate],
+        on_conflict: str = "update",
+        mode: str = "upsert",
+        progress_every: int = 1000,
+    ) -> dict[str, int]:
         """
         Batch UPSERT vulnerabilities with transaction management.
 
@@ -255,48 +339,66 @@ class DatabaseVulnerabilityService:
 
         Args:
             vulnerabilities_data: List of vulnerability data to insert/update
+            on_conflict: "update" to overwrite existing rows, or "do_nothing" to insert only
+                CVE IDs that are not yet stored (duplicates are skipped inside PostgreSQL)
+            mode: "upsert" for multi-row INSERT statements, or "bulk" to COPY the rows into a
+                temporary staging table and merge them with one INSERT ... SELECT (for large backfills)
+            progress_every: Log a progress line each time this many rows have been written
 
         Returns:
             dict: Statistics with keys 'inserted', 'updated', 'failed'
 
         Raises:
+            ValueError: If on_conflict or mode is not a supported value
             SQLAlchemyError: Database operation error (with automatic rollback)
         """
+        if on_conflict not in ("update", "do_nothing"):
+            raise ValueError(f"Invalid on_conflict: {on_conflict}. Must be one of: update, do_nothing")
+        if mode == "bulk":
+            return self._copy_vulnerabilities_batch(vulnerabilities_data, on_conflict)
+        if mode != "upsert":
+            raise ValueError(f"Invalid mode: {mode}. Must be one of: upsert, bulk")
+
+        if on_conflict == "do_nothing":
+            return self._insert_new_vulnerabilities_batch(vulnerabilities_data, progress_every)
+
         stats = {"inserted": 0, "updated": 0, "failed": 0}
+        updated_cve_ids = []
 
         try:
             logger.info(f"Batch UPSERT: {len(vulnerabilities_data)} vulnerabilities")
 
-            for vuln_data in vulnerabilities_data:
-                try:
-                    # Check if record exists
-                    existing = self.db.query(Vulnerability).filter(Vulnerability.cve_id == vuln_data.cve_id).first()
-
-                    # Perform UPSERT
-                    data_dict = vuln_data.model_dump()
-                    stmt = insert(Vulnerability).values(**data_dict)
+            # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement,
+            # so keep only the last occurrence of each CVE ID
+            rows = list({v.cve_id: v.model_dump() for v in vulnerabilities_data}.values())
 
-                    update_dict = {
-                        key: value for key, value in data_dict.items() if key not in ["cve_id", "created_at"]
-                    }
+            for offset in range(0, len(rows), UPSERT_BATCH_SIZE):
+                chunk = rows[offset : offset + UPSERT_BATCH_SIZE]
+                stmt = insert(Vulnerability).values(chunk)
 
-                    stmt = stmt.on_conflict_do_update(index_elements=["cve_id"], set_=update_dict)
+                update_dict = {
+                    key: stmt.excluded[key] for key in chunk[0] if key not in ["cve_id", "created_at"]
+                }
 
-                    self.db.execute(stmt)
+                # xmax = 0 only for freshly inserted tuples, so one statement reports inserted vs updated
+                stmt = stmt.on_conflict_do_update(index_elements=["cve_id"], set_=update_dict).returning(
+                    Vulnerability.cve_id, literal_column("xmax = 0")
+                )
 
-                    # Track statistics
-                    if existing:
-                        stats["updated"] += 1
-                    else:
+                for cve_id, inserted in self.db.execute(stmt):
+                    if inserted:
                         stats["inserted"] += 1
+                    else:
+                        stats["updated"] += 1
+                        updated_cve_ids.append(cve_id)
+
+                self._log_progress("Batch UPSERT", offset, len(chunk), len(rows), progress_every)
 
-                except Exception as e:
-                    logger.error(f"Failed to UPSERT {vuln_data.cve_id}: {e}")
-                    stats["failed"] += 1
-                    raise  # Re-raise to trigger rollback
+            self._sync_match_severity(updated_cve_ids)
 
             # Commit all changes
             self.db.commit()
+            invalidate_vulnerability_caches()
 
             logger.info(
                 f'Batch UPSERT completed: inserted={stats["inserted"]}, '
@@ -310,6 +412,131 @@ class DatabaseVulnerabilityService:
             self.db.rollback()
             raise
 
+    def _insert_new_vulnerabilities_batch(
+        self, vulnerabilities_data: list[VulnerabilityCreate], progress_every: int = 1000
+    ) -> dict[str, int]:
+        """
+        Insert vulnerabilities whose CVE IDs are not stored yet, skipping existing ones.
+
+        Uses multi-row INSERT ... ON CONFLICT (cve_id) DO NOTHING RETURNING cve_id so the
+        duplicate check runs against the primary key index inside PostgreSQL instead of
+        transferring every stored CVE ID to Python.
+
+        Args:
+            vulnerabilities_data: List of vulnerability data to insert
+            progress_every: Log a progress line each time this many rows have been written
+
+        Returns:
+            dict: Statistics with keys 'inserted', 'updated' (always 0), 'failed'
+
+        Raises:
+            SQLAlchemyError: Database operation error (with automatic rollback)
+        """
+        stats = {"inserted": 0, "updated": 0, "failed": 0}
+
+        try:
+            logger.info(f"Batch INSERT (skip existing): {len(vulnerabilities_data)} vulnerabilities")
+
+            for offset in range(0, len(vulnerabilities_data), UPSERT_BATCH_SIZE):
+                rows = [v.model_dump() for v in vulnerabilities_data[offset : offset + UPSERT_BATCH_SIZE]]
+                stmt = (
+                    insert(Vulnerability)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=["cve_id"])
+                    .returning(Vulnerability.cve_id)
+                )
+                stats["inserted"] += len(self.db.execute(stmt).all())
+
+                self._log_progress("Batch INSERT", offset, len(rows), len(vulnerabilities_data), progress_every)
+
+            self.db.commit()
+            invalidate_vulnerability_caches()
+
+            logger.info(
+                f"Batch INSERT completed: inserted={stats['inserted']}, "
+                f"skipped={len(vulnerabilities_data) - stats['inserted']}"
+            )
+
+            return stats
+
+        except SQLAlchemyError as e:
+            logger.error(f"Batch INSERT failed, rolling back: {e}", exc_info=True)
+            self.db.rollback()
+            raise
+
+    @staticmethod
+    def _log_progress(label: str, offset: int, chunk_size: int, total: int, progress_every: int) -> None:
+        """
+        Log batch progress when a chunk crosses a multiple of progress_every rows.
+
+        The final chunk is skipped because the completion log already reports it.
+
+        Args:
+            label: Operation name for the log line
+            offset: Rows written before this chunk
+            chunk_size: Rows in this chunk
+            total: Total rows in the batch
+            progress_every: Progress interval in rows (0 disables progress logs)
+        """
+        processed = offset + chunk_size
+        if not progress_every or processed >= total or processed // progress_every == offset // progress_every:
+            return
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{label} progress: {processed}/{total}")
+
+    def _sync_match_severity(self, cve_ids: list[str]) -> None:
+        """
+        Update the severity stored on match rows of the given vulnerabilities.
+
+        Runs in the caller's transaction, after the vulnerabilities are written, so the
+        asset ranking never counts a severity the vulnerability no longer has.
+
+        Args:
+            cve_ids: CVE IDs of the updated vulnerabilities (newly inserted ones have no matches yet)
+        """
+        if cve_ids:
+            self.db.execute(_SYNC_MATCH_SEVERITY_STMT, {"cve_ids": cve_ids})
+
+    def _copy_vulnerabilities_batch(
+        self, vulnerabilities_data: list[VulnerabilityCreate], on_conflict: str
+    ) -> dict[str, int]:
+        """
+        Bulk load vulnerabilities with COPY FROM STDIN through a temporary staging table.
+
+        The COPY and merge (see src.services.vulnerability_bulk_copy) run in one transaction
+        together with the match severity sync.
+
+        Args:
+            vulnerabilities_data: List of vulnerability data to load
+            on_conflict: "update" to overwrite existing rows, or "do_nothing" to skip them
+
+        Returns:
+            dict: Statistics with keys 'inserted', 'updated', 'failed'
+
+        Raises:
+            SQLAlchemyError: Database operation error (with automatic rollback)
+        """
+        try:
+            logger.info(f"Bulk COPY: {len(vulnerabilities_data)} vulnerabilities")
+
+            stats, updated_cve_ids = copy_vulnerabilities(self.db, vulnerabilities_data, on_conflict)
+            self._sync_match_severity(updated_cve_ids)
+
+            self.db.commit()
+            invalidate_vulnerability_caches()
+
+            logger.info(
+                f'Bulk COPY completed: inserted={stats["inserted"]}, '
+                f'updated={stats["updated"]}, failed={stats["failed"]}'
+            )
+
+            return stats
+
+        except SQLAlchemyError as e:
+            logger.error(f"Bulk COPY failed, rolling back: {e}", exc_info=True)
+            self.db.rollback()
+            raise
+
     def delete_vulnerability(self, cve_id: str) -> bool:
         """
         Delete vulnerability by CVE ID.
@@ -329,6 +556,7 @@ class DatabaseVulnerabilityService:
             result = self.db.query(Vulnerability).filter(Vulnerability.cve_id == cve_id).delete()
 
             self.db.commit()
+            invalidate_vulnerability_caches()
 
             if result > 0:
                 logger.info(f"Deleted vulnerability: {cve_id}")
@@ -342,14 +570,14 @@ class DatabaseVulnerabilityService:
             self.db.rollback()
             raise
 
-    def get_latest_modified_date(self) -> Optional[str]:
+    def get_latest_modified_date(self) -> Optional[datetime]:
         """
         Get the latest modified_date from the database.
 
         Used for differential data fetching from JVN iPedia API.
 
         Returns:
-            Optional[str]: Latest modified date in ISO 8601 format, or None if no records
+            Optional[datetime]: Latest modified date, or None if no records
 
         Raises:
             SQLAlchemyError: Database query error
@@ -357,39 +585,81 @@ class DatabaseVulnerabilityService:
         try:
             logger.debug("Fetching latest modified_date")
 
-            result = self.db.query(Vulnerability.modified_date).order_by(Vulnerability.modified_date.desc()).first()
+            # MAX is answered from the end of ix_vuln_modified_date_cve_id (no table scan)
+            latest_date = self.db.scalar(_LATEST_MODIFIED_DATE_STMT)
 
-            if result:
-                latest_date = result[0].isoformat()
-                logger.info(f"Latest modified_date: {latest_date}")
-                return latest_date
+            if latest_date is not None:
+                logger.info(f"Latest modified_date: {latest_date.isoformat()}")
             else:
                 logger.info("No records found, returning None")
-                return None
+            return latest_date
 
         except SQLAlchemyError as e:
             logger.error(f"Database error in get_latest_modified_date: {e}", exc_info=True)
             raise
 
-    def get_all_cve_ids(self) -> set[str]:
+    def get_sync_cursor(self, source: str) -> Optional[datetime]:
         """
-        Get all CVE IDs currently in the database.
+        Get the differential fetch cursor for a data source.
+
+        Args:
+            source: Data source name ('jvn' or 'nvd')
 
         Returns:
-            set[str]: Set of CVE IDs
+            Optional[datetime]: Last successful sync time, or None if the source has never synced
 
         Raises:
             SQLAlchemyError: Database query error
         """
         try:
-            logger.debug("Fetching all CVE IDs from database")
+            state = self.db.get(SyncState, source)
+            return state.last_sync_at if state else None
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error in get_sync_cursor: {e}", exc_info=True)
+            raise
 
-            results = self.db.query(Vulnerability.cve_id).all()
-            cve_ids = {row[0] for row in results}
+    def set_sync_cursor(self, source: str, last_sync_at: datetime) -> None:
+        """
+        Store the differential fetch cursor for a data source.
 
-            logger.info(f"Found {len(cve_ids)} unique CVE IDs in database")
-            return cve_ids
+        Args:
+            source: Data source name ('jvn' or 'nvd')
+            last_sync_at: Start of the next differential fetch window
+
+        Raises:
+            SQLAlchemyError: Database operation error (with automatic rollback)
+        """
+        try:
+            stmt = insert(SyncState).values(source=source, last_sync_at=last_sync_at)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source"],
+                set_={"last_sync_at": stmt.excluded.last_sync_at, "updated_at": func.now()},
+            )
+            self.db.execute(stmt)
+            self.db.commit()
+            logger.info(f"Sync cursor updated: {source} -> {last_sync_at.isoformat()}")
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error in get_all_cve_ids: {e}", exc_info=True)
+            logger.error(f"Database error in set_sync_cursor: {e}", exc_info=True)
+            self.db.rollback()
+            raise
+
+    def refresh_dashboard_views(self) -> None:
+        """
+        Refresh the dashboard materialized views derived from the vulnerabilities table.
+
+        Called after vulnerability data has been written so dashboard widgets see the new rows.
+
+        Raises:
+            SQLAlchemyError: Database operation error (with automatic rollback)
+        """
+        try:
+            refresh_materialized_views(self.db, VULNERABILITY_VIEWS)
+            self.db.commit()
+            logger.info("Dashboard materialized views refreshed")
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error in refresh_dashboard_views: {e}", exc_info=True)
+            self.db.rollback()
             raise
@@ -17,11 +17,15 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from src.models.asset import Asset, AssetVulnerabilityMatch
+from src.models.dashboard_views import ASSET_VIEWS, refresh_materialized_views
 from src.models.vulnerability import Vulnerability
 from src.utils.cpe_generator import extract_cpe_parts
 
 logger = logging.getLogger(__name__)
 
+# Vulnerabilities fetched per round trip while streaming them through full matching
+MATCHING_VULNERABILITY_BATCH_SIZE = 1000
+
 
 def match_exact(asset_cpe: str, vulnerability_cpe: str) -> bool:
     """
@@ -268,18 +272,21 @@ def execute_full_matching(db: Session) -> Dict[str, int]:
     """
     logger.info("Starting full matching execution...")
 
-    # Retrieve all assets and vulnerabilities
+    # Retrieve all assets; vulnerabilities are streamed from a server-side cursor in
+    # MATCHING_VULNERABILITY_BATCH_SIZE batches instead of being loaded all at once
     assets = db.query(Asset).all()
-    vulnerabilities = db.query(Vulnerability).all()
+    vulnerabilities = db.query(Vulnerability).yield_per(MATCHING_VULNERABILITY_BATCH_SIZE)
 
-    logger.info(f"Processing {len(assets)} assets and {len(vulnerabilities)} vulnerabilities")
+    logger.info(f"Processing {len(assets)} assets against all vulnerabilities")
 
     matches = []
     match_stats = {"exact_match": 0, "version_range": 0, "wildcard_match": 0}
+    total_vulnerabilities = 0
 
     # Perform matching for each asset-vulnerability pair
-    for asset in assets:
-        for vulnerability in vulnerabilities:
+    for vulnerability in vulnerabilities:
+        total_vulnerabilities += 1
+        for asset in assets:
             match_reason = execute_matching(asset, vulnerability)
             if match_reason:
                 matches.append(
@@ -287,12 +294,13 @@ def execute_full_matching(db: Session) -> Dict[str, int]:
                         "asset_id": asset.asset_id,
                         "cve_id": vulnerability.cve_id,
                         "match_reason": match_reason,
+                        "severity": vulnerability.severity,
                         "matched_at": datetime.now(),
                     }
                 )
                 match_stats[match_reason] += 1
 
-    logger.info(f"Found {len(matches)} matches: {match_stats}")
+    logger.info(f"Found {len(matches)} matches in {total_vulnerabilities} vulnerabilities: {match_stats}")
 
     # UPSERT matches to database (insert or update on conflict)
     if matches:
@@ -300,10 +308,13 @@ def execute_full_matching(db: Session) -> Dict[str, int]:
             db.execute(
                 text(
                     """
-                    INSERT INTO asset_vulnerability_matches (match_id, asset_id, cve_id, match_reason, matched_at)
-                    VALUES (gen_random_uuid(), :asset_id, :cve_id, :match_reason, :matched_at)
+                    INSERT INTO asset_vulnerability_matches
+                        (match_id, asset_id, cve_id, match_reason, severity, matched_at)
+                    VALUES (gen_random_uuid(), :asset_id, :cve_id, :match_reason, :severity, :matched_at)
                     ON CONFLICT (asset_id, cve_id)
-                    DO UPDATE SET match_reason = EXCLUDED.match_reason, matched_at = EXCLUDED.matched_at
+                    DO UPDATE SET match_reason = EXCLUDED.match_reason,
+                                  severity = EXCLUDED.severity,
+                                  matched_at = EXCLUDED.matched_at
                     """
                 ),
                 match,
@@ -311,9 +322,13 @@ def execute_full_matching(db: Session) -> Dict[str, int]:
         db.commit()
         logger.info(f"Stored {len(matches)} matches to database")
 
+        # Asset ranking is a materialized view over the matching results
+        refresh_materialized_views(db, ASSET_VIEWS)
+        db.commit()
+
     return {
         "total_assets": len(assets),
-        "total_vulnerabilities": len(vulnerabilities),
+        "total_vulnerabilities": total_vulnerabilities,
         "total_matches": len(matches),
         "exact_matches": match_stats["exact_match"],
         "version_range_matches": match_stats["version_range"],
@@ -0,0 +1,113 @@
+"""
+Bulk loading of vulnerabilities with PostgreSQL COPY.
+
+Rows are streamed with COPY FROM STDIN into a temporary staging table, then merged into
+vulnerabilities with a single INSERT ... SELECT ... ON CONFLICT. Transaction handling
+(commit/rollback) is left to the caller, see DatabaseVulnerabilityService.
+"""
+
+import io
+import json
+from datetime import datetime
+
+from sqlalchemy import JSON, text
+from sqlalchemy.orm import Session
+
+from src.models.vulnerability import Vulnerability
+from src.schemas.vulnerability import VulnerabilityCreate
+
+# Columns written by COPY in bulk mode, and the subset serialized as JSON
+COPY_COLUMNS = tuple(VulnerabilityCreate.model_fields)
+JSON_COLUMNS = frozenset(c.name for c in Vulnerability.__table__.columns if isinstance(c.type, JSON))
+
+
+def _copy_text_value(value: object, is_json: bool = False) -> str:
+    """
+    Format a value for PostgreSQL COPY text format.
+
+    Args:
+        value: Column value
+        is_json: Serialize the value as JSON
+
+    Returns:
+        str: Escaped field (\\N for NULL)
+    """
+    if value is None:
+        return "\\N"
+    if is_json:
+        value = json.dumps(value, ensure_ascii=False)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def copy_vulnerabilities(
+    db: Session, vulnerabilities_data: list[VulnerabilityCreate], on_conflict: str
+) -> tuple[dict[str, int], list[str]]:
+    """
+    Bulk load vulnerabilities with COPY FROM STDIN through a temporary staging table.
+
+    COPY bypasses per-statement parsing, then a single INSERT ... SELECT ... ON CONFLICT
+    merges the staged rows into vulnerabilities within the caller's transaction.
+
+    Args:
+        db: Database session (the caller commits or rolls back)
+        vulnerabilities_data: List of vulnerability data to load
+        on_conflict: "update" to overwrite existing rows, or "do_nothing" to skip them
+
+    Returns:
+        tuple: Statistics with keys 'inserted', 'updated', 'failed', and the CVE IDs of updated rows
+    """
+    stats = {"inserted": 0, "updated": 0, "failed": 0}
+    updated_cve_ids = []
+
+    if not vulnerabilities_data:
+        return stats, updated_cve_ids
+
+    column_list = ", ".join(f'"{column}"' for column in COPY_COLUMNS)
+
+    if on_conflict == "do_nothing":
+        conflict_clause = "DO NOTHING"
+    else:
+        conflict_clause = "DO UPDATE SET " + ", ".join(
+            f'"{column}" = EXCLUDED."{column}"' for column in COPY_COLUMNS if column != "cve_id"
+        )
+
+    # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement,
+    # so stage only the last occurrence of each CVE ID (as the upsert path does)
+    rows = {v.cve_id: v.model_dump() for v in vulnerabilities_data}.values()
+
+    buffer = io.StringIO()
+    for row in rows:
+        fields = (_copy_text_value(row[column], column in JSON_COLUMNS) for column in COPY_COLUMNS)
+        buffer.write("\t".join(fields))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    # Temporary tables are not WAL-logged and are dropped at commit
+    db.execute(
+        text("CREATE TEMP TABLE vulnerabilities_staging (LIKE vulnerabilities INCLUDING DEFAULTS) ON COMMIT DROP")
+    )
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY vulnerabilities_staging ({column_list}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+
+    result = db.execute(
+        text(
+            f"INSERT INTO vulnerabilities ({column_list}) "
+            f"SELECT {column_list} FROM vulnerabilities_staging "
+            f"ON CONFLICT (cve_id) {conflict_clause} "
+            "RETURNING cve_id, (xmax = 0)"
+        )
+    )
+    for cve_id, inserted in result:
+        if inserted:
+            stats["inserted"] += 1
+        else:
+            stats["updated"] += 1
+            updated_cve_ids.append(cve_id)
+
+    return stats, updated_cve_ids
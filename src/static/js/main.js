@@ -270,11 +270,28 @@ async function fetchNow() {
             }
         });
 
+        if (response.status === 409) {
+            throw new Error('取得処理が既に実行中です');
+        }
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
 
-        const data = await response.json();
+        // The fetch runs in the background: poll its status until it finishes
+        const job = await response.json();
+        let data;
+        do {
+            await new Promise(resolve => setTimeout(resolve, 2000));
+            const statusResponse = await fetch(job.status_url);
+            if (!statusResponse.ok) {
+                throw new Error(`HTTP error! status: ${statusResponse.status}`);
+            }
+            data = await statusResponse.json();
+        } while (data.status === 'running');
+
+        if (data.status === 'failed') {
+            throw new Error(data.message);
+        }
 
         // Show success message
         alert(
@@ -9,8 +9,13 @@ This module provides functions to generate CPE 2.3 format codes from various sou
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
+# Version constraint prefixes (^, ~, >=, <=, <, >) and suffix separators (-alpine, _beta, etc.)
+_VERSION_PREFIX_RE = re.compile(r"^[\^~>=<]+")
+_VERSION_SUFFIX_RE = re.compile(r"[-_]")
+
 
 # NPM package vendor mapping (major packages only)
 NPM_VENDOR_MAP: Dict[str, str] = {
@@ -67,11 +72,13 @@ DOCKER_VENDOR_MAP: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_version(version: str) -> str:
     """
     Normalize version string for CPE code.
 
     Removes version constraint prefixes (^, ~, >=, <=, <, >) and suffixes (-alpine, -slim, etc.).
+    Results are cached since lockfiles repeat the same version strings across many packages.
 
     Args:
         version: Version string (e.g., "^5.4", "1.25.3-alpine")
@@ -90,10 +97,10 @@ def normalize_version(version: str) -> str:
         '1.0.0'
     """
     # Remove constraint prefixes (^, ~, >=, <=, <, >)
-    version = re.sub(r"^[\^~>=<]+", "", version)
+    version = _VERSION_PREFIX_RE.sub("", version)
 
     # Remove suffixes (-alpine, -slim, -buster, etc.)
-    version = re.split(r"[-_]", version)[0]
+    version = _VERSION_SUFFIX_RE.split(version, 1)[0]
 
     return version.strip()
 
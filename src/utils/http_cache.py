@@ -0,0 +1,70 @@
+"""
+HTTP caching helpers (ETag / If-None-Match, Cache-Control).
+
+Dashboard endpoints are polled by the UI while the underlying data changes only when
+vulnerabilities are loaded or matching is executed, and every such change ends with a
+refresh of the dashboard materialized views. The last refresh time is used as a weak ETag
+so repeat requests are answered with 304 Not Modified before any aggregation runs.
+"""
+
+import hashlib
+from datetime import date
+from typing import Optional
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.database import get_db
+
+# Dashboard data changes only on data loads: browsers and proxies may reuse a response for a
+# minute and serve it stale for five more while revalidating (with the ETag) in the background
+DASHBOARD_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# A single CVE record rarely changes after publication
+VULNERABILITY_DETAIL_CACHE_CONTROL = "public, max-age=3600, stale-while-revalidate=86400"
+
+# Written by refresh_materialized_views in the refresh transaction, so the ETag changes exactly
+# when the dashboard views (and the data loads that trigger their refresh) do
+_DASHBOARD_FINGERPRINT_SQL = text("SELECT MAX(refreshed_at) FROM view_refresh_state")
+
+
+def compute_dashboard_etag(db: Session = Depends(get_db)) -> str:
+    """
+    FastAPI dependency returning a weak ETag for dashboard data.
+
+    The current date is part of the fingerprint because date-relative widgets
+    (previous week counts, trend window) change at day boundaries even without new data.
+
+    Args:
+        db: Database session (dependency injection)
+
+    Returns:
+        Weak ETag value (e.g., 'W/"3f2a..."')
+    """
+    refreshed_at = db.execute(_DASHBOARD_FINGERPRINT_SQL).scalar()
+    raw = f"{refreshed_at}|{date.today()}"
+    return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def not_modified(
+    request: Request, response: Response, etag: str, cache_control: str = DASHBOARD_CACHE_CONTROL
+) -> Optional[Response]:
+    """
+    Apply an ETag and Cache-Control to the response and short-circuit matching conditional requests.
+
+    Args:
+        request: Incoming request (If-None-Match is read from it)
+        response: Response the handler will return (ETag and Cache-Control headers are set on it)
+        etag: ETag for the current state of the data
+        cache_control: Cache-Control header value
+
+    Returns:
+        A 304 Not Modified response if the client already has this version, otherwise None
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return None
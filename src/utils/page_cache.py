@@ -0,0 +1,101 @@
+"""
+On-disk conditional cache for fetched API pages (ETag / Last-Modified).
+
+Differential fetches request overlapping date windows on every run. Each page's parsed
+records are stored together with the validators the API sent, so the next request for the
+same parameters can be sent as a conditional request and a 304 Not Modified is answered
+from disk without downloading or parsing the page again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage(NamedTuple):
+    """A stored page: the validators of its response and its parsed records."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    records: List[Dict[str, Any]]
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that revalidate this page (If-None-Match / If-Modified-Since)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    File-per-page cache keyed by the request parameters.
+
+    Entries older than the TTL are ignored and overwritten by the next store. Entries are
+    written to a temporary file and moved into place, so concurrent fetch processes never
+    read a partially written entry.
+    """
+
+    def __init__(self, directory: str, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding one JSON file per page (created if missing)
+            ttl: Seconds an entry may be revalidated before it is refetched unconditionally
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, params: Dict[str, Any]) -> str:
+        """Entry file for the request parameters (independent of their order)."""
+        key = hashlib.sha256(urlencode(sorted(params.items())).encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, params: Dict[str, Any]) -> Optional[CachedPage]:
+        """Return the stored page for the request parameters, or None if missing, unreadable or expired."""
+        try:
+            with open(self._path(params), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            return None
+
+        return CachedPage(entry.get("etag"), entry.get("last_modified"), entry.get("records", []))
+
+    def set(
+        self, params: Dict[str, Any], etag: Optional[str], last_modified: Optional[str], records: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Store a page. Failures are logged and ignored (the cache is an optimization only).
+
+        Args:
+            params: Request parameters (cache key)
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            records: JSON-serializable parsed records of the page
+        """
+        entry = {"etag": etag, "last_modified": last_modified, "stored_at": time.time(), "records": records}
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(params))
+        except OSError as e:
+            logger.warning(f"Failed to store page in cache {self.directory}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
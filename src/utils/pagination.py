@@ -0,0 +1,69 @@
+"""
+Keyset (seek) pagination helpers.
+
+List endpoints that order by (timestamp DESC, id DESC) accept an opaque cursor pointing at
+the last row of the previous page, so deep pages are fetched with an indexed row-value
+comparison instead of an OFFSET scan.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """
+    Encode the keyset position of the last row on a page.
+
+    Args:
+        sort_value: Timestamp the list is ordered by
+        row_id: Unique tie-breaker of the row
+
+    Returns:
+        Cursor string ("<ISO 8601 timestamp>|<id>")
+    """
+    return f"{sort_value.isoformat()}|{row_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        (timestamp, id) tuple
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        sort_value, row_id = cursor.split("|", 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid cursor: {cursor}")
+
+
+def approximate_row_count(db: Session, table_name: str) -> Optional[int]:
+    """
+    Return the planner's row estimate for a table (constant time).
+
+    Used as the total on cursor pages, where an exact COUNT(*) would cost more than the page itself.
+
+    Args:
+        db: Database session
+        table_name: Table name
+
+    Returns:
+        Estimated row count, or None when the table has not been analyzed yet (reltuples < 0)
+    """
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"), {"table_name": table_name}
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
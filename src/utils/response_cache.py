@@ -0,0 +1,82 @@
+"""
+In-process TTL cache for API responses.
+
+Dashboard data changes only when vulnerabilities are loaded or matching is executed, while
+the UI polls it continuously. Responses are kept in memory for a short TTL. Callers include
+the data fingerprint (ETag) in the key, so a change to the underlying data simply misses the
+cache instead of requiring explicit invalidation across processes.
+
+Vulnerability list/detail responses are keyed by their request parameters instead and are
+cleared whenever this process writes vulnerabilities; writes from other processes (the
+scheduled fetch script) become visible once the TTL expires.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry expiry and LRU eviction.
+
+    Sync endpoints run in FastAPI's threadpool, so access is guarded by a lock.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries (least recently used entries are evicted)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ttl seconds."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Dashboard widgets (/api/dashboard/*, /api/matching/dashboard)
+dashboard_cache = TTLCache(ttl=300)
+
+# Vulnerability list pages (keyed by query parameters) and details (keyed by CVE ID)
+vulnerability_list_cache = TTLCache(ttl=300)
+vulnerability_detail_cache = TTLCache(ttl=3600, maxsize=1024)
+
+# CVE IDs whose detail lookup found nothing (short-lived, so repeated misses skip the database)
+vulnerability_missing_cache = TTLCache(ttl=60, maxsize=1024)
+
+
+def invalidate_vulnerability_caches() -> None:
+    """Drop cached vulnerability list/detail responses (and known misses) after vulnerabilities are written."""
+    vulnerability_list_cache.clear()
+    vulnerability_detail_cache.clear()
+    vulnerability_missing_cache.clear()
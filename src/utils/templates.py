@@ -0,0 +1,33 @@
+"""
+Shared Jinja2 templates for the HTML pages.
+
+All page routers render through one Jinja2 environment, so each template is compiled
+once per process. Compiled templates are also kept in a filesystem bytecode cache,
+which lets new worker processes skip parsing. Template files are only re-checked
+for changes in debug mode.
+"""
+
+import os
+import tempfile
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from src.config import settings
+
+# Template directory (relative to the project root, like the static files mount)
+TEMPLATE_DIRECTORY = "src/templates"
+
+# Compiled template bytecode, shared by all worker processes
+TEMPLATE_BYTECODE_CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), "jinja_cache")
+
+os.makedirs(TEMPLATE_BYTECODE_CACHE_DIRECTORY, exist_ok=True)
+
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(TEMPLATE_DIRECTORY),
+        autoescape=select_autoescape(),
+        auto_reload=settings.DEBUG,
+        bytecode_cache=FileSystemBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIRECTORY),
+    )
+)
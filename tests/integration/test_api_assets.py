@@ -294,6 +294,43 @@ class TestAssetListRetrieval:
         assert data["limit"] == 2
         assert len(data["items"]) <= 2
 
+    def test_list_assets_with_cursor(self, client, db_session, cleanup_test_assets):
+        """
+        Test M4.4: List assets with keyset cursor pagination.
+
+        Verifies:
+        - next_cursor is returned while more pages follow
+        - The cursor page continues without overlapping the previous page
+        - Malformed cursor returns 400 Bad Request
+        """
+        for i in range(3):
+            asset = Asset(
+                asset_name=f"Test Asset Cursor {i}",
+                vendor=f"cur_vendor{i}",
+                product=f"cur_product{i}",
+                version=f"1.0.{i}",
+                cpe_code=f"cpe:2.3:a:cur_vendor{i}:cur_product{i}:1.0.{i}:*:*:*:*:*:*:*",
+                source="manual",
+            )
+            db_session.add(asset)
+            db_session.commit()
+            db_session.refresh(asset)
+            cleanup_test_assets.append(asset.asset_id)
+
+        first = client.get("/api/assets?limit=2").json()
+        assert first["has_more"] is True
+        assert first["next_cursor"]
+
+        response = client.get("/api/assets", params={"limit": 2, "cursor": first["next_cursor"]})
+
+        assert response.status_code == 200
+        second = response.json()
+        first_ids = {item["asset_id"] for item in first["items"]}
+        assert all(item["asset_id"] not in first_ids for item in second["items"])
+
+        response = client.get("/api/assets?cursor=invalid")
+        assert response.status_code == 400
+
     def test_list_assets_filter_by_source(self, client, db_session, cleanup_test_assets):
         """
         Test M4.4: List assets filtered by source.
@@ -8,9 +8,12 @@ Test coverage:
 - POST /api/matching/execute - Execute matching for all assets and vulnerabilities
 - GET /api/matching/results - Retrieve matching results with pagination
 - GET /api/matching/assets/{asset_id}/vulnerabilities - Get vulnerabilities for specific asset
+- GET /api/matching/assets/{asset_id}/vulnerabilities/stream - Stream vulnerabilities as NDJSON
 - GET /api/matching/dashboard - Get dashboard statistics
 """
 
+import json
+
 import pytest
 from datetime import datetime, timezone
 from fastapi.testclient import TestClient
@@ -353,6 +356,30 @@ class TestMatchingResultsList:
         assert data["limit"] == 2
         assert len(data["items"]) <= 2
 
+    def test_get_matching_results_with_cursor(self, client, test_assets, test_vulnerabilities):
+        """
+        Test M5.4: Get matching results with keyset cursor pagination.
+
+        Verifies:
+        - The cursor page continues without overlapping the previous page
+        - Malformed cursor returns 400 Bad Request
+        """
+        # Execute matching first
+        client.post("/api/matching/execute")
+
+        first = client.get("/api/matching/results?limit=1").json()
+
+        if first["has_more"]:
+            response = client.get("/api/matching/results", params={"limit": 1, "cursor": first["next_cursor"]})
+
+            assert response.status_code == 200
+            second = response.json()
+            first_ids = {item["match_id"] for item in first["items"]}
+            assert all(item["match_id"] not in first_ids for item in second["items"])
+
+        response = client.get("/api/matching/results?cursor=invalid")
+        assert response.status_code == 400
+
     def test_get_matching_results_filter_by_severity(self, client, test_assets, test_vulnerabilities):
         """
         Test M5.5: Get matching results filtered by severity.
@@ -529,6 +556,31 @@ class TestAssetVulnerabilities:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    def test_stream_asset_vulnerabilities(self, client, test_assets, test_vulnerabilities):
+        """
+        Test M5.8: Stream vulnerabilities for an asset as NDJSON.
+
+        Verifies:
+        - Returns 200 OK with application/x-ndjson
+        - Streamed rows match the non-streaming list
+        - Non-existent asset returns 404 Not Found
+        """
+        # Execute matching first
+        client.post("/api/matching/execute")
+
+        asset_id = test_assets[0]
+        response = client.get(f"/api/matching/assets/{asset_id}/vulnerabilities/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        streamed = [json.loads(line) for line in response.text.splitlines()]
+
+        listed = client.get(f"/api/matching/assets/{asset_id}/vulnerabilities").json()
+        assert [v["cve_id"] for v in streamed] == [v["cve_id"] for v in listed["vulnerabilities"]]
+
+        response = client.get("/api/matching/assets/550e8400-e29b-41d4-a716-446655440000/vulnerabilities/stream")
+        assert response.status_code == 404
+
 
 class TestMatchingDashboard:
     """Tests for dashboard statistics endpoint (GET /api/matching/dashboard)."""
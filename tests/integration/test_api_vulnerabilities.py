@@ -168,6 +168,50 @@ class TestVulnerabilityAPI:
         assert data['page_size'] == 2
         assert len(data['items']) <= 2
 
+    def test_list_vulnerabilities_sorted_page_numbers(self, client, test_vulnerabilities):
+        """
+        Test M3.1: GET /api/vulnerabilities page-number navigation with an explicit sort.
+
+        Verifies:
+        - Sorted page-number requests succeed (sorting is applied before OFFSET)
+        - Consecutive pages continue the sort order without overlapping
+        """
+        params = {'sort_by': 'published_date', 'sort_order': 'desc', 'page_size': 2}
+        first = client.get('/api/vulnerabilities', params={**params, 'page': 1})
+        second = client.get('/api/vulnerabilities', params={**params, 'page': 2})
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        first_items = first.json()['items']
+        second_items = second.json()['items']
+        assert len(first_items) == 2
+        assert {item['cve_id'] for item in first_items}.isdisjoint(item['cve_id'] for item in second_items)
+        if second_items:
+            assert first_items[-1]['published_date'] >= second_items[0]['published_date']
+
+    def test_list_vulnerabilities_with_cursor(self, client, test_vulnerabilities):
+        """
+        Test M3.1: GET /api/vulnerabilities with keyset cursor pagination.
+
+        Verifies:
+        - next_cursor is returned while more pages follow
+        - The cursor page continues without overlapping the previous page
+        - Cursor with a non-date sort returns 400 Bad Request
+        """
+        first = client.get('/api/vulnerabilities?limit=2').json()
+        assert first['has_more'] is True
+        assert first['next_cursor']
+
+        response = client.get('/api/vulnerabilities', params={'limit': 2, 'cursor': first['next_cursor']})
+
+        assert response.status_code == 200
+        second = response.json()
+        first_ids = {item['cve_id'] for item in first['items']}
+        assert all(item['cve_id'] not in first_ids for item in second['items'])
+
+        response = client.get('/api/vulnerabilities', params={'sort_by': 'severity', 'cursor': first['next_cursor']})
+        assert response.status_code == 400
+
     def test_list_vulnerabilities_with_sort(self, client, test_vulnerabilities):
         """
         Test M3.1: GET /api/vulnerabilities with sorting.
@@ -290,6 +334,18 @@ class TestVulnerabilityAPI:
         assert response.status_code == 404
         assert 'not found' in response.json()['detail'].lower()
 
+    def test_get_vulnerability_detail_invalid_cve_id(self, client):
+        """
+        Test GET /api/vulnerabilities/{cve_id} with a malformed CVE ID.
+
+        Verifies:
+        - Returns 400 Bad Request
+        - Error message mentions the CVE ID format
+        """
+        response = client.get('/api/vulnerabilities/not-a-cve')
+        assert response.status_code == 400
+        assert 'Invalid CVE ID format' in response.json()['detail']
+
     def test_database_error_handling(self, client, db_session):
         """
         Test M3.3: Database error handling.
@@ -385,3 +441,15 @@ class TestVulnerabilityAPIEdgeCases:
             # Database should still be intact
             check_response = client.get('/api/vulnerabilities')
             assert check_response.status_code == 200
+
+    def test_fetch_status_unknown_job(self, client):
+        """
+        Test fetch-status for a job ID that was never started.
+
+        Verifies:
+        - 404 Not Found is returned
+        """
+        response = client.get('/api/fetch-status/unknown-job-id')
+
+        assert response.status_code == 404
+        assert 'Fetch job not found' in response.json()['detail']
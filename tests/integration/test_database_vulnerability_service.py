@@ -396,6 +396,91 @@ class TestDatabaseVulnerabilityService:
         assert stats_update['updated'] == 5
         assert stats_update['failed'] == 0
 
+    def test_upsert_vulnerabilities_batch_bulk_keeps_last_duplicate(
+        self, service, db_session, cleanup_test_data
+    ):
+        """
+        Test bulk (COPY) mode with a CVE ID repeated in one batch.
+
+        Verifies:
+        - The duplicate is written once
+        - The last occurrence wins, as in upsert mode
+        """
+        import random
+        cve_id = f'CVE-2024-{random.randint(20000, 29999)}'
+        batch_data = [
+            VulnerabilityCreate(
+                cve_id=cve_id,
+                title=f'Bulk Duplicate Test {idx}',
+                description=f'Test vulnerability for bulk COPY {idx}',
+                severity='Medium',
+                published_date=datetime.now(timezone.utc),
+                modified_date=datetime.now(timezone.utc),
+            )
+            for idx in range(3)
+        ]
+
+        stats = service.upsert_vulnerabilities_batch(batch_data, mode='bulk')
+
+        assert stats == {'inserted': 1, 'updated': 0, 'failed': 0}
+        stored = db_session.query(Vulnerability).filter(Vulnerability.cve_id == cve_id).one()
+        assert stored.title == 'Bulk Duplicate Test 2'
+
+    def test_upsert_vulnerabilities_batch_bulk_round_trip(
+        self, service, db_session, cleanup_test_data
+    ):
+        """
+        Test bulk (COPY) mode insert, update and skip of existing rows.
+
+        Verifies:
+        - Statistics match upsert mode (inserted, then updated)
+        - Text and JSON values with COPY special characters are stored unchanged
+        - on_conflict="do_nothing" leaves existing rows untouched
+        """
+        import random
+        base_id = random.randint(30000, 39999)
+        batch_data = [
+            VulnerabilityCreate(
+                cve_id=f'CVE-2024-{base_id + idx}',
+                title=f'Bulk Test {idx}\t"quoted"',
+                description=f'Line 1\nLine 2 \\N C:\\path\r {idx}',
+                cvss_score=7.5,
+                severity='High',
+                published_date=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+                modified_date=datetime(2024, 1, 20, 10, 0, tzinfo=timezone.utc),
+                affected_products={'products': ['製品 A', 'tab\there']},
+                references={'nvd': f'https://nvd.nist.gov/vuln/detail/CVE-2024-{base_id + idx}'},
+            )
+            for idx in range(3)
+        ]
+
+        stats = service.upsert_vulnerabilities_batch(batch_data, mode='bulk')
+        assert stats == {'inserted': 3, 'updated': 0, 'failed': 0}
+
+        stored = db_session.query(Vulnerability).filter(Vulnerability.cve_id == batch_data[0].cve_id).one()
+        assert stored.title == batch_data[0].title
+        assert stored.description == batch_data[0].description
+        assert stored.affected_products == batch_data[0].affected_products
+        assert stored.vendor_info is None
+        assert stored.published_date == batch_data[0].published_date
+
+        updated_data = [v.model_copy(update={'severity': 'Critical'}) for v in batch_data]
+        stats_update = service.upsert_vulnerabilities_batch(updated_data, mode='bulk')
+        assert stats_update == {'inserted': 0, 'updated': 3, 'failed': 0}
+
+        skipped_data = [v.model_copy(update={'severity': 'Low'}) for v in batch_data]
+        stats_skip = service.upsert_vulnerabilities_batch(skipped_data, on_conflict='do_nothing', mode='bulk')
+        assert stats_skip == {'inserted': 0, 'updated': 0, 'failed': 0}
+
+        db_session.expire_all()
+        severities = {
+            v.severity
+            for v in db_session.query(Vulnerability).filter(
+                Vulnerability.cve_id.in_([v.cve_id for v in batch_data])
+            )
+        }
+        assert severities == {'Critical'}
+
     def test_delete_vulnerability(self, service, sample_vulnerability_data, cleanup_test_data):
         """
         Test M2.6: Delete vulnerability.
@@ -427,7 +512,7 @@ class TestDatabaseVulnerabilityService:
         Test differential fetch support: Get latest modified_date.
 
         Verifies:
-        - Returns latest modified_date in ISO 8601 format
+        - Returns latest modified_date as a datetime
         - Returns None when no records exist
         """
         # Insert vulnerability with specific modified_date
@@ -448,9 +533,8 @@ class TestDatabaseVulnerabilityService:
         # Verify latest date is returned (not None)
         # Note: The date may be newer than our test data due to other records
         assert latest_date is not None
-        assert isinstance(latest_date, str)
-        # Just verify it's a valid ISO 8601 format date
-        datetime.fromisoformat(latest_date.replace('Z', '+00:00'))
+        assert isinstance(latest_date, datetime)
+        assert latest_date >= datetime(2024, 12, 31, tzinfo=timezone.utc)
 
     def test_transaction_rollback_on_error(self, service, db_session, cleanup_test_data):
         """
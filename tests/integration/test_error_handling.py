@@ -17,6 +17,7 @@ from sqlalchemy.exc import SQLAlchemyError, OperationalError
 from src.main import app
 from src.database import engine
 from src.models.vulnerability import Base
+from src.utils.response_cache import invalidate_vulnerability_caches
 
 
 @pytest.fixture(scope='module')
@@ -32,6 +33,13 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Ensure patched service errors are not hidden by responses cached in earlier tests."""
+    invalidate_vulnerability_caches()
+    yield
+
+
 class TestHealthCheckErrorCases:
     """
     Error handling tests for /api/health endpoint.
@@ -0,0 +1,168 @@
+"""
+Unit tests for JVN iPedia page prefetching and rate limiting.
+
+Tests JVNFetcherService.iter_vulnerabilities / _prefetch_pages with a mocked _fetch_page:
+- Pages yielded in request order even when later pages finish first
+- Stop at max_items without requesting further pages
+- Prefetched pages cancelled and awaited when the consumer stops early
+- Failure of a prefetched page raised to the consumer
+
+Tests the request slot reservation of _apply_rate_limit:
+- Concurrent requests spaced by rate_limit_delay
+- No burst after an idle period
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.fetchers.jvn_fetcher import JVNAPIError, JVNFetcherService
+from src.schemas.vulnerability import VulnerabilityCreate
+
+ITEMS_PER_PAGE = 50  # Page size requested by iter_vulnerabilities
+TOTAL_ITEMS = 180
+
+
+def jvn_page(start_item: int, max_count: int, total_items: int = TOTAL_ITEMS) -> list[VulnerabilityCreate]:
+    """Build the parsed page of at most max_count items starting at start_item (1-indexed)."""
+    return [
+        VulnerabilityCreate(
+            cve_id=f"CVE-2024-{item:04d}",
+            title=f"Test Vulnerability {item}",
+            description=f"Test vulnerability {item}",
+            published_date=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            modified_date=datetime(2024, 1, 20, tzinfo=timezone.utc),
+        )
+        for item in range(start_item, min(start_item + max_count, total_items + 1))
+    ]
+
+
+@pytest.fixture
+def service():
+    """Provide a JVNFetcherService with two pages in flight that never touches the network."""
+    service = JVNFetcherService()
+    service.max_concurrent_requests = 2
+    return service
+
+
+class TestIterVulnerabilities:
+    """Test concurrent page prefetching in iter_vulnerabilities."""
+
+    @pytest.mark.asyncio
+    async def test_pages_yielded_in_order(self, service, monkeypatch):
+        """Test pages keep their order when later pages finish first."""
+
+        async def fake_fetch_page(start_date, end_date, start_item, max_count, use_modified_date=False):
+            # Later pages respond faster
+            await asyncio.sleep(0.001 * (TOTAL_ITEMS - start_item) / ITEMS_PER_PAGE)
+            return jvn_page(start_item, max_count)
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = [page async for page in service.iter_vulnerabilities()]
+
+        assert [len(page) for page in pages] == [50, 50, 50, 30]
+        cve_ids = [v.cve_id for page in pages for v in page]
+        assert cve_ids == [f"CVE-2024-{item:04d}" for item in range(1, TOTAL_ITEMS + 1)]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_items(self, service, monkeypatch):
+        """Test the last page is requested short and no page beyond max_items is requested."""
+        requested = []
+
+        async def fake_fetch_page(start_date, end_date, start_item, max_count, use_modified_date=False):
+            requested.append((start_item, max_count))
+            return jvn_page(start_item, max_count)
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = [page async for page in service.iter_vulnerabilities(max_items=120)]
+
+        assert [len(page) for page in pages] == [50, 50, 20]
+        assert requested == [(1, 50), (51, 50), (101, 20)]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetched_pages(self, service, monkeypatch):
+        """Test closing the iterator cancels the pending pages and waits for them."""
+        cancelled = []
+
+        async def fake_fetch_page(start_date, end_date, start_item, max_count, use_modified_date=False):
+            if start_item == 1:
+                return jvn_page(start_item, max_count)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(start_item)
+                raise
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = service.iter_vulnerabilities()
+        first_page = await pages.__anext__()
+        await asyncio.sleep(0)  # Let the prefetch tasks start
+        await pages.aclose()
+
+        assert len(first_page) == ITEMS_PER_PAGE
+        assert sorted(cancelled) == [51, 101]
+
+    @pytest.mark.asyncio
+    async def test_prefetched_page_failure_is_raised(self, service, monkeypatch):
+        """Test an error from a prefetched page reaches the consumer and stops the rest."""
+        cancelled = []
+
+        async def fake_fetch_page(start_date, end_date, start_item, max_count, use_modified_date=False):
+            if start_item == 1:
+                return jvn_page(start_item, max_count)
+            if start_item == 51:
+                raise JVNAPIError("API request failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(start_item)
+                raise
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = []
+        with pytest.raises(JVNAPIError):
+            async for page in service.iter_vulnerabilities():
+                pages.append(page)
+
+        assert len(pages) == 1
+        assert cancelled == [101]
+
+
+class TestApplyRateLimit:
+    """Test request slot reservation (leaky bucket) in _apply_rate_limit."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Freeze monotonic time and record sleeps instead of sleeping."""
+        clock = {"now": 1000.0, "sleeps": []}
+
+        async def fake_sleep(delay):
+            clock["sleeps"].append(round(delay, 6))
+
+        monkeypatch.setattr("src.fetchers.jvn_fetcher.time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("src.fetchers.jvn_fetcher.asyncio.sleep", fake_sleep)
+        return clock
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_reserve_consecutive_slots(self, service, clock):
+        """Test requests started together wait for consecutive slots."""
+        await asyncio.gather(*(service._apply_rate_limit() for _ in range(3)))
+
+        assert clock["sleeps"] == [0.4, 0.8]
+        assert service._next_request_time == pytest.approx(1001.2)
+
+    @pytest.mark.asyncio
+    async def test_idle_period_allows_no_burst(self, service, clock):
+        """Test only one request starts immediately after an idle period."""
+        await service._apply_rate_limit()
+        clock["now"] += 10
+
+        await service._apply_rate_limit()
+        await service._apply_rate_limit()
+
+        assert clock["sleeps"] == [0.4]
@@ -0,0 +1,130 @@
+"""
+Unit tests for NVD page prefetching.
+
+Tests NVDFetcherService.iter_vulnerabilities with a mocked _fetch_page:
+- Pages yielded in request order even when later pages finish first
+- Stop at max_items without requesting further pages
+- Prefetched pages cancelled and awaited when the consumer stops early
+- Failure of a prefetched page raised to the consumer
+"""
+
+import asyncio
+
+import pytest
+
+from src.fetchers.nvd_fetcher import NVDAPIError, NVDFetcherService
+
+RESULTS_PER_PAGE = 2000  # Page size requested by iter_vulnerabilities
+TOTAL_RESULTS = 5000
+
+
+def nvd_page(start_index: int, total_results: int = TOTAL_RESULTS) -> dict:
+    """Build an NVD API 2.0 response page starting at start_index."""
+    end_index = min(start_index + RESULTS_PER_PAGE, total_results)
+    return {
+        "totalResults": total_results,
+        "vulnerabilities": [
+            {
+                "cve": {
+                    "id": f"CVE-2024-{index:05d}",
+                    "descriptions": [{"lang": "en", "value": f"Test vulnerability {index}"}],
+                    "published": "2024-01-15T10:00:00.000",
+                    "lastModified": "2024-01-20T10:00:00.000",
+                }
+            }
+            for index in range(start_index, end_index)
+        ],
+    }
+
+
+@pytest.fixture
+def service():
+    """Provide an NVDFetcherService that never touches the network."""
+    return NVDFetcherService(api_key="test-key")
+
+
+class TestIterVulnerabilities:
+    """Test concurrent page prefetching in iter_vulnerabilities."""
+
+    @pytest.mark.asyncio
+    async def test_pages_yielded_in_order(self, service, monkeypatch):
+        """Test pages keep their order when later pages finish first."""
+
+        async def fake_fetch_page(start_date, end_date, start_index, results_per_page):
+            # Later pages respond faster
+            await asyncio.sleep(0.01 * (TOTAL_RESULTS - start_index) / RESULTS_PER_PAGE)
+            return nvd_page(start_index)
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = [page async for page in service.iter_vulnerabilities()]
+
+        assert [len(page) for page in pages] == [2000, 2000, 1000]
+        cve_ids = [v.cve_id for page in pages for v in page]
+        assert cve_ids == [f"CVE-2024-{index:05d}" for index in range(TOTAL_RESULTS)]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_items(self, service, monkeypatch):
+        """Test the last page is truncated and no page beyond max_items is requested."""
+        requested = []
+
+        async def fake_fetch_page(start_date, end_date, start_index, results_per_page):
+            requested.append(start_index)
+            return nvd_page(start_index)
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = [page async for page in service.iter_vulnerabilities(max_items=2500)]
+
+        assert [len(page) for page in pages] == [2000, 500]
+        assert requested == [0, 2000]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetched_pages(self, service, monkeypatch):
+        """Test closing the iterator cancels the pending pages and waits for them."""
+        cancelled = []
+
+        async def fake_fetch_page(start_date, end_date, start_index, results_per_page):
+            if start_index == 0:
+                return nvd_page(start_index)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(start_index)
+                raise
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = service.iter_vulnerabilities()
+        first_page = await pages.__anext__()
+        await asyncio.sleep(0)  # Let the prefetch tasks start
+        await pages.aclose()
+
+        assert len(first_page) == 2000
+        assert sorted(cancelled) == [2000, 4000]
+
+    @pytest.mark.asyncio
+    async def test_prefetched_page_failure_is_raised(self, service, monkeypatch):
+        """Test an error from a prefetched page reaches the consumer and stops the rest."""
+        cancelled = []
+
+        async def fake_fetch_page(start_date, end_date, start_index, results_per_page):
+            if start_index == 0:
+                return nvd_page(start_index)
+            if start_index == 2000:
+                raise NVDAPIError("API request failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(start_index)
+                raise
+
+        monkeypatch.setattr(service, "_fetch_page", fake_fetch_page)
+
+        pages = []
+        with pytest.raises(NVDAPIError):
+            async for page in service.iter_vulnerabilities():
+                pages.append(page)
+
+        assert len(pages) == 1
+        assert cancelled == [4000]
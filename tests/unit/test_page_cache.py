@@ -0,0 +1,65 @@
+"""
+Unit tests for the on-disk conditional page cache.
+
+Tests PageCache behavior:
+- Round trip of validators and records
+- Key independent of parameter order
+- Expiry after TTL
+- Unreadable entries treated as misses
+- Conditional request headers
+"""
+
+from src.utils.page_cache import CachedPage, PageCache
+
+PARAMS = {"method": "getVulnOverviewList", "startItem": "1", "maxCountItem": "50"}
+RECORDS = [{"cve_id": "CVE-2024-0001", "published_date": "2024-01-15T10:00:00"}]
+
+
+class TestPageCache:
+    """Test PageCache get/set semantics."""
+
+    def test_get_returns_stored_page(self, tmp_path):
+        """Test a stored page is returned with its validators and records."""
+        cache = PageCache(str(tmp_path), ttl=60)
+        cache.set(PARAMS, '"v1"', "Mon, 15 Jan 2024 01:00:00 GMT", RECORDS)
+
+        page = cache.get(PARAMS)
+
+        assert page == CachedPage('"v1"', "Mon, 15 Jan 2024 01:00:00 GMT", RECORDS)
+
+    def test_key_ignores_parameter_order(self, tmp_path):
+        """Test the same parameters in a different order hit the same entry."""
+        cache = PageCache(str(tmp_path), ttl=60)
+        cache.set(PARAMS, '"v1"', None, RECORDS)
+
+        assert cache.get(dict(reversed(list(PARAMS.items())))) is not None
+        assert cache.get({**PARAMS, "startItem": "51"}) is None
+
+    def test_expired_entry_returns_none(self, tmp_path, monkeypatch):
+        """Test an entry is ignored once its TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr("src.utils.page_cache.time.time", lambda: now[0])
+        cache = PageCache(str(tmp_path), ttl=10)
+        cache.set(PARAMS, '"v1"', None, RECORDS)
+
+        now[0] += 10
+        assert cache.get(PARAMS) is not None
+
+        now[0] += 1
+        assert cache.get(PARAMS) is None
+
+    def test_corrupt_entry_returns_none(self, tmp_path):
+        """Test an unreadable entry is treated as a miss."""
+        cache = PageCache(str(tmp_path), ttl=60)
+        cache.set(PARAMS, '"v1"', None, RECORDS)
+        with open(cache._path(PARAMS), "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        assert cache.get(PARAMS) is None
+
+    def test_conditional_headers(self):
+        """Test only the validators the server sent are revalidated."""
+        assert CachedPage('"v1"', None, []).conditional_headers == {"If-None-Match": '"v1"'}
+        assert CachedPage(None, "Mon, 15 Jan 2024 01:00:00 GMT", []).conditional_headers == {
+            "If-Modified-Since": "Mon, 15 Jan 2024 01:00:00 GMT"
+        }
@@ -0,0 +1,78 @@
+"""
+Unit tests for the in-process response cache.
+
+Tests TTLCache behavior:
+- Hit and miss
+- Expiry after TTL
+- LRU eviction at maxsize
+- Clear
+- Invalidation of the vulnerability caches
+"""
+
+from src.utils.response_cache import (
+    TTLCache,
+    invalidate_vulnerability_caches,
+    vulnerability_detail_cache,
+    vulnerability_missing_cache,
+)
+
+
+class TestTTLCache:
+    """Test TTLCache get/set semantics."""
+
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned before it expires."""
+        cache = TTLCache(ttl=60)
+        cache.set(("summary", "etag"), {"critical": 1})
+        assert cache.get(("summary", "etag")) == {"critical": 1}
+
+    def test_get_missing_key_returns_none(self):
+        """Test a missing key returns None."""
+        cache = TTLCache(ttl=60)
+        assert cache.get("missing") is None
+
+    def test_expired_entry_returns_none(self, monkeypatch):
+        """Test an entry is dropped once its TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr("src.utils.response_cache.time.monotonic", lambda: now[0])
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+
+        now[0] += 9
+        assert cache.get("key") == "value"
+
+        now[0] += 1
+        assert cache.get("key") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the least recently used entry is evicted when maxsize is exceeded."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear_drops_all_entries(self):
+        """Test clear removes every entry."""
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
+
+
+class TestInvalidateVulnerabilityCaches:
+    """Test invalidation after vulnerabilities are written."""
+
+    def test_invalidate_drops_details_and_known_misses(self):
+        """Test a newly written CVE is no longer answered from the negative cache."""
+        vulnerability_detail_cache.set("CVE-2024-0001", object())
+        vulnerability_missing_cache.set("CVE-2024-0002", True)
+
+        invalidate_vulnerability_caches()
+
+        assert vulnerability_detail_cache.get("CVE-2024-0001") is None
+        assert vulnerability_missing_cache.get("CVE-2024-0002") is None
@@ -0,0 +1,63 @@
+"""
+Unit tests for the bulk COPY text encoding.
+
+Tests _copy_text_value behavior:
+- NULL marker
+- Escaping of backslash, tab, newline and carriage return
+- JSON serialization (non-ASCII kept as is)
+- Datetime formatting
+
+Tests the COPY column set (COPY_COLUMNS / JSON_COLUMNS).
+"""
+
+from datetime import datetime, timezone
+
+from src.models.vulnerability import Vulnerability
+from src.services.vulnerability_bulk_copy import COPY_COLUMNS, JSON_COLUMNS, _copy_text_value
+
+
+class TestCopyTextValue:
+    """Test formatting of values for PostgreSQL COPY text format."""
+
+    def test_none_is_null_marker(self):
+        """Test None becomes the \\N NULL marker, also for JSON columns."""
+        assert _copy_text_value(None) == "\\N"
+        assert _copy_text_value(None, is_json=True) == "\\N"
+
+    def test_special_characters_are_escaped(self):
+        """Test characters with a meaning in COPY text format are backslash-escaped."""
+        assert _copy_text_value("a\\b\tc\nd\re") == "a\\\\b\\tc\\nd\\re"
+
+    def test_literal_null_marker_text_is_escaped(self):
+        """Test the text \\N is not read back as NULL."""
+        assert _copy_text_value("\\N") == "\\\\N"
+
+    def test_json_value_is_serialized(self):
+        """Test JSON columns are serialized with non-ASCII characters kept and escapes applied."""
+        value = {"products": ["製品 A"], "note": "line1\nline2"}
+
+        assert _copy_text_value(value, is_json=True) == '{"products": ["製品 A"], "note": "line1\\\\nline2"}'
+
+    def test_datetime_is_iso_formatted(self):
+        """Test datetimes keep their UTC offset."""
+        value = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+
+        assert _copy_text_value(value) == "2024-01-15T10:00:00+00:00"
+
+    def test_numbers_are_plain_text(self):
+        """Test numbers are written as their string form."""
+        assert _copy_text_value(9.8) == "9.8"
+
+
+class TestCopyColumns:
+    """Test the columns written by COPY."""
+
+    def test_copy_columns_exist_in_table(self):
+        """Test every COPY column, including the conflict key, is a vulnerabilities column."""
+        assert "cve_id" in COPY_COLUMNS
+        assert set(COPY_COLUMNS) <= set(Vulnerability.__table__.columns.keys())
+
+    def test_json_columns_are_copied(self):
+        """Test every JSON column is among the COPY columns."""
+        assert JSON_COLUMNS == {"affected_products", "vendor_info", "references"}
+        assert JSON_COLUMNS <= set(COPY_COLUMNS)